@@ -0,0 +1,179 @@
+"""
+동기 세션 vs 비동기 세션 동시 처리량 비교.
+
+- before: 예전 방식 그대로 `async def` 핸들러 안에서 동기 Session 으로 쿼리 (이벤트 루프 블로킹)
+- after : router.report_router (AsyncSession + aiosqlite)
+
+DB 왕복 지연을 흉내 내기 위해 SQLite 커서의 execute 마다 --latency-ms 만큼 sleep 한다.
+sleep 은 드라이버 스레드에서 일어나므로, 이벤트 루프를 막는지 여부가 그대로 처리량 차이로 나타난다.
+
+    python -m benchmarks.async_db_bench --requests 400 --concurrency 20 --latency-ms 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+from typing import Callable, Optional
+
+import httpx
+from fastapi import Depends, FastAPI, Query
+from sqlalchemy import create_engine, desc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, joinedload, sessionmaker
+
+from benchmarks.fixtures import REGIONS, CRIME_TYPES, seed_dimensions
+from benchmarks.sqlite import create_sqlite_engine
+from core.database import get_async_db
+from models.report import Report, ReportStatus
+from router import report_router
+from schemas.report import ReportRead
+
+LATENCY_SECONDS = 0.0
+
+
+class SlowCursor(sqlite3.Cursor):
+    def execute(self, *args, **kwargs):
+        if LATENCY_SECONDS:
+            time.sleep(LATENCY_SECONDS)
+        return super().execute(*args, **kwargs)
+
+
+class SlowConnection(sqlite3.Connection):
+    def cursor(self, factory=SlowCursor):
+        return super().cursor(factory)
+
+
+def seed(path: str, reports: int) -> None:
+    _, Session_ = create_sqlite_engine(path)
+    db = Session_()
+    seed_dimensions(db)
+    db.bulk_insert_mappings(Report, [
+        {
+            "user_id": 1,
+            "region_id": i % len(REGIONS) + 1,
+            "crime_type_id": i % len(CRIME_TYPES) + 1,
+            "title": f"제보 {i}",
+            "content": "벤치마크용 제보 본문입니다. " * 5,
+            "status": ReportStatus.pending,
+        }
+        for i in range(reports)
+    ])
+    db.commit()
+    db.close()
+
+
+def build_before_app(path: str, pool_size: int) -> tuple[FastAPI, Callable]:
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False, "factory": SlowConnection},
+        pool_size=pool_size,
+    )
+    SyncSession = sessionmaker(bind=engine, autoflush=False)
+
+    def get_sync_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+
+    @app.get("/api/reports", response_model=list[ReportRead])
+    async def get_reports(
+            region_id: Optional[int] = Query(None),
+            skip: int = 0,
+            limit: int = 10,
+            db: Session = Depends(get_sync_db),
+    ):
+        query = db.query(Report).options(joinedload(Report.region), joinedload(Report.crime_type))
+        if region_id:
+            query = query.filter(Report.region_id == region_id)
+        return query.order_by(desc(Report.created_at)).offset(skip).limit(limit).all()
+
+    async def dispose():
+        engine.dispose()
+
+    return app, dispose
+
+
+def build_after_app(path: str, pool_size: int) -> tuple[FastAPI, Callable]:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}",
+        connect_args={"factory": SlowConnection},
+        pool_size=pool_size,
+    )
+    AsyncSession_ = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+    async def get_bench_db():
+        async with AsyncSession_() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(report_router.router)
+    app.dependency_overrides[get_async_db] = get_bench_db
+    # aiosqlite 커넥션 스레드가 남아 있으면 프로세스가 끝나지 않으므로 반드시 dispose
+    return app, engine.dispose
+
+
+async def drive(built: tuple[FastAPI, Callable], requests: int, concurrency: int) -> dict:
+    app, dispose = built
+    latencies: list[float] = []
+    sem = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(i: int):
+            async with sem:
+                started = time.perf_counter()
+                r = await client.get("/api/reports", params={"region_id": i % len(REGIONS) + 1, "limit": 10})
+                latencies.append(time.perf_counter() - started)
+                r.raise_for_status()
+
+        await one(0)  # 워밍업 (커넥션/매퍼 초기화)
+        latencies.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+    await dispose()
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+    }
+
+
+def main():
+    global LATENCY_SECONDS
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--reports", type=int, default=5000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "async_bench.db")
+    seed(path, args.reports)
+    LATENCY_SECONDS = args.latency_ms / 1000
+
+    before = asyncio.run(drive(build_before_app(path, args.concurrency), args.requests, args.concurrency))
+    after = asyncio.run(drive(build_after_app(path, args.concurrency), args.requests, args.concurrency))
+    print(json.dumps({
+        "latency_ms_per_query": args.latency_ms,
+        "concurrency": args.concurrency,
+        "before_sync_session": before,
+        "after_async_session": after,
+        "speedup": round(after["throughput_rps"] / before["throughput_rps"], 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+AI 분류 백그라운드 큐 오프라인 부하 테스트.
+
+가짜 LLM(FakeLLMBackend)과 임시 SQLite DB 로 큐를 돌려 처리량, 재시도,
+dead-letter 건수를 확인한다.
+
+    python -m benchmarks.classification_queue_load --reports 2000 --workers 8 --latency-ms 50 --failure-rate 0.1
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from sqlalchemy import func
+
+from benchmarks.fixtures import CRIME_TYPES, REGIONS, seed_dimensions
+from benchmarks.sqlite import create_sqlite_engine
+from models.report import Report, ReportStatus, ClassificationStatus
+from services.ai_crime_classifier import FakeLLMBackend
+from services.classification_queue import ClassificationQueue
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reports", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--retry-backoff", type=float, default=0.01)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "classification_load.db")
+    _, Session = create_sqlite_engine(path)
+
+    db = Session()
+    seed_dimensions(db)
+    db.bulk_insert_mappings(Report, [
+        {
+            "user_id": 1,
+            "region_id": i % len(REGIONS) + 1,
+            "crime_type_id": 1,
+            "title": f"제보 {i}",
+            "content": f"어제 밤 {CRIME_TYPES[i % len(CRIME_TYPES)][1]} 피해를 당했습니다.",
+            "status": ReportStatus.pending,
+            "classification_status": ClassificationStatus.queued,
+        }
+        for i in range(args.reports)
+    ])
+    db.commit()
+    db.close()
+
+    backend = FakeLLMBackend(latency_ms=args.latency_ms, failure_rate=args.failure_rate)
+    q = ClassificationQueue(
+        session_factory=Session,
+        backend_factory=lambda: backend,
+        workers=args.workers,
+        maxsize=args.reports,
+        max_attempts=args.max_attempts,
+        retry_backoff=args.retry_backoff,
+    )
+    q.start()
+    started = time.perf_counter()
+    submitted = q.recover()
+    q.join()
+    elapsed = time.perf_counter() - started
+    q.stop()
+
+    db = Session()
+    by_status = dict(
+        db.query(Report.classification_status, func.count())
+        .group_by(Report.classification_status).all()
+    )
+    db.close()
+
+    print(json.dumps({
+        "submitted": submitted,
+        "elapsed_seconds": round(elapsed, 3),
+        "jobs_per_second": round(submitted / elapsed, 1) if elapsed else None,
+        "queue": q.stats(),
+        "db_status": {k.value if k else None: v for k, v in by_status.items()},
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
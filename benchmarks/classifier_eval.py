@@ -0,0 +1,84 @@
+"""
+로컬 범죄유형 분류기 오프라인 평가.
+
+라벨이 붙은 샘플(jsonl: content, major, minor)에 대해 임계값별로
+- 로컬 단계가 답한 비율 (= LLM 호출 절감률)
+- 로컬 단계가 답한 건의 정확도
+- 로컬 단계가 답한 건 중 틀린 건수
+를 출력한다. DB 없이 benchmarks.fixtures.CRIME_TYPES 를 어휘로 사용한다.
+
+    python -m benchmarks.classifier_eval
+    python -m benchmarks.classifier_eval --sample my_labels.jsonl --thresholds 0.5 0.6 0.7 --show-errors
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from benchmarks.fixtures import CRIME_TYPES
+from services.dimension_cache import CrimeTypeRow
+from services.local_crime_classifier import LocalCrimeClassifier
+
+DEFAULT_SAMPLE = Path(__file__).parent / "data" / "classifier_sample.jsonl"
+
+
+def load_sample(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def evaluate(classifier: LocalCrimeClassifier, sample: list[dict], label_ids: list[int], threshold: float) -> dict:
+    answered = correct = 0
+    errors = []
+    for row, label in zip(sample, label_ids):
+        crime_type_id, confidence = classifier.predict(row["content"])
+        if crime_type_id is None or confidence < threshold:
+            continue
+        answered += 1
+        if crime_type_id == label:
+            correct += 1
+        else:
+            errors.append((row["content"], label, crime_type_id, round(confidence, 3)))
+    return {
+        "threshold": threshold,
+        "answered": answered,
+        "llm_calls_avoided": round(answered / len(sample), 3),
+        "local_accuracy": round(correct / answered, 3) if answered else None,
+        "wrong": len(errors),
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sample", type=Path, default=DEFAULT_SAMPLE)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.4, 0.5, 0.6, 0.7, 0.8])
+    parser.add_argument("--show-errors", action="store_true")
+    args = parser.parse_args()
+
+    crime_types = [CrimeTypeRow(id=i, major=ma, minor=mi) for i, (ma, mi) in enumerate(CRIME_TYPES, start=1)]
+    ids = {(ct.major, ct.minor): ct.id for ct in crime_types}
+    classifier = LocalCrimeClassifier(crime_types)
+
+    sample = load_sample(args.sample)
+    label_ids = [ids[(row["major"], row["minor"])] for row in sample]
+    names = {ct.id: f"{ct.major}/{ct.minor}" for ct in crime_types}
+
+    started = time.perf_counter()
+    for row in sample:
+        classifier.predict(row["content"])
+    per_call_us = (time.perf_counter() - started) / len(sample) * 1e6
+
+    print(f"sample={len(sample)}  predict={per_call_us:.1f}us/건")
+    print(f"{'threshold':>9} {'answered':>8} {'LLM 절감':>8} {'정확도':>6} {'오답':>4}")
+    for threshold in args.thresholds:
+        r = evaluate(classifier, sample, label_ids, threshold)
+        acc = f"{r['local_accuracy']:.3f}" if r["local_accuracy"] is not None else "-"
+        print(f"{threshold:>9.2f} {r['answered']:>8} {r['llm_calls_avoided']:>8.3f} {acc:>6} {r['wrong']:>4}")
+        if args.show_errors:
+            for content, label, pred, conf in r["errors"]:
+                print(f"    정답={names[label]} 예측={names[pred]} conf={conf}  {content}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+동시 승인 정합성 테스트.
+
+같은 (지역, 범죄유형, 연도) 에 속한 pending 제보 N건을 만들고, 관리자 승인 API 를
+제보마다 --duplicates 번씩 동시에 호출한다. 끝난 뒤
+- report_stats.count == merged_stats.count == N (증가분 유실/중복 없음)
+- 승인 성공 응답 == N, 나머지는 모두 409
+인지 확인하고, 하나라도 어긋나면 종료 코드 1 로 끝난다.
+
+    python -m benchmarks.concurrent_approvals --reports 300 --duplicates 2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import func, select
+
+from benchmarks.fixtures import seed_dimensions
+from benchmarks.sqlite import create_async_sqlite_engine, create_sqlite_engine
+from core.database import get_async_db
+from models.officialstat import MergedStat, ReportStat
+from models.report import Report, ReportStatus
+from router import admin_router
+
+
+def seed(path: str, reports: int) -> list[int]:
+    _, Session_ = create_sqlite_engine(path)
+    db = Session_()
+    seed_dimensions(db)
+    db.add_all(
+        Report(user_id=1, region_id=1, crime_type_id=1, title=f"동시 승인 {i}", content="동시 승인 테스트")
+        for i in range(reports)
+    )
+    db.commit()
+    ids = [r.id for r in db.query(Report.id).order_by(Report.id)]
+    db.close()
+    return ids
+
+
+async def run(path: str, ids: list[int], duplicates: int) -> dict:
+    engine, AsyncSession_ = create_async_sqlite_engine(path)
+
+    async def get_bench_db():
+        async with AsyncSession_() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(admin_router.router)
+    app.dependency_overrides[get_async_db] = get_bench_db
+
+    # 서버 오류도 500 응답으로 집계한다
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            async def approve(report_id: int) -> int:
+                r = await client.post(f"/api/admin/reports/{report_id}/approve")
+                return r.status_code
+
+            started = time.perf_counter()
+            codes = await asyncio.gather(*(approve(i) for i in ids for _ in range(duplicates)))
+            elapsed = time.perf_counter() - started
+
+        async with AsyncSession_() as db:
+            stat_count = await db.scalar(select(func.coalesce(func.sum(ReportStat.count), 0)))
+            stat_rows = await db.scalar(select(func.count(ReportStat.id)))
+            merged_count = await db.scalar(select(func.coalesce(func.sum(MergedStat.count), 0)))
+            approved = await db.scalar(
+                select(func.count(Report.id)).where(Report.status == ReportStatus.approved)
+            )
+    finally:
+        await engine.dispose()
+
+    return {
+        "requests": len(codes),
+        "elapsed_seconds": round(elapsed, 3),
+        "status_codes": dict(Counter(codes)),
+        "approved_reports": approved,
+        "report_stats_rows": stat_rows,
+        "report_stats_count": stat_count,
+        "merged_stats_count": merged_count,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reports", type=int, default=300)
+    parser.add_argument("--duplicates", type=int, default=2, help="제보 하나당 동시에 보낼 승인 요청 수")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "approvals.db")
+    ids = seed(path, args.reports)
+    result = asyncio.run(run(path, ids, args.duplicates))
+    print(result)
+
+    expected = len(ids)
+    ok = (
+        result["report_stats_count"] == expected
+        and result["report_stats_rows"] == 1
+        and result["merged_stats_count"] == expected
+        and result["approved_reports"] == expected
+        and result["status_codes"].get(200, 0) == expected
+        and result["status_codes"].get(409, 0) == expected * (args.duplicates - 1)
+    )
+    print("OK" if ok else f"FAIL: 기대 count={expected}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
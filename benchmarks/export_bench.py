@@ -0,0 +1,83 @@
+"""
+제보 내보내기 메모리/처리량 벤치마크.
+
+benchmarks.synthetic 코퍼스(제보 --reports 건)에서 앞쪽 N 건씩을
+- stream: services.export_service.stream_export (평평한 컬럼 + 서버측 커서, NDJSON / CSV / gzip)
+- orm   : 기존 목록 API 방식 (Report ORM 전체 로드 -> ReportResponse 리스트 -> JSON)
+으로 만들어 tracemalloc 최대 메모리와 초당 행 수를 비교한다. stream 의 최대 메모리는 N 과 상관없이 일정해야 한다.
+
+    python -m benchmarks.export_bench --reports 1000000 --sizes 1000,100000,1000000
+"""
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+from sqlalchemy import select
+
+from benchmarks import synthetic
+from benchmarks.sqlite import create_async_sqlite_engine
+from models.report import Report
+from schemas.report import ReportResponse
+from services.export_service import reports_export_query, stream_export
+
+
+async def run_stream(AsyncSession_, size: int, fmt: str, gzip: bool) -> dict:
+    stmt = reports_export_query().where(Report.id <= size)
+    written = 0
+    tracemalloc.start()
+    started = time.perf_counter()
+    async with AsyncSession_() as db:
+        async for chunk in stream_export(db, stmt, fmt, gzip):
+            written += len(chunk)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"rows_per_second": round(size / elapsed), "peak_mib": round(peak / 2**20, 1), "mib": round(written / 2**20, 1)}
+
+
+async def run_orm(AsyncSession_, size: int) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    async with AsyncSession_() as db:
+        reports = (await db.scalars(select(Report).where(Report.id <= size).order_by(Report.id))).all()
+        body = json.dumps(
+            [ReportResponse.model_validate(r).model_dump(mode="json") for r in reports], ensure_ascii=False
+        ).encode()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"rows_per_second": round(size / elapsed), "peak_mib": round(peak / 2**20, 1), "mib": round(len(body) / 2**20, 1)}
+
+
+async def main_async(args) -> None:
+    path = synthetic.default_path(args.db)
+    manifest = synthetic.generate(path, args.reports, args.users, args.years, args.last_year, args.seed)
+    engine, AsyncSession_ = create_async_sqlite_engine(path)
+    sizes = [int(s) for s in args.sizes.split(",") if int(s) <= manifest["counts"]["reports"]]
+    try:
+        for size in sizes:
+            results = {
+                "ndjson": await run_stream(AsyncSession_, size, "ndjson", False),
+                "csv": await run_stream(AsyncSession_, size, "csv", False),
+                "ndjson.gz": await run_stream(AsyncSession_, size, "ndjson", True),
+            }
+            if size <= args.orm_max:
+                results["orm"] = await run_orm(AsyncSession_, size)
+            print(f"{size:>9} rows  " + "  ".join(f"{k} {v}" for k, v in results.items()))
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    synthetic.add_arguments(parser)
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--orm-max", type=int, default=200_000, help="orm 방식은 이 행 수까지만 (메모리)")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from sqlalchemy.orm import Session
+
+from models import Region, CrimeType, User
+
+# 경찰청 "범죄 발생 지역별 통계" CSV 의 대분류/중분류
+CRIME_TYPES = [
+    ("강력범죄", "살인기수"), ("강력범죄", "살인미수등"), ("강력범죄", "강도"),
+    ("강력범죄", "강간"), ("강력범죄", "유사강간"), ("강력범죄", "강제추행"),
+    ("강력범죄", "기타 강간/강제추행등"), ("강력범죄", "방화"),
+    ("절도범죄", "절도범죄"),
+    ("폭력범죄", "상해"), ("폭력범죄", "폭행"), ("폭력범죄", "체포감금"),
+    ("폭력범죄", "협박"), ("폭력범죄", "약취유인"), ("폭력범죄", "폭력행위등"),
+    ("폭력범죄", "공갈"), ("폭력범죄", "손괴"),
+    ("지능범죄", "직무유기"), ("지능범죄", "직권남용"), ("지능범죄", "증수뢰"),
+    ("지능범죄", "통화"), ("지능범죄", "문서/인장"), ("지능범죄", "유가증권인지"),
+    ("지능범죄", "사기"), ("지능범죄", "횡령"), ("지능범죄", "배임"),
+    ("풍속범죄", "성풍속범죄"), ("풍속범죄", "도박범죄"),
+    ("특별경제범죄", "특별경제범죄"), ("마약범죄", "마약범죄"), ("보건범죄", "보건범죄"),
+    ("환경범죄", "환경범죄"), ("교통범죄", "교통범죄"), ("노동범죄", "노동범죄"),
+    ("안보범죄", "안보범죄"), ("선거범죄", "선거범죄"), ("병역범죄", "병역범죄"),
+    ("기타범죄", "기타범죄"),
+]
+
+SEOUL_DISTRICTS = [
+    "종로구", "중구", "용산구", "성동구", "광진구", "동대문구", "중랑구", "성북구",
+    "강북구", "도봉구", "노원구", "은평구", "서대문구", "마포구", "양천구", "강서구",
+    "구로구", "금천구", "영등포구", "동작구", "관악구", "서초구", "강남구", "송파구", "강동구",
+]
+
+REGIONS = (
+    [("서울", d) for d in SEOUL_DISTRICTS]
+    + [("부산", d) for d in ["중구", "서구", "동구", "영도구", "부산진구", "동래구", "남구", "북구", "해운대구"]]
+    + [("경기도", d) for d in ["수원시", "성남시", "고양시", "용인시", "부천시", "안산시", "안양시", "남양주시"]]
+)
+
+
+def seed_dimensions(db: Session) -> None:
+    """regions / crime_types / 벤치마크용 사용자 1명을 채운다."""
+    db.add_all(
+        Region(id=i, province=p, city=c, full_name=f"{p} {c}")
+        for i, (p, c) in enumerate(REGIONS, start=1)
+    )
+    db.add_all(
+        CrimeType(id=i, major=major, minor=minor)
+        for i, (major, minor) in enumerate(CRIME_TYPES, start=1)
+    )
+    db.add(User(
+        id=1, email="bench@example.com", password_hash="", nickname="bench",
+        google_id="bench", auth_provider="google",
+    ))
+    db.commit()
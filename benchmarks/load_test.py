@@ -0,0 +1,607 @@
+"""
+공개 API 전체 동시 부하 테스트.
+
+benchmarks.synthetic 코퍼스(기본 제보 100만 건, 공식 통계 10년치)를 작업용 사본으로 복사한 뒤
+run.app 전체(미들웨어 포함)를 httpx.ASGITransport 로 띄우고, 경로별 가중치에 맞춰 섞은 요청을
+--concurrency 개씩 동시에 보낸다. 외부 의존성은 가짜로 바꾼다.
+- LLM   : FakeLLMBackend (--llm-latency-ms), 분류 워커도 같은 사본 DB 를 쓴다
+- Google: httpx.MockTransport (토큰 교환 / 사용자 정보)
+
+경로(템플릿)별 p50/p95/p99/최대 지연, 처리량, 상태 코드, Server-Timing 의 평균 쿼리 수/DB 시간을 출력하고
+--out 으로 JSON 결과를 저장한다. --compare 에 이전 결과를 주면 경로별 변화율을 비교하고,
+--fail-on-regression 이면 p95 가 --regression-threshold 이상 나빠진 경로가 있을 때 종료 코드 1 로 끝난다.
+ETag 를 주는 GET 은 --revalidate-rate 비율로 If-None-Match 를 붙인 재검증 요청(보통 304)을 따로 집계한다.
+
+관리용 POST /api/admin/cache/dimensions/invalidate, /api/admin/classification/requeue-dead 는 캐시/큐 상태를
+흔들어 다른 경로 측정을 왜곡하므로 제외한다.
+
+    python -m benchmarks.synthetic --reports 1000000            # 코퍼스는 한 번만 생성 (재사용)
+    python -m benchmarks.load_test --requests 20000 --concurrency 32 --out before.json
+    python -m benchmarks.load_test --requests 20000 --concurrency 32 --compare before.json --out after.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Callable, Optional
+
+import httpx
+
+from benchmarks import synthetic
+from benchmarks.fixtures import CRIME_TYPES, REGIONS
+from benchmarks.search_bench import QUERIES
+from benchmarks.sqlite import create_async_sqlite_engine, create_sqlite_engine
+from core.config import settings
+from core.database import get_async_db, get_db
+from core.db_instrumentation import instrument_engine
+from core.http_clients import get_google_http_client
+from services.ai_crime_classifier import reset_llm_backend
+from services.classification_queue import classification_queue
+
+MAJORS = sorted({major for major, _ in CRIME_TYPES})
+PROVINCES = sorted({province for province, _ in REGIONS})
+# 통계 API source 파라미터 (앱 기본값 official 이 대부분, 나머지는 공식 + 제보 합계와 제보만)
+STAT_SOURCES, STAT_SOURCE_WEIGHTS = ["official", "merged", "reports"], [0.6, 0.3, 0.1]
+GROUP_BYS = ["", "province", "major", "province,major", "city", "city,year", "major,year", "minor"]
+SERVER_TIMING_DB = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+
+@dataclass
+class Scenario:
+    name: str  # 집계 키 (메서드 + 경로 템플릿)
+    weight: float
+    build: Callable[[random.Random, "LoadState"], Optional[dict]]  # httpx.request 인자, None 이면 이번엔 건너뜀
+    expected: tuple = (200,)
+    revalidate: bool = False  # ETag 재검증 요청도 보낼지
+
+
+class LoadState:
+    """시나리오들이 공유하는 상태 (코퍼스 범위, 검수 대기 제보, 이번 실행에서 만든 제보, 로그인 세션)"""
+
+    def __init__(self, manifest: dict, pending_ids: list[int], rng: random.Random):
+        params = manifest["params"]
+        self.max_report_id = manifest["counts"]["reports"]
+        self.users = params["users"]
+        self.last_year = params["last_year"]
+        self.first_year = params["last_year"] - params["years"] + 1
+        rng.shuffle(pending_ids)
+        self.pending_ids = pending_ids
+        self.created_ids: list[int] = []
+        self.sessions: list[str] = []
+        self.etags: dict[str, str] = {}
+
+    def take_pending(self, n: int = 1) -> list[int]:
+        taken, self.pending_ids = self.pending_ids[:n], self.pending_ids[n:]
+        return taken
+
+    def take_created(self, rng: random.Random) -> Optional[int]:
+        if not self.created_ids:
+            return None
+        return self.created_ids.pop(rng.randrange(len(self.created_ids)))
+
+
+def _region(rng: random.Random) -> tuple[str, str]:
+    return rng.choice(REGIONS)
+
+
+def _report_body(rng: random.Random) -> dict:
+    major, minor = rng.choice(CRIME_TYPES)
+    # 절반은 로컬 분류기가 바로 답할 만한 본문, 나머지는 LLM(가짜) 분류 큐로 간다
+    hint = minor if rng.random() < 0.5 else "수상한 일"
+    return {
+        "title": f"{rng.choice(QUERIES)} 제보",
+        "content": f"{rng.choice(QUERIES)} 관련 {hint} 피해가 있었습니다. {rng.randint(1, 10**9)}",
+        "region_id": rng.randint(1, len(REGIONS)),
+        "crime_type_id": rng.randint(1, len(CRIME_TYPES)),
+    }
+
+
+def _source(rng) -> str:
+    return rng.choices(STAT_SOURCES, STAT_SOURCE_WEIGHTS)[0]
+
+
+def _status(rng, state):
+    province, city = _region(rng)
+    params = {"province": province, "city": city, "source": _source(rng)}
+    if rng.random() < 0.5:
+        params["major"] = rng.choice(MAJORS)
+    return {"method": "GET", "url": "/api/status", "params": params}
+
+
+def _status_batch(rng, state):
+    selectors = []
+    for _ in range(rng.randint(5, 50)):
+        province, city = _region(rng)
+        selectors.append({"province": province, "city": city, "major": rng.choice([None, *MAJORS])})
+    return {"method": "POST", "url": "/api/status/batch", "json": {"selectors": selectors}}
+
+
+def _aggregate(rng, state):
+    params = {"group_by": rng.choice(GROUP_BYS), "metrics": "sum,share", "source": _source(rng)}
+    if rng.random() < 0.5:
+        params["province"] = rng.choice(PROVINCES)
+    if "city" in params["group_by"] or "minor" in params["group_by"]:
+        params["year_from"] = state.last_year - 2
+    return {"method": "GET", "url": "/api/status/aggregate", "params": params}
+
+
+def _trend(rng, state):
+    params = {"group_by": rng.choice(["province", "major", "city"]), "year_from": state.first_year, "source": _source(rng)}
+    if params["group_by"] == "city":
+        params["province"] = rng.choice(PROVINCES)
+    return {"method": "GET", "url": "/api/status/trend", "params": params}
+
+
+def _ranking(rng, state):
+    params = {
+        "by": rng.choice(["city", "major", "city,major"]),
+        "metric": rng.choice(["count", "change", "change_rate"]),
+        "top": rng.choice([5, 10, 50]),
+        "year": rng.randint(state.first_year + 1, state.last_year),
+        "source": _source(rng),
+    }
+    if rng.random() < 0.5:
+        params["major"] = rng.choice(MAJORS)
+    return {"method": "GET", "url": "/api/status/ranking", "params": params}
+
+
+def _status_all(rng, state):
+    params = {"region_id": rng.randint(1, len(REGIONS)), "source": _source(rng)}
+    if rng.random() < 0.5:
+        params["year"] = rng.randint(state.first_year, state.last_year)
+    return {"method": "GET", "url": "/api/statusAll", "params": params}
+
+
+def _stats_export(rng, state):
+    params = {"format": rng.choice(["ndjson", "csv"]), "province": rng.choice(PROVINCES)}
+    headers = {"Accept-Encoding": "gzip"} if rng.random() < 0.5 else {}
+    return {"method": "GET", "url": "/api/status/export", "params": params, "headers": headers}
+
+
+def _regions(rng, state):
+    params = {"province": rng.choice(PROVINCES)} if rng.random() < 0.5 else {}
+    return {"method": "GET", "url": "/api/regions", "params": params}
+
+
+def _crime_types(rng, state):
+    params = {"major": rng.choice(MAJORS)} if rng.random() < 0.5 else {}
+    return {"method": "GET", "url": "/api/crime-types", "params": params}
+
+
+def _reports(rng, state):
+    params = {"limit": rng.choice([10, 20, 50])}
+    if rng.random() < 0.5:
+        params["region_id"] = rng.randint(1, len(REGIONS))
+    if rng.random() < 0.3:
+        params["crime_type_id"] = rng.randint(1, len(CRIME_TYPES))
+    if rng.random() < 0.2:
+        params["skip"] = rng.randint(0, 200)
+    return {"method": "GET", "url": "/api/reports", "params": params}
+
+
+def _reports_summary(rng, state):
+    request = _reports(rng, state)
+    request["params"]["view"] = "summary"
+    return request
+
+
+def _reports_search(rng, state):
+    params = {"keyword": rng.choice(QUERIES), "sort_by": rng.choice(["latest", "relevance"]), "limit": 20}
+    if rng.random() < 0.3:
+        params["region_id"] = rng.randint(1, len(REGIONS))
+    return {"method": "GET", "url": "/api/reports", "params": params}
+
+
+def _report(rng, state):
+    return {"method": "GET", "url": f"/api/reports/{rng.randint(1, state.max_report_id)}"}
+
+
+def _create_report(rng, state):
+    return {"method": "POST", "url": "/api/reports", "json": {**_report_body(rng), "user_id": rng.randint(1, state.users)}}
+
+
+def _put_report(rng, state):
+    return {"method": "PUT", "url": f"/api/reports/{rng.randint(1, state.max_report_id)}", "json": _report_body(rng)}
+
+
+def _patch_report(rng, state):
+    body = {"title": f"{rng.choice(QUERIES)} (수정)"}
+    return {"method": "PATCH", "url": f"/api/reports/{rng.randint(1, state.max_report_id)}", "json": body}
+
+
+def _delete_report(rng, state):
+    # 코퍼스를 줄이지 않도록 이번 실행에서 만든 제보만 지운다
+    report_id = state.take_created(rng)
+    return None if report_id is None else {"method": "DELETE", "url": f"/api/reports/{report_id}"}
+
+
+def _review(action: str):
+    def build(rng, state):
+        ids = state.take_pending()
+        return {"method": "POST", "url": f"/api/admin/reports/{ids[0]}/{action}"} if ids else None
+    return build
+
+
+def _revert_review(rng, state):
+    # 코퍼스의 아무 제보나: 승인/반려된 것은 200, 대기 중이면 409
+    return {"method": "POST", "url": f"/api/admin/reports/{rng.randint(1, state.max_report_id)}/revert"}
+
+
+def _bulk_review(rng, state):
+    ids = state.take_pending(rng.randint(5, 50))
+    if not ids:
+        return None
+    return {"method": "POST", "url": "/api/admin/reports/bulk",
+            "json": {"ids": ids, "status": rng.choice(["approved", "rejected"])}}
+
+
+def _admin_reports(rng, state):
+    params = {"status": rng.choice(["pending", "approved", "rejected"]), "limit": rng.choice([20, 100])}
+    return {"method": "GET", "url": "/api/admin/reports", "params": params}
+
+
+def _me(rng, state):
+    if not state.sessions:
+        return None
+    return {"method": "GET", "url": "/api/auth/me", "headers": {"Cookie": f"session={rng.choice(state.sessions)}"}}
+
+
+def _google_callback(rng, state):
+    # 코퍼스의 user<n> (n >= 2) 로 다시 로그인한다. 새 사용자 생성은 SQLite 에서 BIGINT id 가 자동 증가하지 않아 제외
+    return {"method": "GET", "url": "/api/google/callback", "params": {"code": f"user-{rng.randint(2, state.users)}"}}
+
+
+def _logout(rng, state):
+    if not state.sessions:
+        return None
+    return {"method": "POST", "url": "/api/auth/logout", "headers": {"Cookie": f"session={rng.choice(state.sessions)}"}}
+
+
+def _simple(method: str, url: str):
+    return lambda rng, state: {"method": method, "url": url}
+
+
+GOOGLE_CALLBACK = Scenario("GET /api/google/callback", 1, _google_callback, (307,))
+
+SCENARIOS = [
+    # 통계 조회 (가장 많은 트래픽)
+    Scenario("GET /api/status", 14, _status, (200, 404), revalidate=True),
+    Scenario("POST /api/status/batch", 3, _status_batch),
+    Scenario("GET /api/status/aggregate", 6, _aggregate, revalidate=True),
+    Scenario("GET /api/status/trend", 4, _trend, revalidate=True),
+    Scenario("GET /api/status/ranking", 4, _ranking, revalidate=True),
+    Scenario("GET /api/statusAll", 3, _status_all, revalidate=True),
+    Scenario("GET /api/status/export", 0.5, _stats_export),
+    Scenario("GET /api/regions", 4, _regions, revalidate=True),
+    Scenario("GET /api/crime-types", 3, _crime_types, revalidate=True),
+    Scenario("GET /api/crime-type", 2, _simple("GET", "/api/crime-type"), revalidate=True),
+    # 제보 게시판
+    Scenario("GET /api/reports", 6, _reports),
+    Scenario("GET /api/reports?view=summary", 6, _reports_summary),
+    Scenario("GET /api/reports?keyword", 6, _reports_search),
+    Scenario("GET /api/reports/{id}", 8, _report, (200, 404)),
+    Scenario("POST /api/reports", 4, _create_report, (201,)),
+    Scenario("PUT /api/reports/{id}", 1, _put_report, (200, 404)),
+    Scenario("PATCH /api/reports/{id}", 1, _patch_report, (200, 404)),
+    Scenario("DELETE /api/reports/{id}", 1, _delete_report, (204, 404)),
+    # 관리자 검수
+    Scenario("POST /api/admin/reports/{id}/approve", 2, _review("approve"), (200, 409)),
+    Scenario("POST /api/admin/reports/{id}/reject", 1, _review("reject"), (200, 409)),
+    Scenario("POST /api/admin/reports/{id}/revert", 0.5, _revert_review, (200, 404, 409)),
+    Scenario("POST /api/admin/reports/bulk", 0.5, _bulk_review),
+    Scenario("GET /api/admin/reports", 2, _admin_reports),
+    Scenario("GET /api/admin/cache/stats", 0.5, _simple("GET", "/api/admin/cache/stats")),
+    Scenario("GET /api/admin/classification/stats", 0.5, _simple("GET", "/api/admin/classification/stats")),
+    # 인증
+    Scenario("GET /api/auth/me", 6, _me),
+    Scenario("GET /api/google/login", 1, _simple("GET", "/api/google/login"), (307,)),
+    GOOGLE_CALLBACK,
+    Scenario("POST /api/auth/logout", 0.5, _logout),
+    Scenario("GET /", 0.5, _simple("GET", "/")),
+]
+
+
+def fake_google_client() -> httpx.AsyncClient:
+    """토큰 교환 / 사용자 정보 응답을 흉내 내는 Google OAuth 클라이언트. code=user-<n> 이면 n 번 사용자."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/token"):
+            code = dict(httpx.QueryParams(request.content.decode()))["code"]
+            return httpx.Response(200, json={"access_token": code})
+        n = request.headers["Authorization"].removeprefix("Bearer user-")
+        return httpx.Response(200, json={"id": f"google-{n}", "email": f"user{n}@example.com", "name": f"user{n}"})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class RouteStats:
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.status_codes: Counter = Counter()
+        self.errors = 0
+        self.db_queries = 0
+        self.db_ms = 0.0
+
+    def record(self, seconds: float, status_code: Optional[int], ok: bool, server_timing: Optional[str]) -> None:
+        self.latencies.append(seconds)
+        self.status_codes[status_code if status_code is not None else "exception"] += 1
+        if not ok:
+            self.errors += 1
+        match = SERVER_TIMING_DB.search(server_timing or "")
+        if match:
+            self.db_ms += float(match.group(1))
+            self.db_queries += int(match.group(2))
+
+    def summary(self, elapsed: float) -> dict:
+        latencies = sorted(self.latencies)
+        n = len(latencies)
+        return {
+            "requests": n,
+            "throughput_rps": round(n / elapsed, 1),
+            "errors": self.errors,
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items(), key=lambda kv: str(kv[0]))},
+            "mean_ms": round(statistics.fmean(latencies) * 1000, 2),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+            "max_ms": round(latencies[-1] * 1000, 2),
+            "db_queries_avg": round(self.db_queries / n, 2),
+            "db_ms_avg": round(self.db_ms / n, 2),
+        }
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+def _pending_ids(path: str) -> list[int]:
+    from models.report import Report, ReportStatus
+    engine, Session_ = create_sqlite_engine(path)
+    with Session_() as db:
+        ids = [i for (i,) in db.query(Report.id).filter(Report.status == ReportStatus.pending)]
+    engine.dispose()
+    return ids
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_load(path: str, manifest: dict, args) -> dict:
+    from run import app
+
+    sync_engine, Session_ = create_sqlite_engine(path)
+    async_engine, AsyncSession_ = create_async_sqlite_engine(path)
+    if settings.SQL_INSTRUMENTATION:
+        instrument_engine(sync_engine)
+        instrument_engine(async_engine.sync_engine)
+
+    def get_bench_db():
+        db = Session_()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_bench_async_db():
+        async with AsyncSession_() as db:
+            yield db
+
+    google = fake_google_client()
+    app.dependency_overrides[get_db] = get_bench_db
+    app.dependency_overrides[get_async_db] = get_bench_async_db
+    app.dependency_overrides[get_google_http_client] = lambda: google
+
+    # 부하 중 SQLite 쓰기 잠금 대기로 느린 쿼리 로그가 쏟아지므로 기본은 끈다 (경로별 DB 시간은 결과에 남는다)
+    if not args.slow_log:
+        settings.SQL_SLOW_LOG_SAMPLE = 0.0
+
+    # 분류 큐: 가짜 LLM + 사본 DB
+    settings.CLASSIFIER_BACKEND = "fake"
+    settings.FAKE_LLM_LATENCY_MS = args.llm_latency_ms
+    reset_llm_backend()
+    classification_queue.session_factory = Session_
+    classification_queue.start()
+
+    rng = random.Random(args.seed)
+    state = LoadState(manifest, _pending_ids(path), rng)
+    scenarios = [s for s in SCENARIOS if not args.routes or re.search(args.routes, s.name)]
+    weights = [s.weight for s in scenarios]
+    stats: dict[str, RouteStats] = defaultdict(RouteStats)
+
+    # 응답 쿠키를 저장하지 않는 클라이언트 (세션 쿠키는 /api/auth/me 요청에만 직접 붙인다)
+    jar = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    client = httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=jar, timeout=None)
+
+    async def send(scenario: Scenario, request: dict, record: bool = True) -> None:
+        name = scenario.name
+        revalidating = False
+        if scenario.revalidate and name in state.etags and rng.random() < args.revalidate_rate:
+            request.setdefault("headers", {})["If-None-Match"] = state.etags[name]
+            name, revalidating = f"{name} (If-None-Match)", True
+
+        started = time.perf_counter()
+        try:
+            r = await client.request(**request)
+        except Exception:
+            if record:
+                stats[name].record(time.perf_counter() - started, None, False, None)
+            return
+        seconds = time.perf_counter() - started
+
+        if r.headers.get("etag"):
+            state.etags[scenario.name] = r.headers["etag"]
+        if r.status_code == 201 and request["url"] == "/api/reports":
+            state.created_ids.append(r.json()["id"])
+        if scenario is GOOGLE_CALLBACK and "session" in r.cookies:
+            state.sessions.append(r.cookies["session"])
+        if record:
+            expected = (200, 304) if revalidating else scenario.expected
+            stats[name].record(seconds, r.status_code, r.status_code in expected, r.headers.get("server-timing"))
+
+    try:
+        # 로그인 세션 준비 + 시나리오마다 한 번씩 워밍업 (검색 색인, 큐브, 차원 캐시 적재는 측정에서 뺀다)
+        for _ in range(args.sessions):
+            await send(GOOGLE_CALLBACK, GOOGLE_CALLBACK.build(rng, state), record=False)
+        warmup_started = time.perf_counter()
+        for scenario in scenarios:
+            request = scenario.build(rng, state)
+            if request is not None:
+                await send(scenario, request, record=False)
+        warmup_seconds = time.perf_counter() - warmup_started
+        state.etags.clear()
+
+        remaining = args.requests
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                scenario = rng.choices(scenarios, weights)[0]
+                request = scenario.build(rng, state)
+                if request is not None:
+                    await send(scenario, request)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+        classification_queue.join(timeout=30)
+    finally:
+        await client.aclose()
+        classification_queue.stop()
+        await google.aclose()
+        app.dependency_overrides.clear()
+        await async_engine.dispose()
+        sync_engine.dispose()
+
+    total = RouteStats()
+    for route in stats.values():
+        total.latencies += route.latencies
+        total.status_codes += route.status_codes
+        total.errors += route.errors
+        total.db_queries += route.db_queries
+        total.db_ms += route.db_ms
+
+    return {
+        "meta": {
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": {k: v for k, v in vars(args).items() if k not in ("out", "compare")},
+            "corpus": manifest,
+            "settings": {
+                "STATS_BACKEND": settings.STATS_BACKEND,
+                "SEARCH_BACKEND": settings.SEARCH_BACKEND,
+                "SQL_INSTRUMENTATION": settings.SQL_INSTRUMENTATION,
+                "FAKE_LLM_LATENCY_MS": settings.FAKE_LLM_LATENCY_MS,
+            },
+            "warmup_seconds": round(warmup_seconds, 2),
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        "total": total.summary(elapsed),
+        "routes": {name: stats[name].summary(elapsed) for name in sorted(stats)},
+        "classification_queue": classification_queue.stats(),
+    }
+
+
+def _change(before: float, after: float) -> Optional[float]:
+    return round((after - before) / before * 100, 1) if before else None
+
+
+def compare(baseline: dict, result: dict, threshold: float) -> list[str]:
+    """경로별 p50/p95/p99/처리량 변화를 출력하고, p95 가 threshold % 이상 나빠진 경로 목록을 돌려준다."""
+    regressions = []
+    rows = [("total", baseline["total"], result["total"])] + [
+        (name, baseline["routes"][name], route)
+        for name, route in result["routes"].items() if name in baseline["routes"]
+    ]
+    print(f"\n{'route':<48} {'p50 ms':>18} {'p95 ms':>18} {'p99 ms':>18} {'rps':>16}")
+    for name, before, after in rows:
+        cells = []
+        for key in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps"):
+            change = _change(before[key], after[key])
+            cells.append(f"{after[key]:>8} ({change:+.1f}%)" if change is not None else f"{after[key]:>8}")
+        print(f"{name:<48} {cells[0]:>18} {cells[1]:>18} {cells[2]:>18} {cells[3]:>16}")
+        change = _change(before["p95_ms"], after["p95_ms"])
+        if name != "total" and change is not None and change >= threshold:
+            regressions.append(name)
+    missing = sorted(set(baseline["routes"]) - set(result["routes"]))
+    if missing:
+        print(f"이번 실행에 없는 경로: {', '.join(missing)}")
+    return regressions
+
+
+def print_summary(result: dict) -> None:
+    print(f"\n{'route':<48} {'n':>7} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'err':>5} {'queries':>7}")
+    for name, route in [*result["routes"].items(), ("total", result["total"])]:
+        print(f"{name:<48} {route['requests']:>7} {route['throughput_rps']:>8} {route['p50_ms']:>8} "
+              f"{route['p95_ms']:>8} {route['p99_ms']:>8} {route['errors']:>5} {route['db_queries_avg']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    synthetic.add_arguments(parser)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--sessions", type=int, default=200, help="미리 로그인해 둘 사용자 수 (/api/auth/me)")
+    parser.add_argument("--llm-latency-ms", type=float, default=50)
+    parser.add_argument("--revalidate-rate", type=float, default=0.2)
+    parser.add_argument("--slow-log", action="store_true", help="느린 쿼리 로그 켜기 (SQL_SLOW_QUERY_MS)")
+    parser.add_argument("--routes", default=None, help="이 정규식과 맞는 시나리오 이름만 실행")
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--regression-threshold", type=float, default=10.0, help="p95 악화 허용치(%%)")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    corpus = synthetic.default_path(args.db)
+    started = time.perf_counter()
+    manifest = synthetic.generate(corpus, args.reports, args.users, args.years, args.last_year, args.seed)
+    print(f"코퍼스 {corpus} ({'재사용' if manifest['reused'] else f'{time.perf_counter() - started:.1f}s 생성'}): "
+          f"{json.dumps(manifest['counts'], ensure_ascii=False)}")
+
+    # 부하 중 쓰기(작성/승인/삭제)로 코퍼스가 바뀌지 않도록 작업용 사본에서 돌린다
+    work = os.path.join(tempfile.mkdtemp(), "load_test.db")
+    shutil.copyfile(corpus, work)
+    try:
+        result = asyncio.run(run_load(work, manifest, args))
+    finally:
+        shutil.rmtree(os.path.dirname(work), ignore_errors=True)
+
+    print_summary(result)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, result, args.regression_threshold)
+        if regressions:
+            print(f"\np95 {args.regression_threshold}% 이상 악화: {', '.join(regressions)}")
+            if args.fail_on_regression:
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+official_stats CSV 적재 처리량 측정.
+
+경찰청 CSV 와 같은 wide 형식(연도, 범죄대분류, 범죄중분류, 지역별 열)의 다년도 합성 파일을 만들고
+SQLite 에 두 번 적재해 rows/s 와 멱등성(두 번째 적재 후에도 행 수/합계가 같은지)을 확인한다.
+
+    python -m benchmarks.official_ingest_bench --years 150 --batch-size 5000
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+
+from sqlalchemy import func
+
+from benchmarks.fixtures import CRIME_TYPES, REGIONS, seed_dimensions
+from benchmarks.sqlite import create_sqlite_engine
+from models.officialstat import OfficialStat
+from services.dimension_cache import dimension_cache
+from services.official_ingest import ingest_csv
+
+
+def write_csv(path: str, years: int, seed: int) -> int:
+    rng = random.Random(seed)
+    region_names = [f"{p} {c}" for p, c in REGIONS]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["연도", "범죄대분류", "범죄중분류", *region_names])
+        for year in range(2024 - years + 1, 2025):
+            for major, minor in CRIME_TYPES:
+                writer.writerow([year, major, minor, *(f"{rng.randint(0, 3000):,}" for _ in region_names)])
+    return years * len(CRIME_TYPES) * len(region_names)
+
+
+def table_state(db) -> tuple:
+    return db.query(func.count(OfficialStat.id), func.coalesce(func.sum(OfficialStat.count), 0)).one()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=150)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    csv_path = os.path.join(workdir, "official_stats.csv")
+    expected_cells = write_csv(csv_path, args.years, args.seed)
+    print(f"CSV: {args.years}년 x {len(CRIME_TYPES)}유형 x {len(REGIONS)}지역 = {expected_cells} cells "
+          f"({os.path.getsize(csv_path) / 1e6:.1f} MB)")
+
+    _, Session_ = create_sqlite_engine(os.path.join(workdir, "ingest.db"))
+    db = Session_()
+    seed_dimensions(db)
+    dimension_cache.invalidate()
+
+    states = []
+    for run in ("1차", "2차"):
+        s = ingest_csv(db, csv_path, batch_size=args.batch_size).summary()
+        states.append(table_state(db))
+        print(f"{run}: rows={s['rows']} cells={s['cells']} upserted={s['upserted']} {s['seconds']}s "
+              f"({s['rows_per_sec']} rows/s, {s['cells_per_sec']} cells/s)")
+    db.close()
+
+    print(f"official_stats 행 수/합계: {states[0]} -> {states[1]} (멱등: {states[0] == states[1]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+제보 키워드 검색 벤치마크 (합성 코퍼스, 기본 100만 건).
+
+SQLite 파일 DB 에 합성 제보를 채운 뒤 같은 검색어 묶음을
+- like : 기존 LIKE '%kw%' 전체 스캔
+- index: services.report_search 내장 bigram 역색인 (+ 페이지 후보 DB 확인)
+으로 실행해 p50/p95 지연과 색인 생성 시간/메모리를 비교한다.
+MySQL FULLTEXT(ngram) 경로는 실제 MySQL 에서 EXPLAIN 으로 확인한다 (README 참고).
+
+    python -m benchmarks.search_bench --reports 1000000
+"""
+import argparse
+import asyncio
+import os
+import random
+import resource
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from benchmarks.fixtures import CRIME_TYPES, REGIONS, seed_dimensions
+from benchmarks.sqlite import create_async_sqlite_engine, create_sqlite_engine
+from core.config import settings
+from models.report import Report
+from services import report_search
+from services.report_service import report_read_query
+from utils.pagination import apply_keyset
+
+SUBJECTS = ["중고거래", "보이스피싱", "택배", "편의점", "지하철", "주차장", "원룸", "자전거", "휴대폰", "오토바이",
+            "카페", "노트북", "지갑", "현관", "엘리베이터", "공원", "버스", "택시", "온라인", "메신저"]
+EVENTS = ["사기를 당했습니다", "도난 피해가 있었습니다", "폭행을 당했어요", "협박 문자를 받았습니다",
+          "분실 후 도용되었습니다", "파손되어 있었습니다", "스토킹이 의심됩니다", "불법촬영이 의심됩니다",
+          "계좌이체 후 연락이 끊겼습니다", "검찰 사칭 전화를 받았습니다", "문이 열려 있었습니다"]
+FILLERS = ["어제 저녁", "오늘 새벽", "지난주", "퇴근길에", "점심시간에", "주말에", "혹시 비슷한 피해 있으신가요",
+           "경찰에 신고했습니다", "조심하세요", "CCTV 확인 중입니다", "증거 사진 있습니다", "너무 무섭네요"]
+QUERIES = ["보이스피싱", "중고거래 사기", "검찰 사칭", "불법촬영", "자전거 도난", "스토킹", "계좌이체", "협박"]
+SYLLABLES = "가나다라마바사아자차카타파하강남동서북윤민준서연지호현우진성영수미경희정은혜"
+
+
+def rare_words(rng: random.Random, n: int) -> list[str]:
+    # 가게 이름/닉네임처럼 드물게 나오는 단어 (선택도가 높은 검색어)
+    return ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(3, 4))) for _ in range(n)]
+
+
+def make_row(rng: random.Random, i: int, base: datetime, vocabulary: list[str]) -> dict:
+    subject, event = rng.choice(SUBJECTS), rng.choice(EVENTS)
+    parts = [rng.choice(FILLERS), rng.choice(vocabulary), subject, event] + rng.sample(FILLERS, 2)
+    return {
+        "user_id": 1,
+        "region_id": rng.randint(1, len(REGIONS)),
+        "crime_type_id": rng.randint(1, len(CRIME_TYPES)),
+        "title": f"{subject} {event[:6]}",
+        "content": " ".join(parts),
+        "created_at": base + timedelta(seconds=i * 30 + rng.randint(0, 29)),
+    }
+
+
+def seed(path: str, reports: int, seed_value: int, vocabulary: list[str]) -> None:
+    engine, Session_ = create_sqlite_engine(path)
+    db = Session_()
+    seed_dimensions(db)
+    db.close()
+
+    rng = random.Random(seed_value)
+    base = datetime(2024, 1, 1)
+    chunk = 50_000
+    with engine.begin() as conn:
+        for start in range(0, reports, chunk):
+            conn.execute(insert(Report), [make_row(rng, i, base, vocabulary) for i in range(start, min(start + chunk, reports))])
+    engine.dispose()
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def run_queries(AsyncSession_, backend: str, queries: list[tuple], limit: int) -> dict:
+    settings.SEARCH_BACKEND = backend
+    latencies, hits = [], 0
+    async with AsyncSession_() as db:
+        for keyword, region_id, sort_by in queries:
+            query = report_read_query()
+            if region_id:
+                query = query.where(Report.region_id == region_id)
+            descending = sort_by != "oldest"
+
+            def apply_order(q):
+                return apply_keyset(q, Report.created_at, Report.id, None, descending)
+
+            started = time.perf_counter()
+            rows = await report_search.search_reports(
+                db, query, keyword, region_id, None, sort_by, 0, limit, None, apply_order
+            )
+            latencies.append(time.perf_counter() - started)
+            hits += len(rows)
+    return {
+        "queries": len(queries),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "avg_rows": round(hits / len(queries), 1),
+    }
+
+
+async def main_async(args) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "search_bench.db")
+    vocabulary = rare_words(random.Random(args.seed), max(args.reports // 50, 100))
+    started = time.perf_counter()
+    seed(path, args.reports, args.seed, vocabulary)
+    print(f"합성 제보 {args.reports}건 생성: {time.perf_counter() - started:.1f}s")
+
+    engine, AsyncSession_ = create_async_sqlite_engine(path)
+    rng = random.Random(args.seed + 1)
+    # 흔한 검색어(전체의 수 % 일치) / 드문 검색어(수십 건 일치) 를 따로 잰다
+    groups = {
+        name: [
+            (rng.choice(words), rng.choice([None, None, rng.randint(1, len(REGIONS))]),
+             rng.choice(["latest", "relevance"]))
+            for _ in range(args.queries)
+        ]
+        for name, words in (("common", QUERIES), ("rare", vocabulary))
+    }
+
+    try:
+        # 색인 생성 (첫 검색 때와 같은 경로)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        async with AsyncSession_() as db:
+            settings.SEARCH_BACKEND = "index"
+            await report_search.ensure_index(db)
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        stats = report_search.report_search_index.stats()
+        print(f"색인 생성: {stats['documents']}건, bigram {stats['grams']}개, {stats['build_seconds']}s, "
+              f"최대 RSS +{(rss_after - rss_before) / 1024:.0f} MB")
+
+        for name, queries in groups.items():
+            results = {}
+            for backend in ("index", "like"):
+                # LIKE 는 느리므로 검색어 수를 줄인다
+                qs = queries if backend == "index" else queries[:args.like_queries]
+                results[backend] = await run_queries(AsyncSession_, backend, qs, args.limit)
+                print(f"{name:>6} {backend:>5}: {results[backend]}")
+            speedup = results["like"]["p50_ms"] / max(results["index"]["p50_ms"], 1e-3)
+            print(f"{name:>6} p50 개선: {speedup:.1f}x")
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reports", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--like-queries", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+목록 API 직렬화 비용 (행당 마이크로초) 비교.
+
+benchmarks.synthetic 코퍼스에서 --rows 건짜리 응답을 세 가지 모양으로 만든다.
+- reports   : GET /api/reports        (ReportRead)
+- admin     : GET /api/admin/reports  (ReportResponse)
+- statusAll : GET /api/statusAll      (OfficialStatRead, 테이블 전체)
+- summary   : GET /api/reports?view=summary 를 view=full(새 경로)과 비교 (before 가 full, after 가 summary)
+
+- before: ORM 객체 + joinedload -> response_model 검증(from_attributes) -> mode="json" dict -> JSONResponse(json.dumps)
+          (FastAPI serialize_response 와 같은 단계)
+- after : 평평한 컬럼 Row -> TypedDict dict -> utils.fast_json.dumps (orjson, 없으면 TypeAdapter.dump_json)
+조회(fetch)와 직렬화(serialize)를 따로 재고, 두 경로의 JSON 이 같은지도 확인한다.
+
+    python -m benchmarks.serialization_bench --reports 100000 --rows 10000 --repeat 5
+    python -m benchmarks.serialization_bench --no-orjson     # orjson 이 없는 배포 환경
+    python -m benchmarks.serialization_bench --shapes reports,summary --content-chars 1500
+
+합성 코퍼스의 본문은 수십 글자뿐이다. --content-chars 를 주면 코퍼스 사본의 본문을 그 길이로 늘려서 잰다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+from starlette.responses import JSONResponse
+
+from benchmarks import synthetic
+from benchmarks.sqlite import create_async_sqlite_engine
+from core.config import settings
+from models.officialstat import OfficialStat
+from models.report import Report
+from schemas.officialstat import OfficialStatRead, official_stat_read_list
+from schemas.report import ReportRead, ReportResponse, report_read_list, report_response_list, report_summary_list
+from services import official_service, report_service
+from utils import fast_json
+from utils.pagination import apply_keyset
+
+
+# FastAPI 가 response_model 로 라우트마다 한 번 만들어 두는 것과 같다 (측정에 스키마 생성 비용이 들어가지 않게)
+REPORT_READ_MODELS = TypeAdapter(list[ReportRead])
+REPORT_RESPONSE_MODELS = TypeAdapter(list[ReportResponse])
+OFFICIAL_STAT_MODELS = TypeAdapter(list[OfficialStatRead])
+
+
+def model_json(adapter: TypeAdapter, objs) -> bytes:
+    value = adapter.validate_python(objs, from_attributes=True)
+    return JSONResponse(None).render(adapter.dump_python(value, mode="json"))
+
+
+def _reports_orm(rows: int):
+    stmt = select(Report).options(joinedload(Report.region), joinedload(Report.crime_type))
+    return apply_keyset(stmt, Report.created_at, Report.id, None).limit(rows)
+
+
+async def _fetch_reports_orm(db, rows):
+    return (await db.scalars(_reports_orm(rows))).all()
+
+
+async def _fetch_reports_rows(db, rows):
+    stmt = apply_keyset(report_service.report_read_query(), Report.created_at, Report.id, None)
+    return (await db.execute(stmt.limit(rows))).all()
+
+
+async def _fetch_admin_orm(db, rows):
+    stmt = apply_keyset(select(Report), Report.created_at, Report.id, None)
+    return (await db.scalars(stmt.limit(rows))).all()
+
+
+async def _fetch_admin_rows(db, rows):
+    return await report_service.get_all_reports(db, limit=rows)
+
+
+async def _fetch_summary(db, rows):
+    length = settings.REPORT_SNIPPET_LENGTH
+    stmt = apply_keyset(report_service.report_summary_query(length), Report.created_at, Report.id, None)
+    return await report_service.report_summary_dicts(db, (await db.execute(stmt.limit(rows))).all(), length)
+
+
+async def _fetch_stats_orm(db, rows):
+    stmt = select(OfficialStat).options(joinedload(OfficialStat.region), joinedload(OfficialStat.crime_type))
+    return (await db.scalars(stmt.order_by(OfficialStat.year.asc()))).all()
+
+
+async def _fetch_stats_rows(db, rows):
+    return await official_service.fetch_all_official_stats(db)
+
+
+# 이름 -> (before 조회, before 직렬화, after 조회, after 직렬화)
+SHAPES = {
+    "reports": (
+        _fetch_reports_orm, lambda objs: model_json(REPORT_READ_MODELS, objs),
+        _fetch_reports_rows,
+        lambda rows: fast_json.dumps([report_service.report_read_dict(r) for r in rows], report_read_list),
+    ),
+    "admin": (
+        _fetch_admin_orm, lambda objs: model_json(REPORT_RESPONSE_MODELS, objs),
+        _fetch_admin_rows,
+        lambda rows: fast_json.dumps([report_service.report_response_dict(r) for r in rows], report_response_list),
+    ),
+    "summary": (
+        _fetch_reports_rows,
+        lambda rows: fast_json.dumps([report_service.report_read_dict(r) for r in rows], report_read_list),
+        _fetch_summary, lambda rows: fast_json.dumps(rows, report_summary_list),
+    ),
+    "statusAll": (
+        _fetch_stats_orm, lambda objs: model_json(OFFICIAL_STAT_MODELS, objs),
+        _fetch_stats_rows, lambda rows: fast_json.dumps(rows, official_stat_read_list),
+    ),
+}
+
+
+async def measure(AsyncSession_, fetch, serialize, rows: int, repeat: int) -> dict:
+    fetch_times, serialize_times = [], []
+    for _ in range(repeat):
+        # 세션마다 identity map 이 비어 있어야 ORM 객체 생성 비용이 매번 들어간다
+        async with AsyncSession_() as db:
+            started = time.perf_counter()
+            result = await fetch(db, rows)
+            fetched = time.perf_counter()
+            body = serialize(result)
+            serialize_times.append(time.perf_counter() - fetched)
+            fetch_times.append(fetched - started)
+    n = len(result)
+    return {
+        "rows": n,
+        "fetch_us_per_row": round(statistics.median(fetch_times) / n * 1e6, 2),
+        "serialize_us_per_row": round(statistics.median(serialize_times) / n * 1e6, 2),
+        "bytes": len(body),
+        "body": body,
+    }
+
+
+def lengthen_content(corpus: str, chars: int) -> str:
+    """코퍼스 사본을 만들어 reports.content 를 원래 본문을 반복해 chars 글자로 늘린다"""
+    path = os.path.join(tempfile.mkdtemp(), "serialization_bench.db")
+    shutil.copyfile(corpus, path)
+    with sqlite3.connect(path) as conn:
+        # replace(hex(zeroblob(n)), '00', x) = x 를 n 번 반복
+        conn.execute(
+            "UPDATE reports SET content = substr(replace(hex(zeroblob(?)), '00', content || ' '), 1, ?)",
+            (chars // 10 + 1, chars),
+        )
+    return path
+
+
+async def main_async(args) -> None:
+    path = synthetic.default_path(args.db)
+    synthetic.generate(path, args.reports, args.users, args.years, args.last_year, args.seed)
+    if args.content_chars:
+        path = lengthen_content(path, args.content_chars)
+    engine, AsyncSession_ = create_async_sqlite_engine(path)
+    if args.no_orjson:
+        fast_json.orjson = None
+    print(f"orjson: {'사용' if fast_json.orjson is not None else '없음 (TypeAdapter.dump_json)'}")
+    try:
+        for name, (fetch_before, ser_before, fetch_after, ser_after) in SHAPES.items():
+            if args.shapes and name not in args.shapes.split(","):
+                continue
+            before = await measure(AsyncSession_, fetch_before, ser_before, args.rows, args.repeat)
+            after = await measure(AsyncSession_, fetch_after, ser_after, args.rows, args.repeat)
+            before_body, after_body = before.pop("body"), after.pop("body")
+            # summary 는 응답 모양이 달라 크기/시간만 비교한다
+            same = None if name == "summary" else json.loads(before_body) == json.loads(after_body)
+            total_before = before["fetch_us_per_row"] + before["serialize_us_per_row"]
+            total_after = after["fetch_us_per_row"] + after["serialize_us_per_row"]
+            print(f"{name:<10} before {before}")
+            print(f"{'':<10} after  {after}  same_json={same}  total x{total_before / total_after:.1f}")
+    finally:
+        await engine.dispose()
+        if args.content_chars:
+            shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    synthetic.add_arguments(parser)
+    parser.set_defaults(reports=100_000)
+    parser.add_argument("--rows", type=int, default=10_000, help="reports / admin 응답 행 수 (statusAll 은 테이블 전체)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--content-chars", type=int, default=0, help="제보 본문을 이 글자 수로 늘려서 잰다 (0: 코퍼스 그대로)")
+    parser.add_argument("--no-orjson", action="store_true", help="orjson 이 있어도 TypeAdapter.dump_json 경로로 잰다")
+    parser.add_argument("--shapes", default="", help="콤마로 구분 (reports,admin,summary,statusAll). 비우면 전부")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
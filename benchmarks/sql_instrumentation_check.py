@@ -0,0 +1,63 @@
+"""
+SQL 계측(core.db_instrumentation) 회귀 확인.
+
+실패한 문장은 after_cursor_execute 가 불리지 않는다. 그 뒤 같은 (풀) 커넥션에서 실행한 쿼리의 시간이
+제대로 재지는지, 커넥션에 시작 시각이 남지 않는지 확인한다. 실패하면 종료 코드 1.
+
+    python -m benchmarks.sql_instrumentation_check --sleep-ms 50 --failures 3
+"""
+import argparse
+import sys
+import time
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import StaticPool
+
+from core import db_instrumentation
+from core.db_instrumentation import QueryStats, instrument_engine
+
+
+def _sleep_ms(ms):
+    time.sleep(ms / 1000)
+    return ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sleep-ms", type=float, default=50, help="느린 쿼리 하나가 걸리는 시간")
+    parser.add_argument("--failures", type=int, default=3, help="먼저 실패시킬 문장 수")
+    args = parser.parse_args()
+
+    # 커넥션 하나를 계속 재사용해 풀로 돌아간 커넥션과 같은 상황을 만든다
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    event.listen(engine, "connect", lambda dbapi_conn, _: dbapi_conn.create_function("sleep_ms", 1, _sleep_ms))
+    instrument_engine(engine)
+
+    with engine.connect() as conn:
+        for _ in range(args.failures):
+            try:
+                conn.execute(text("SELECT * FROM no_such_table"))
+            except OperationalError:
+                conn.rollback()
+        # 실패한 문장 뒤에 시간이 흘러야 남은 시작 시각을 꺼냈을 때 차이가 드러난다
+        time.sleep(args.sleep_ms / 1000)
+
+        stats = QueryStats()
+        token = db_instrumentation._current.set(stats)
+        try:
+            conn.execute(text("SELECT sleep_ms(:ms)"), {"ms": args.sleep_ms})
+        finally:
+            db_instrumentation._current.reset(token)
+        leftover = conn.connection.info.get("query_started") or []
+    engine.dispose()
+
+    measured = stats.total * 1000
+    ok = stats.count == 1 and args.sleep_ms * 0.9 <= measured < args.sleep_ms * 1.8 and not leftover
+    print(f"failures={args.failures} measured={measured:.1f}ms expected~{args.sleep_ms:.0f}ms "
+          f"leftover_start_times={len(leftover)} {'OK' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import DefaultClause
+
+from core.database import Base
+import models  # noqa: F401  (모든 테이블을 metadata 에 등록)
+
+
+def _sqlite_compatible_defaults():
+    # MySQL 전용 "ON UPDATE CURRENT_TIMESTAMP" 는 SQLite 가 이해하지 못하므로 기본값만 남긴다
+    for table in Base.metadata.tables.values():
+        for column in table.columns:
+            default = column.server_default
+            if default is not None and "ON UPDATE" in str(getattr(default, "arg", "")):
+                column.server_default = DefaultClause(text("CURRENT_TIMESTAMP"))
+
+
+def create_sqlite_engine(path: str = ":memory:"):
+    """벤치마크용 SQLite 엔진. path 가 ':memory:' 면 모든 스레드가 커넥션 하나를 공유한다."""
+    _sqlite_compatible_defaults()
+    if path == ":memory:":
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+    else:
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def _pragma(dbapi_conn, _):
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA busy_timeout=5000")
+        cur.close()
+
+    Base.metadata.create_all(engine)
+    return engine, sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+def create_async_sqlite_engine(path: str):
+    """create_sqlite_engine 으로 만든 파일 DB 를 aiosqlite 로 여는 비동기 엔진/세션 팩토리."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _pragma(dbapi_conn, _):
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA busy_timeout=5000")
+        cur.close()
+
+    return engine, async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
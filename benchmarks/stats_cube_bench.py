@@ -0,0 +1,131 @@
+"""
+공식 통계 조회 SQL 경로 vs 인메모리 큐브(STATS_BACKEND=cube) 벤치마크.
+
+SQLite 파일 DB 에 지역 x 범죄유형 x 연도 전체 조합의 official_stats 를 채우고
+같은 조회를 두 엔진으로 반복해 p50/p95 지연을 비교한다.
+- status : /api/status (지역 1곳, 최신 연도, 대분류 필터)
+- total  : 필터 없는 전체 합계
+- rollup : 시/도 x 대분류 합계/비율
+- yoy    : 구/군 x 연도 (전년 대비 비교용 2개 연도)
+
+    python -m benchmarks.stats_cube_bench --years 10 --iterations 500
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import insert
+
+from benchmarks.fixtures import CRIME_TYPES, REGIONS, seed_dimensions
+from benchmarks.sqlite import create_async_sqlite_engine, create_sqlite_engine
+from core.config import settings
+from models.officialstat import OfficialStat
+from services import official_service
+from services.official_aggregate import aggregate_stats
+from services.stats_cube import stats_cube
+
+
+def seed(path: str, years: int, last_year: int, seed_value: int) -> int:
+    engine, Session_ = create_sqlite_engine(path)
+    db = Session_()
+    seed_dimensions(db)
+    db.close()
+
+    rng = random.Random(seed_value)
+    rows = [
+        {"region_id": r, "crime_type_id": c, "year": y, "count": rng.randint(0, 5000)}
+        for r in range(1, len(REGIONS) + 1)
+        for c in range(1, len(CRIME_TYPES) + 1)
+        for y in range(last_year - years + 1, last_year + 1)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(OfficialStat), rows)
+    engine.dispose()
+    return len(rows)
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def workloads(rng: random.Random, last_year: int):
+    def status(db):
+        province, city = rng.choice(REGIONS)
+        major = rng.choice([None, rng.choice(CRIME_TYPES)[0]])
+        return official_service.fetch_official_stats(db, province, city, major)
+
+    def total(db):
+        return aggregate_stats(db)
+
+    def rollup(db):
+        return aggregate_stats(db, group_by=["province", "major"], metrics=["sum", "share"])
+
+    def yoy(db):
+        major = rng.choice(CRIME_TYPES)[0]
+        return aggregate_stats(db, group_by=["city", "year"], majors=[major],
+                               year_from=last_year - 1, year_to=last_year, shape="pivot")
+
+    return {"status": status, "total": total, "rollup": rollup, "yoy": yoy}
+
+
+async def measure(AsyncSession_, backend: str, name: str, workload, iterations: int) -> dict:
+    settings.STATS_BACKEND = backend
+    latencies = []
+    async with AsyncSession_() as db:
+        await workload(db)  # 큐브 적재 / 커넥션 준비는 측정에서 뺀다
+        for _ in range(iterations):
+            started = time.perf_counter()
+            await workload(db)
+            latencies.append(time.perf_counter() - started)
+    return {
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+    }
+
+
+async def main_async(args) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "stats_cube_bench.db")
+    rows = seed(path, args.years, args.last_year, args.seed)
+    print(f"official_stats {rows}행 ({len(REGIONS)} 지역 x {len(CRIME_TYPES)} 유형 x {args.years} 년)")
+
+    engine, AsyncSession_ = create_async_sqlite_engine(path)
+    settings.STATS_CUBE_CHECK_INTERVAL = 1e9  # 지문 검사 없이 순수 조회만 비교
+    try:
+        for name, workload in workloads(random.Random(args.seed), args.last_year).items():
+            results = {
+                backend: await measure(AsyncSession_, backend, name, workload, args.iterations)
+                for backend in ("sql", "cube")
+            }
+            speedup = results["sql"]["p50_ms"] / max(results["cube"]["p50_ms"], 1e-3)
+            print(f"{name:>6}  sql {results['sql']}  cube {results['cube']}  p50 {speedup:.1f}x")
+
+        cube = stats_cube.stats()
+        print(f"큐브 적재 {cube['load_seconds']}s, shape={cube['shape']}, {cube['bytes'] / 1024:.0f} KiB")
+
+        # 승인 1건 증분 반영 비용
+        deltas = {(1, 1, args.last_year): 1}
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            stats_cube.on_stats_changed(deltas)
+        print(f"증분 반영 평균 {(time.perf_counter() - started) / args.iterations * 1e6:.1f}us/건")
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--last-year", type=int, default=2023)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
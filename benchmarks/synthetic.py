@@ -0,0 +1,185 @@
+"""
+부하 테스트용 합성 데이터 생성기.
+
+SQLite 파일 DB 에 다음을 채운다 (같은 인자와 seed 면 항상 같은 데이터).
+- regions / crime_types : benchmarks.fixtures 의 README 지역 목록과 경찰청 CSV 전체 유형
+- users                 : --users 명 (구글 로그인 사용자)
+- reports               : --reports 건 (기본 100만). 상태는 pending / approved / rejected 가 섞여 있다
+- official_stats        : 지역 x 범죄유형 x --years 년 전체 조합
+- report_stats / merged_stats : 승인된 제보 집계와 공식 + 제보 합계 (services.report_stats.rebuild_all)
+
+생성한 DB 옆에 <db>.json 매니페스트를 남긴다. 같은 인자로 다시 부르면 생성을 건너뛰고 재사용하므로
+수백만 건 코퍼스를 한 번만 만들어 두고 부하 테스트를 여러 번 돌릴 수 있다.
+
+    python -m benchmarks.synthetic --db /tmp/crime_bench.db --reports 2000000 --years 10
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, select
+
+from benchmarks.fixtures import CRIME_TYPES, REGIONS, seed_dimensions
+from benchmarks.search_bench import make_row, rare_words
+from benchmarks.sqlite import create_sqlite_engine
+from models.officialstat import MergedStat, OfficialStat, ReportStat
+from models.report import ClassificationStatus, Report, ReportStatus
+from models.user import User
+from services import report_stats
+
+CHUNK = 50_000
+# 목록/검수 화면에서 흔히 보는 비율 (대부분 처리 완료, 일부 대기)
+STATUS_WEIGHTS = {ReportStatus.approved: 0.6, ReportStatus.pending: 0.3, ReportStatus.rejected: 0.1}
+
+
+# 코퍼스에 들어가는 테이블이 바뀌면 올린다 (예전 매니페스트의 코퍼스는 재사용하지 않고 다시 만든다)
+CORPUS_FORMAT = 3  # 2: report_stats / merged_stats 추가, 3: reports.version 추가
+
+
+def corpus_params(reports: int, users: int, years: int, last_year: int, seed: int) -> dict:
+    return {
+        "reports": reports, "users": users, "years": years, "last_year": last_year, "seed": seed,
+        "format": CORPUS_FORMAT,
+    }
+
+
+def _manifest_path(path: str) -> str:
+    return f"{path}.json"
+
+
+def _load_manifest(path: str):
+    try:
+        with open(_manifest_path(path), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _seed_users(engine, users: int) -> None:
+    # seed_dimensions 가 id=1 사용자를 만든다
+    rows = [
+        {
+            "id": i, "email": f"user{i}@example.com", "password_hash": "", "nickname": f"user{i}",
+            "google_id": f"google-{i}", "auth_provider": "google",
+        }
+        for i in range(2, users + 1)
+    ]
+    if rows:
+        with engine.begin() as conn:
+            conn.execute(insert(User), rows)
+
+
+def _seed_reports(engine, reports: int, users: int, last_year: int, rng: random.Random) -> None:
+    vocabulary = rare_words(rng, max(reports // 50, 100))
+    base = datetime(last_year, 1, 1)
+    statuses, weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+    with engine.begin() as conn:
+        for start in range(0, reports, CHUNK):
+            rows = []
+            for i in range(start, min(start + CHUNK, reports)):
+                row = make_row(rng, i, base, vocabulary)
+                status = rng.choices(statuses, weights)[0]
+                row["user_id"] = rng.randint(1, users)
+                row["status"] = status
+                row["classification_status"] = ClassificationStatus.done
+                # executemany 는 모든 행이 같은 키를 가져야 한다
+                reviewed_at = row["created_at"] + timedelta(hours=rng.randint(1, 72))
+                row["approved_at"] = reviewed_at if status == ReportStatus.approved else None
+                row["rejected_at"] = reviewed_at if status == ReportStatus.rejected else None
+                rows.append(row)
+            conn.execute(insert(Report), rows)
+
+
+def _seed_official_stats(engine, years: int, last_year: int, rng: random.Random) -> None:
+    rows = [
+        {"region_id": r, "crime_type_id": c, "year": y, "count": rng.randint(0, 5000)}
+        for r in range(1, len(REGIONS) + 1)
+        for c in range(1, len(CRIME_TYPES) + 1)
+        for y in range(last_year - years + 1, last_year + 1)
+    ]
+    with engine.begin() as conn:
+        for start in range(0, len(rows), CHUNK):
+            conn.execute(insert(OfficialStat), rows[start:start + CHUNK])
+
+
+def generate(path: str, reports: int, users: int, years: int, last_year: int, seed: int) -> dict:
+    """path 에 합성 코퍼스를 만들고 매니페스트(생성 인자 + 행 수)를 돌려준다. 이미 같은 인자로 만들었으면 재사용."""
+    params = corpus_params(reports, users, years, last_year, seed)
+    manifest = _load_manifest(path)
+    if manifest and manifest.get("params") == params and os.path.exists(path):
+        manifest["reused"] = True
+        return manifest
+
+    for stale in (path, f"{path}-wal", f"{path}-shm"):
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    started = time.perf_counter()
+    engine, Session_ = create_sqlite_engine(path)
+    db = Session_()
+    seed_dimensions(db)
+    db.close()
+
+    rng = random.Random(seed)
+    _seed_users(engine, users)
+    _seed_official_stats(engine, years, last_year, rng)
+    _seed_reports(engine, reports, users, last_year, rng)
+    db = Session_()
+    report_stats.rebuild_all(db)
+    db.close()
+
+    with engine.connect() as conn:
+        counts = {
+            "regions": len(REGIONS),
+            "crime_types": len(CRIME_TYPES),
+            "users": conn.scalar(select(func.count()).select_from(User)),
+            "reports": conn.scalar(select(func.count()).select_from(Report)),
+            "pending_reports": conn.scalar(
+                select(func.count()).select_from(Report).where(Report.status == ReportStatus.pending)
+            ),
+            "official_stats": conn.scalar(select(func.count()).select_from(OfficialStat)),
+            "report_stats": conn.scalar(select(func.count()).select_from(ReportStat)),
+            "merged_stats": conn.scalar(select(func.count()).select_from(MergedStat)),
+        }
+    engine.dispose()
+
+    manifest = {
+        "params": params,
+        "counts": counts,
+        "generated_seconds": round(time.perf_counter() - started, 1),
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    with open(_manifest_path(path), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    manifest["reused"] = False
+    return manifest
+
+
+def default_path(path=None) -> str:
+    return path or os.path.join(tempfile.gettempdir(), "crime_bench.db")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--db", default=None, help="SQLite 파일 경로 (기본: 임시 디렉터리의 crime_bench.db)")
+    parser.add_argument("--reports", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--last-year", type=int, default=2023)
+    parser.add_argument("--seed", type=int, default=7)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser)
+    args = parser.parse_args()
+    path = default_path(args.db)
+    manifest = generate(path, args.reports, args.users, args.years, args.last_year, args.seed)
+    print(json.dumps({"db": path, **manifest}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
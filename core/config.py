@@ -19,10 +19,83 @@ class Settings:
     # OpenAI
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+    # AI 분류 백엔드 (openai | fake) 및 백그라운드 작업 큐
+    CLASSIFIER_BACKEND = os.getenv("CLASSIFIER_BACKEND", "openai")
+    CLASSIFIER_WORKERS = int(os.getenv("CLASSIFIER_WORKERS", "4"))
+    CLASSIFIER_QUEUE_SIZE = int(os.getenv("CLASSIFIER_QUEUE_SIZE", "1000"))
+    CLASSIFIER_MAX_ATTEMPTS = int(os.getenv("CLASSIFIER_MAX_ATTEMPTS", "3"))
+    CLASSIFIER_RETRY_BACKOFF = float(os.getenv("CLASSIFIER_RETRY_BACKOFF", "1.0"))
+    FAKE_LLM_LATENCY_MS = float(os.getenv("FAKE_LLM_LATENCY_MS", "200"))
+    FAKE_LLM_FAILURE_RATE = float(os.getenv("FAKE_LLM_FAILURE_RATE", "0"))
+
+    # LLM 앞단 로컬 키워드 분류기 (확신도가 임계값 이상이면 LLM 호출 생략)
+    LOCAL_CLASSIFIER_ENABLED = os.getenv("LOCAL_CLASSIFIER_ENABLED", "true").lower() == "true"
+    LOCAL_CLASSIFIER_THRESHOLD = float(os.getenv("LOCAL_CLASSIFIER_THRESHOLD", "0.5"))
+
+    # 분류 결과 메모리 LRU 크기 (영구 캐시는 classification_cache 테이블)
+    CLASSIFICATION_CACHE_SIZE = int(os.getenv("CLASSIFICATION_CACHE_SIZE", "10000"))
+
+    # 로그인 사용자 캐시 (세션 user_id -> 사용자 정보, get_current_user 의 DB 조회 생략)
+    USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+    USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+
+    # 제보 키워드 검색: auto(MySQL=fulltext, 그 외=like) / fulltext / index / like
+    # index 는 프로세스 내 역색인이라 다른 워커가 만든/지운 제보를 모른다. 워커 1개로 띄울 때만 명시적으로 켠다
+    SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "auto")
+
+    # 외부 API(Google OAuth, OpenAI) 공유 HTTP 클라이언트 풀/타임아웃(초)
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+    HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+    OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "20"))
+    OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+
+    # /api/status/aggregate 한 번에 돌려줄 최대 셀 수 (rows: 그룹 수, pivot: 행 x 열)
+    STATS_AGGREGATE_MAX_CELLS = int(os.getenv("STATS_AGGREGATE_MAX_CELLS", "5000"))
+
+    # 공식 통계 조회 엔진: sql(기본) / cube(official_stats 를 numpy 배열로 메모리에 적재, numpy 필요)
+    STATS_BACKEND = os.getenv("STATS_BACKEND", "sql")
+    # 큐브가 DB 의 (행 수, 합계) 지문과 비교해 다른 프로세스의 변경을 확인하는 주기(초)
+    STATS_CUBE_CHECK_INTERVAL = float(os.getenv("STATS_CUBE_CHECK_INTERVAL", "30"))
+
+    # /api/status/trend, /api/status/ranking 결과 캐시 (승인/적재로 통계가 바뀌면 비움, TTL 은 다른 프로세스 변경 대비)
+    STATS_TREND_CACHE_SIZE = int(os.getenv("STATS_TREND_CACHE_SIZE", "1000"))
+    STATS_TREND_CACHE_TTL = float(os.getenv("STATS_TREND_CACHE_TTL", "300"))
+
+    # HTTP 조건부 캐시: 통계 버전(행 수/합계/최종 수정 시각) 재확인 주기(초), Cache-Control max-age(초)
+    STATS_VERSION_TTL = float(os.getenv("STATS_VERSION_TTL", "5"))
+    STATS_HTTP_MAX_AGE = int(os.getenv("STATS_HTTP_MAX_AGE", "60"))
+    DIMENSION_HTTP_MAX_AGE = int(os.getenv("DIMENSION_HTTP_MAX_AGE", "300"))
+
+    # SQL 로그/계측. DB_ECHO 는 모든 문장을 stdout 에 찍는 SQLAlchemy echo (개발용)
+    DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+    SQL_INSTRUMENTATION = os.getenv("SQL_INSTRUMENTATION", "true").lower() == "true"
+    SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true"
+    SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+    SQL_SLOW_LOG_SAMPLE = float(os.getenv("SQL_SLOW_LOG_SAMPLE", "1.0"))
+    SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+
+    # GET /api/reports?view=summary 의 본문 미리보기 글자 수 (넘으면 잘라서 … 을 붙인다)
+    REPORT_SNIPPET_LENGTH = int(os.getenv("REPORT_SNIPPET_LENGTH", "120"))
+
+    # /api/status/export, /api/admin/reports/export 서버측 커서에서 한 번에 받아 직렬화하는 행 수
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "2000"))
+
+    # GET /metrics (Prometheus 텍스트 형식): 경로별 지연 히스토그램, 커넥션 풀, 분류/OAuth 외부 호출 시간
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
     # SQLAlchemy URL 구성
     SQLALCHEMY_DATABASE_URL = (
         f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     )
+    # 비동기 엔진용 URL (테스트에서는 ASYNC_DATABASE_URL=sqlite+aiosqlite:///./test.db 등으로 교체)
+    ASYNC_SQLALCHEMY_DATABASE_URL = os.getenv(
+        "ASYNC_DATABASE_URL",
+        f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
+    )
 
     # Google OAuth
     GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
@@ -35,5 +108,8 @@ class Settings:
     # Frontend URL (for redirect after login)
     FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173/reports")
 
+    # regions / crime_types 캐시 유지 시간(초)
+    DIMENSION_CACHE_TTL = float(os.getenv("DIMENSION_CACHE_TTL", "300"))
+
 
 settings = Settings()
\ No newline at end of file
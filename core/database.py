@@ -1,15 +1,22 @@
 import os  # 파일 존재 확인을 위해 필요
+import ssl
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from core.config import settings
+from core.db_instrumentation import instrument_engine
+from core.metrics import instrument_pool
 
 # 1. SSL 설정 동적 구성
 connect_args = {}
+async_connect_args = {}
 
 # 설정에 경로가 있고, 실제로 그 경로에 파일이 존재할 때만 SSL 적용
 if settings.DB_SSL_CA_PATH and os.path.exists(settings.DB_SSL_CA_PATH):
     connect_args["ssl"] = {"ca": settings.DB_SSL_CA_PATH}
+    # aiomysql 은 SSLContext 를 받는다
+    async_connect_args["ssl"] = ssl.create_default_context(cafile=settings.DB_SSL_CA_PATH)
     print(f"🔒 DB SSL 설정 적용 완료: {settings.DB_SSL_CA_PATH}")
 else:
     # 로컬 테스트 환경이나 인증서가 없는 경우를 위한 처리
@@ -23,16 +30,49 @@ engine = create_engine(
     max_overflow=10,
     pool_timeout=30,
     pool_pre_ping=True,
-    echo=True
+    echo=settings.DB_ECHO
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# 3. 비동기 엔진 (async 엔드포인트가 이벤트 루프를 막지 않도록 aiomysql 사용)
+if settings.ASYNC_SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+    # 테스트용 SQLite(aiosqlite) 는 커넥션 풀 크기 옵션을 받지 않는다
+    async_engine = create_async_engine(settings.ASYNC_SQLALCHEMY_DATABASE_URL, echo=settings.DB_ECHO)
+else:
+    async_engine = create_async_engine(
+        settings.ASYNC_SQLALCHEMY_DATABASE_URL,
+        connect_args=async_connect_args,
+        pool_size=10,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        echo=settings.DB_ECHO
+    )
+
+# 요청별 쿼리 수/DB 시간(Server-Timing), 느린 쿼리, N+1 의심 로그 (core/db_instrumentation.py)
+if settings.SQL_INSTRUMENTATION:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+
+# /metrics 커넥션 풀 게이지 (사용 중 / overflow / 획득 대기 시간)
+instrument_pool(engine, "sync")
+instrument_pool(async_engine.sync_engine, "async")
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 # 의존성 주입
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,154 @@
+"""
+요청 단위 SQL 계측 (SQLAlchemy 엔진 이벤트 기반, echo=True 대체).
+
+- 요청마다 쿼리 수, DB 총 시간, 가장 느린 문장을 모아 Server-Timing 응답 헤더로 보낸다.
+- 같은 모양(파라미터 자리표시자만 다른)의 SELECT 가 한 요청에서 SQL_N_PLUS_ONE_THRESHOLD 번 이상
+  실행되면 N+1 의심으로 경고 로그를 남긴다 (예: 목록을 돌며 관계를 lazy 로드).
+- SQL_SLOW_QUERY_MS 를 넘는 문장은 SQL_SLOW_LOG_SAMPLE 비율로 샘플링해 로그에 남긴다.
+
+요청 밖(분류 워커, CLI)에서 실행된 쿼리는 느린 쿼리 로그만 남는다.
+"""
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from core.config import settings
+
+logger = logging.getLogger("sql")
+
+_PLACEHOLDERS = re.compile(r"\(\s*(?:\?|%s|:\w+)(?:\s*,\s*(?:\?|%s|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """IN (?, ?, ?) 처럼 길이만 다른 목록을 (?) 로 접고 공백을 정리한 문장 모양."""
+    return _PLACEHOLDERS.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class QueryStats:
+    """한 요청 동안의 SQL 실행 기록"""
+
+    __slots__ = ("count", "total", "slowest", "slowest_statement", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.slowest:
+            self.slowest, self.slowest_statement = seconds, statement
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """N+1 의심: threshold 번 이상 반복된 SELECT 모양"""
+        return [
+            (shape, n) for shape, n in self.shapes.most_common()
+            if n >= threshold and shape.lstrip("(").upper().startswith("SELECT")
+        ]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 시작 시각은 문장마다 새로 만들어지는 실행 컨텍스트에 둔다. 커넥션(conn.info)에 쌓으면 실패한 문장은
+    # after_cursor_execute 가 불리지 않아 값이 남고, 풀로 돌아간 커넥션의 이후 쿼리가 엉뚱한 시각을 꺼낸다
+    if context is not None:
+        context._query_started = time.perf_counter()
+    else:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        started = context._query_started
+    else:
+        started = conn.info["query_started"].pop()
+    seconds = time.perf_counter() - started
+
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+
+    if seconds * 1000 >= settings.SQL_SLOW_QUERY_MS and random.random() < settings.SQL_SLOW_LOG_SAMPLE:
+        logger.warning(
+            "slow query %.1fms%s: %s",
+            seconds * 1000, " (executemany)" if executemany else "", _WHITESPACE.sub(" ", statement)[:1000],
+        )
+
+
+def _handle_error(exception_context):
+    # 컨텍스트 없이 실행된 문장이 실패하면 conn.info 에 쌓아 둔 시작 시각을 버린다
+    conn = exception_context.connection
+    if exception_context.execution_context is None and conn is not None:
+        started = conn.info.get("query_started")
+        if started:
+            started.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """동기 엔진 또는 AsyncEngine.sync_engine 에 계측 이벤트를 단다."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class SQLTimingMiddleware:
+    """
+    요청마다 QueryStats 를 ContextVar 에 두고, 응답 헤더에 Server-Timing 을 붙인다.
+        Server-Timing: db;dur=12.3;desc="7 queries", db-slowest;dur=8.1, app;dur=20.4
+    N+1 의심이면 db-n-plus-one 항목이 추가되고, 응답이 끝난 뒤 문장 모양을 경고 로그로 남긴다.
+    (BaseHTTPMiddleware 대신 순수 ASGI 로 작성해 스트리밍 응답도 그대로 흘려보낸다)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = QueryStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and settings.SERVER_TIMING_ENABLED:
+                app_ms = (time.perf_counter() - started) * 1000
+                value = (
+                    f'db;dur={stats.total * 1000:.1f};desc="{stats.count} queries", '
+                    f"db-slowest;dur={stats.slowest * 1000:.1f}, app;dur={app_ms:.1f}"
+                )
+                repeated = stats.repeated(settings.SQL_N_PLUS_ONE_THRESHOLD)
+                if repeated:
+                    value += f', db-n-plus-one;desc="{repeated[0][1]}x same select"'
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", value.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            for shape, n in stats.repeated(settings.SQL_N_PLUS_ONE_THRESHOLD):
+                logger.warning(
+                    "N+1 의심: %s %s 에서 같은 쿼리 %d번 실행: %s",
+                    scope.get("method"), scope.get("path"), n, shape[:500],
+                )
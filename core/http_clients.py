@@ -0,0 +1,96 @@
+"""
+외부 API(Google OAuth, OpenAI) 호출용 공유 HTTP 클라이언트.
+
+요청마다 클라이언트를 새로 만들면 매번 TCP+TLS 핸드셰이크를 다시 한다.
+앱 시작 시 한 번 만들고(lifespan) 종료 시 닫아서 keep-alive 커넥션 풀을 재사용한다.
+h2 패키지가 설치돼 있으면 HTTP/2 로 연결한다 (pip install "httpx[http2]").
+
+- Google OAuth: httpx.AsyncClient, 라우터에서 Depends(get_google_http_client) 로 주입
+- OpenAI: httpx.Client (분류 워커 스레드에서 동기 호출), get_openai_http_client()
+테스트에서는 app.dependency_overrides 나 set_http_clients() 로
+httpx.MockTransport 를 쓰는 클라이언트로 바꿔 끼운다.
+"""
+import importlib.util
+from typing import Optional
+
+import httpx
+
+from core.config import settings
+
+
+def http2_available() -> bool:
+    return settings.HTTP2_ENABLED and importlib.util.find_spec("h2") is not None
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def _timeout(read: float) -> httpx.Timeout:
+    return httpx.Timeout(read, connect=settings.HTTP_CONNECT_TIMEOUT)
+
+
+def create_async_client(**kwargs) -> httpx.AsyncClient:
+    kwargs.setdefault("limits", _limits())
+    kwargs.setdefault("timeout", _timeout(settings.HTTP_READ_TIMEOUT))
+    kwargs.setdefault("http2", http2_available())
+    return httpx.AsyncClient(**kwargs)
+
+
+def create_sync_client(**kwargs) -> httpx.Client:
+    kwargs.setdefault("limits", _limits())
+    kwargs.setdefault("timeout", _timeout(settings.OPENAI_TIMEOUT))
+    kwargs.setdefault("http2", http2_available())
+    return httpx.Client(**kwargs)
+
+
+_google_client: Optional[httpx.AsyncClient] = None
+_openai_client: Optional[httpx.Client] = None
+
+
+def start_http_clients() -> None:
+    """lifespan 시작 시 호출. 이미 있으면(테스트에서 주입) 그대로 둔다."""
+    global _google_client, _openai_client
+    if _google_client is None:
+        _google_client = create_async_client()
+    if _openai_client is None:
+        _openai_client = create_sync_client()
+
+
+async def close_http_clients() -> None:
+    """lifespan 종료 시 호출. 풀에 남은 커넥션을 정리한다."""
+    global _google_client, _openai_client
+    google, openai = _google_client, _openai_client
+    _google_client = _openai_client = None
+    if google is not None:
+        await google.aclose()
+    if openai is not None:
+        openai.close()
+
+
+def set_http_clients(google: Optional[httpx.AsyncClient] = None, openai: Optional[httpx.Client] = None) -> None:
+    """테스트용: 공유 클라이언트를 교체한다 (예: httpx.MockTransport 사용 클라이언트)."""
+    global _google_client, _openai_client
+    if google is not None:
+        _google_client = google
+    if openai is not None:
+        _openai_client = openai
+
+
+def get_google_http_client() -> httpx.AsyncClient:
+    """FastAPI 의존성. lifespan 없이 앱을 띄운 경우(스크립트/테스트)에도 처음 쓸 때 만든다."""
+    global _google_client
+    if _google_client is None:
+        _google_client = create_async_client()
+    return _google_client
+
+
+def get_openai_http_client() -> httpx.Client:
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = create_sync_client()
+    return _openai_client
@@ -0,0 +1,257 @@
+"""
+프로세스 내 메트릭 (Prometheus 텍스트 형식, GET /metrics).
+
+prometheus_client 없이 카운터/게이지/히스토그램만 직접 구현했다. 관측 1번은 잠금 한 번과 덧셈 몇 번이다.
+- http_request_duration_seconds / http_requests_in_flight : MetricsMiddleware (경로 템플릿별)
+- db_pool_* : instrument_pool 로 감싼 엔진의 커넥션 풀 (스크레이프 시점에 읽음) + 커넥션 획득 대기 시간
+- 분류 / OAuth 메트릭은 각 서비스 모듈에서 여기 Counter / Histogram 으로 정의한다
+
+멀티 워커(uvicorn --workers N)로 띄우면 값은 워커별이다. 로드밸런서 뒤에서는 워커마다 스크레이프한다.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Iterable, Sequence
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from starlette.routing import Match
+
+from core.config import settings
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry: list = []
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *label_values, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [f"{self.name}{_labels(self.label_names, k)} {_number(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *label_values, amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def dec(self, *label_values, amount: float = 1) -> None:
+        self.inc(*label_values, amount=-amount)
+
+    def set(self, *label_values, value: float) -> None:
+        with self._lock:
+            self._values[label_values] = value
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [f"{self.name}{_labels(self.label_names, k)} {_number(v)}" for k, v in items]
+
+
+class CallbackMetric(_Metric):
+    """값을 들고 있지 않고 스크레이프할 때 collect() 가 돌려주는 (라벨 값들, 값) 을 내보낸다 (풀/큐 상태)"""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str],
+                 collect: Callable[[], Iterable[tuple[tuple, float]]], kind: str = "gauge"):
+        super().__init__(name, help_text, labels)
+        self.kind = kind
+        self.collect = collect
+
+    def render(self) -> list[str]:
+        return self._header() + [
+            f"{self.name}{_labels(self.label_names, k)} {_number(v)}" for k, v in self.collect()
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값들 -> [버킷별 개수(+Inf 포함, 누적 아님), 합계]
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, seconds: float, *label_values) -> None:
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = self._values[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += seconds
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, (list(counts), total)) for k, (counts, total) in self._values.items())
+        lines = self._header()
+        for k, (counts, total) in items:
+            cumulative = 0
+            for bound, n in zip((*self.buckets, float("inf")), counts):
+                cumulative += n
+                le = 'le="%s"' % _number(bound)
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, k, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, k)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, k)} {cumulative}")
+        return lines
+
+
+def render() -> str:
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# --- HTTP 요청 ---
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (경로 템플릿별)", ("method", "route", "status"),
+)
+http_requests_in_flight = Gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수", ("method", "route"),
+)
+
+
+def route_label(scope) -> str:
+    """/api/reports/123 -> /api/reports/{report_id}. 맞는 경로가 없으면 'unmatched' (라벨 수 폭증 방지)"""
+    app = scope.get("app")
+    partial = None
+    for route in getattr(getattr(app, "router", None), "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            partial = route.path  # 경로는 맞고 메서드만 다름 (405)
+    return partial or "unmatched"
+
+
+class MetricsMiddleware:
+    """요청마다 경로 템플릿을 찾아 처리 중 요청 수와 처리 시간(응답 본문 전송 완료까지)을 기록한다."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            return await self.app(scope, receive, send)
+
+        method, route = scope["method"], route_label(scope)
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method, route)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec(method, route)
+            http_request_duration.observe(time.perf_counter() - started, method, route, str(status["code"]))
+
+
+# --- DB 커넥션 풀 ---
+_pools: dict[str, Engine] = {}
+
+db_pool_checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds", "커넥션 풀에서 커넥션을 얻기까지 걸린 시간 (새 커넥션 생성/pre-ping 포함)",
+    ("pool",), buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+db_pool_checkout_timeouts = Counter(
+    "db_pool_checkout_timeouts_total", "pool_timeout 안에 커넥션을 얻지 못한 횟수", ("pool",),
+)
+
+
+def _pool_values(read: Callable) -> Callable[[], list[tuple[tuple, float]]]:
+    def collect():
+        values = []
+        for name, engine in sorted(_pools.items()):
+            pool = engine.pool  # dispose() 뒤에는 새 풀 객체가 되므로 매번 엔진에서 읽는다
+            if hasattr(pool, "checkedout"):  # QueuePool 계열만 (SQLite 의 Singleton/StaticPool 은 제외)
+                values.append(((name,), read(pool)))
+        return values
+    return collect
+
+
+CallbackMetric("db_pool_size", "풀이 유지하는 커넥션 수 (pool_size)", ("pool",), _pool_values(lambda p: p.size()))
+CallbackMetric("db_pool_checked_out", "사용 중인 커넥션 수", ("pool",), _pool_values(lambda p: p.checkedout()))
+CallbackMetric("db_pool_checked_in", "풀에서 쉬고 있는 커넥션 수", ("pool",), _pool_values(lambda p: p.checkedin()))
+# QueuePool.overflow() 는 pool_size 만큼 음수에서 시작한다. 0 이하면 max_overflow 를 쓰지 않는 중
+CallbackMetric("db_pool_overflow", "pool_size 를 넘어 추가로 연 커넥션 수 (max_overflow 사용량)", ("pool",),
+               _pool_values(lambda p: max(p.overflow(), 0)))
+
+
+def instrument_pool(engine: Engine, name: str) -> None:
+    """
+    엔진의 커넥션 풀을 메트릭에 등록하고, 커넥션 획득 시간을 잰다.
+    풀 이벤트에는 '획득 시작' 시점이 없으므로 모든 커넥션 획득이 지나는 Engine.raw_connection 을 감싼다.
+    (AsyncEngine 은 .sync_engine 을 넘긴다)
+    """
+    if name in _pools:
+        return
+    _pools[name] = engine
+    raw_connection = engine.raw_connection
+
+    def timed_raw_connection(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return raw_connection(*args, **kwargs)
+        except exc.TimeoutError:
+            db_pool_checkout_timeouts.inc(name)
+            raise
+        finally:
+            db_pool_checkout_wait.observe(time.perf_counter() - started, name)
+
+    engine.raw_connection = timed_raw_connection
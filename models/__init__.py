@@ -1,5 +1,6 @@
 from .user import User
 from .region import Region
 from .crime_type import CrimeType
-from .report import Report, ReportStatus
-from .officialstat import OfficialStat  # 추가 필요
+from .report import Report, ReportStatus, ClassificationStatus
+from .officialstat import OfficialStat, ReportStat, MergedStat  # 추가 필요
+from .classification_cache import ClassificationCacheEntry
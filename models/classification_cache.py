@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, TIMESTAMP
+from sqlalchemy.sql import func
+
+from core.database import Base
+
+
+class ClassificationCacheEntry(Base):
+    """정규화한 제보 본문 해시 + crime_types 버전 -> 분류 결과"""
+    __tablename__ = "classification_cache"
+
+    content_hash = Column(String(64), primary_key=True)
+    crime_types_version = Column(String(16), primary_key=True)
+    crime_type_id = Column(Integer, nullable=False)
+    source = Column(String(10), nullable=False)  # local / llm
+    created_at = Column(TIMESTAMP, server_default=func.now())
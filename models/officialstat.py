@@ -1,10 +1,12 @@
-from sqlalchemy import Column, Integer, ForeignKey, TIMESTAMP, text
+from sqlalchemy import Column, Integer, ForeignKey, TIMESTAMP, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 
 from core.database import Base
 
-class OfficialStat(Base):
-    __tablename__ = "official_stats"
+
+class StatCountColumns:
+    """(지역, 범죄유형, 연도) 별 건수 테이블 공통 컬럼. official_stats / report_stats / merged_stats 가 같은 모양이다."""
+
     id = Column(Integer, primary_key=True,autoincrement=True)
     region_id = Column(Integer,ForeignKey("regions.id"),nullable=False)
     crime_type_id = Column(Integer,ForeignKey("crime_types.id"),nullable=True)
@@ -12,5 +14,34 @@ class OfficialStat(Base):
     count = Column(Integer,server_default="0",nullable=False)
     last_updated = Column(TIMESTAMP,server_default=text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"))
 
+
+class OfficialStat(StatCountColumns, Base):
+    """경찰청 공공데이터 건수 (CSV 적재로만 바뀐다)"""
+    __tablename__ = "official_stats"
+    # 적재 시 upsert 키 (README DDL 의 unique_stat 과 동일)
+    __table_args__ = (
+        UniqueConstraint("region_id", "crime_type_id", "year", name="unique_stat"),
+    )
+
     region = relationship("Region",back_populates="official_stat")
-    crime_type = relationship("CrimeType")
\ No newline at end of file
+    crime_type = relationship("CrimeType")
+
+
+class ReportStat(StatCountColumns, Base):
+    """승인된 제보 건수 (승인 +1, 승인 취소/삭제 -1 로 증분 유지)"""
+    __tablename__ = "report_stats"
+    __table_args__ = (
+        UniqueConstraint("region_id", "crime_type_id", "year", name="unique_report_stat"),
+    )
+
+
+class MergedStat(StatCountColumns, Base):
+    """official_stats + report_stats 를 미리 더해 둔 표 (source=merged 조회용, 두 표가 바뀔 때 같은 트랜잭션에서 갱신)"""
+    __tablename__ = "merged_stats"
+    __table_args__ = (
+        UniqueConstraint("region_id", "crime_type_id", "year", name="unique_merged_stat"),
+    )
+
+
+# 통계 API 의 source 파라미터 -> 테이블
+STAT_MODELS = {"official": OfficialStat, "reports": ReportStat, "merged": MergedStat}
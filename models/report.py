@@ -1,19 +1,44 @@
-from sqlalchemy import Column, BigInteger, Integer, String, Text, Enum, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, String, Text, Enum, TIMESTAMP, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from sqlalchemy.dialects.sqlite import DATETIME as SQLITE_DATETIME
 import enum
 from core.database import Base
 
+# SQLite 에서도 CURRENT_TIMESTAMP 와 같은 초 단위 문자열로 저장 (MySQL TIMESTAMP 와 동일한 정밀도).
+# 그래야 (created_at, id) 커서 비교가 서버 기본값으로 들어간 행과 어긋나지 않는다
+Timestamp = TIMESTAMP().with_variant(
+    SQLITE_DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite",
+)
+
 
 class ReportStatus(str, enum.Enum):
     pending = "pending"
     approved = "approved"
     rejected = "rejected"
 
+class ClassificationStatus(str, enum.Enum):
+    queued = "queued"    # AI 분류 대기 중
+    done = "done"        # AI 결과 반영 완료
+    skipped = "skipped"  # 분류기 미설정 등으로 건너뜀
+    dead = "dead"        # 재시도 초과 (dead-letter)
+
 class Report(Base):
     __tablename__ = "reports"
+    # 목록 키셋 페이지네이션 (created_at, id) 용 복합 인덱스 (필터 컬럼을 앞에 둔다)
+    __table_args__ = (
+        Index("idx_created_id", "created_at", "id"),
+        Index("idx_region_created_id", "region_id", "created_at", "id"),
+        Index("idx_crime_type_created_id", "crime_type_id", "created_at", "id"),
+        Index("idx_status_created_id", "status", "created_at", "id"),
+        # 키워드 검색용 (MySQL 전용, ngram parser 로 한국어 부분 일치)
+        Index("ft_title_content", "title", "content", mysql_prefix="FULLTEXT", mysql_with_parser="ngram")
+        .ddl_if(dialect="mysql"),
+    )
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # SQLite 는 INTEGER PRIMARY KEY 만 자동 증가하므로 variant 지정
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False)
     region_id = Column(Integer, ForeignKey("regions.id"), nullable=False)
     crime_type_id = Column(Integer, ForeignKey("crime_types.id"), nullable=False)
@@ -28,8 +53,15 @@ class Report(Base):
     crime_type = relationship("CrimeType", back_populates="reports")
 
 
-    created_at = Column(TIMESTAMP, server_default=func.now(), nullable=True)
+    created_at = Column(Timestamp, server_default=func.now(), nullable=True)
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=True)
     approved_at = Column(TIMESTAMP, nullable=True)
     rejected_at = Column(TIMESTAMP, nullable=True)
 
+    # 백그라운드 AI 분류 상태
+    classification_status = Column(Enum(ClassificationStatus), nullable=True, index=True)
+    classification_attempts = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # 낙관적 동시성 제어용 행 버전. 제보를 바꾸는 UPDATE 마다 +1, 단건 응답의 ETag 가 된다 (If-Match)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
@@ -1,18 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from core.database import get_db
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.database import get_async_db
 from services import report_service  # 아까 만든 서비스 파일
-from schemas.report import ReportResponse  # 아까 만든 스키마
-from typing import List, Optional
+from schemas.report import ReportResponse, BulkReviewRequest, BulkReviewResponse, report_response_list  # 아까 만든 스키마
+from typing import List, Literal, Optional
 from models.report import ReportStatus
+from services.dimension_cache import dimension_cache
+from services.classification_cache import classification_cache
+from services.classification_queue import classification_queue
+from services.report_search import report_search_index
+from services.auth_service import user_cache
+from services.stats_cube import stats_cubes
+from services.official_trends import trend_cache
+from services.export_service import export_response, reports_export_query
+from utils.fast_json import json_response
+from utils.pagination import NEXT_CURSOR_HEADER, InvalidCursor, next_cursor
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
 # 승인 API 엔드포인트
 @router.post("/reports/{report_id}/approve", response_model=ReportResponse)
-def approve_report(report_id: int, db: Session = Depends(get_db)):
+async def approve_report(report_id: int, db: AsyncSession = Depends(get_async_db)):
     try:
-        updated_report = report_service.update_report_status(
+        updated_report = await report_service.update_report_status(
             db=db,
             report_id=report_id,
             new_status=ReportStatus.approved
@@ -28,21 +39,93 @@ def approve_report(report_id: int, db: Session = Depends(get_db)):
     return updated_report
 
 @router.post("/reports/{report_id}/reject", response_model=ReportResponse)
-def reject_report(report_id: int, db: Session = Depends(get_db)):
+async def reject_report(report_id: int, db: AsyncSession = Depends(get_async_db)):
     try:
-        updated_report = report_service.update_report_status(db, report_id, ReportStatus.rejected)
+        updated_report = await report_service.update_report_status(db, report_id, ReportStatus.rejected)
     except ValueError as e:
         raise HTTPException(status_code=409, detail=str(e))
     if not updated_report:
         raise HTTPException(status_code=404, detail="해당 제보를 찾을 수 없습니다.")
     return updated_report
 
+# 승인/반려 취소 (pending 으로 되돌림, 승인이었으면 제보 통계 -1)
+@router.post("/reports/{report_id}/revert", response_model=ReportResponse)
+async def revert_report(report_id: int, db: AsyncSession = Depends(get_async_db)):
+    try:
+        updated_report = await report_service.revert_report_status(db, report_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if not updated_report:
+        raise HTTPException(status_code=404, detail="해당 제보를 찾을 수 없습니다.")
+    return updated_report
+
+# 일괄 승인/반려 (한 트랜잭션, 제보별 처리 결과 반환)
+@router.post("/reports/bulk", response_model=BulkReviewResponse)
+async def bulk_review_reports(body: BulkReviewRequest, db: AsyncSession = Depends(get_async_db)):
+    try:
+        return await report_service.bulk_update_report_status(db, body.ids, body.status)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
 @router.get("/reports", response_model=List[ReportResponse])
-def get_reports(
+async def get_reports(
+    response: Response,
     status: Optional[ReportStatus] = None,
     skip: int = Query(0, ge=0),              # 0보다 크거나 같아야 함
     limit: int = Query(100, ge=1, le=500),   # 1~500 사이만 허용!
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값 (지정하면 skip 무시)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        reports = await report_service.get_all_reports(db, skip=skip, limit=limit, status=status, cursor=cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    cursor_value = next_cursor(reports, limit)
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return json_response([report_service.report_response_dict(r) for r in reports], report_response_list, response)
+
+
+# 제보 전체 내보내기 (목록 API 의 limit 500 없이 서버측 커서로 스트리밍)
+@router.get("/reports/export")
+async def export_reports(
+    request: Request,
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    gzip: Optional[bool] = Query(None, description="비우면 Accept-Encoding 을 따른다"),
+    status: Optional[ReportStatus] = None,
+    region_id: Optional[int] = None,
+    crime_type_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    reports = report_service.get_all_reports(db, skip=skip, limit=limit, status=status)
-    return reports
+    stmt = reports_export_query(status, region_id, crime_type_id, created_from, created_to)
+    return export_response(request, db, stmt, fmt, "reports", gzip)
+
+# regions / crime_types 캐시 강제 갱신 (지역/범죄유형 데이터를 직접 수정한 뒤 호출)
+@router.post("/cache/dimensions/invalidate")
+def invalidate_dimension_cache():
+    dimension_cache.invalidate()
+    return {"message": "dimension cache invalidated", "stats": dimension_cache.stats()}
+
+@router.get("/cache/stats")
+def get_cache_stats():
+    return {
+        "dimensions": dimension_cache.stats(),
+        "classification": classification_cache.stats(),
+        "search_index": report_search_index.stats(),
+        "users": user_cache.stats(),
+        "stats_cube": {source: cube.stats() for source, cube in stats_cubes.items()},
+        "stats_trends": trend_cache.stats(),
+    }
+
+# AI 분류 작업 큐 상태 (큐 깊이, 처리/재시도/dead-letter 건수)
+@router.get("/classification/stats")
+def get_classification_stats():
+    return classification_queue.stats()
+
+# dead-letter 상태의 제보를 다시 분류 큐에 넣기
+@router.post("/classification/requeue-dead")
+def requeue_dead_classifications(limit: int = Query(100, ge=1, le=1000)):
+    requeued = classification_queue.requeue_dead(limit=limit)
+    return {"requeued": requeued, "stats": classification_queue.stats()}
@@ -1,16 +1,19 @@
 import logging
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from core.config import settings
 from core.database import get_db
+from core.http_clients import get_google_http_client
 from schemas.auth import UserResponse
 from services.auth_service import (
     create_or_update_google_user,
     exchange_code_for_token,
     get_google_login_url,
+    get_cached_user,
     get_google_user_info,
-    get_user_by_id,
+    invalidate_user,
 )
 
 logger = logging.getLogger(__name__)
@@ -22,7 +25,8 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> UserRes
     if not user_id:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    user = get_user_by_id(db, user_id)
+    # 캐시에 있으면 DB 를 건드리지 않는다 (세션은 쿼리 전까지 커넥션을 잡지 않음)
+    user = get_cached_user(db, user_id)
     if not user:
         request.session.clear()
         raise HTTPException(status_code=401, detail="User not found")
@@ -40,15 +44,16 @@ async def google_callback(
         request: Request,
         code: str,
         db: Session = Depends(get_db),
+        http_client: httpx.AsyncClient = Depends(get_google_http_client),
 ):
     try:
-        token_data = await exchange_code_for_token(code)
+        token_data = await exchange_code_for_token(code, http_client)
         access_token = token_data.get("access_token")
 
         if not access_token:
             raise HTTPException(status_code=400, detail="Failed to get access token")
 
-        google_user = await get_google_user_info(access_token)
+        google_user = await get_google_user_info(access_token, http_client)
         user = create_or_update_google_user(db, google_user)
 
         # 1. 세션에 ID 저장
@@ -69,5 +74,8 @@ def get_me(current_user: UserResponse = Depends(get_current_user)):
 
 @router.post("/auth/logout")
 def logout(request: Request):
+    user_id = request.session.get("user_id")
+    if user_id:
+        invalidate_user(user_id)
     request.session.clear()
     return {"message": "Logged out successfully"}
@@ -1,56 +1,243 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request, Response
 from fastapi.params import Depends
-from sqlalchemy.orm import Session,joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
-from typing import List, Optional
-from core.database import get_db
-from models.officialstat import OfficialStat
-from schemas.officialstat import CrimeStatResponse, OfficialStatRead, RegionSchema, CrimeListSchema
+from typing import List, Literal, Optional
+from core.config import settings
+from core.database import get_async_db
+from models.officialstat import STAT_MODELS
+from schemas.officialstat import (
+    CrimeStatResponse, OfficialStatRead, RegionSchema, CrimeListSchema, StatAggregateResponse,
+    StatTrendResponse, StatRankingResponse, StatBatchRequest, StatBatchResponse, StatSource, official_stat_read_list,
+)
 from services import official_service
+from services.export_service import export_response, stats_export_query
+from services.official_aggregate import AggregateError, aggregate_stats, parse_list
+from services.official_trends import stats_ranking, stats_trend
+from services.dimension_cache import get_dimensions_async
+from services.stats_version import stats_version
+from utils.fast_json import json_response
+from utils.http_cache import conditional_response, make_etag
 
 router = APIRouter(prefix="/api", tags=["OfficialStatus"])
 
+SOURCE_QUERY = Query("official", description="official: 경찰청 공공데이터 / reports: 승인된 제보 / merged: 둘의 합")
+
+async def _stats_not_modified(request: Request, response: Response, db: AsyncSession,
+                              source: str = "official") -> Optional[Response]:
+    """통계 응답용 ETag(source 표 지문 + 지역/범죄유형 버전). 클라이언트 버전과 같으면 304 응답."""
+    version = await stats_version.get(db, source)
+    dims = await get_dimensions_async(db)
+    etag = make_etag(version.etag, dims.regions_version, dims.crime_types_version)
+    return conditional_response(request, response, etag, version.last_modified, settings.STATS_HTTP_MAX_AGE)
+
 @router.get("/status",response_model=CrimeStatResponse)
-def get_stats(
+async def get_stats(
+    request: Request,
+    response: Response,
     province: str,
     city: str= None,
     major: str = None,
     minor: str = None,
     year: int = None,
-    db: Session = Depends(get_db)
+    source: StatSource = SOURCE_QUERY,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    data = official_service.fetch_official_stats(db,province,city,major, minor,year)
+    not_modified = await _stats_not_modified(request, response, db, source)
+    if not_modified:
+        return not_modified
+
+    data = await official_service.fetch_official_stats(db,province,city,major, minor,year, source)
 
     if not data:
         raise HTTPException(status_code=404, detail="데이터를 찾을 수 없습니다.")
 
     return data
 
+@router.post("/status/batch", response_model=StatBatchResponse)
+async def get_stats_batch(payload: StatBatchRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    /api/status 여러 건을 한 번에 조회한다 (SQL 2번). 결과는 선택자 key 별로, 없으면 found=false 와 reason.
+    같은 key 가 여러 번 오면 마지막 선택자의 결과가 남는다.
+    """
+    items = await official_service.fetch_official_stats_batch(db, payload.selectors, payload.source)
+    results = {sel.result_key(): item for sel, item in zip(payload.selectors, items)}
+    return {
+        "requested": len(payload.selectors),
+        "found": sum(1 for item in items if item["found"]),
+        "results": results,
+    }
+
+@router.get("/status/aggregate", response_model=StatAggregateResponse)
+async def get_stats_aggregate(
+    request: Request,
+    response: Response,
+    group_by: str = "",
+    metrics: str = "sum",
+    shape: str = "rows",
+    province: str = None,
+    city: str = None,
+    major: str = None,
+    minor: str = None,
+    year: int = None,
+    year_from: int = None,
+    year_to: int = None,
+    max_cells: Optional[int] = None,
+    source: StatSource = SOURCE_QUERY,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    source 통계 표를 DB 에서 GROUP BY 해 합계/평균/비율만 돌려준다.
+    group_by / metrics / 필터(province, city, major, minor) 는 콤마로 여러 개 지정한다.
+    예) group_by=city,year&metrics=sum,share&province=서울&year_from=2021&shape=pivot
+    """
+    not_modified = await _stats_not_modified(request, response, db, source)
+    if not_modified:
+        return not_modified
+    try:
+        return await aggregate_stats(
+            db,
+            group_by=parse_list(group_by),
+            metrics=parse_list(metrics),
+            shape=shape,
+            provinces=parse_list(province),
+            cities=parse_list(city),
+            majors=parse_list(major),
+            minors=parse_list(minor),
+            year=year,
+            year_from=year_from,
+            year_to=year_to,
+            max_cells=max_cells,
+            source=source,
+        )
+    except AggregateError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/status/export")
+async def export_stats(
+    request: Request,
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    gzip: Optional[bool] = Query(None, description="비우면 Accept-Encoding 을 따른다"),
+    province: str = None,
+    city: str = None,
+    major: str = None,
+    minor: str = None,
+    year_from: int = None,
+    year_to: int = None,
+    source: StatSource = SOURCE_QUERY,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    source 통계 표 전체(또는 필터 범위)를 한 행씩 스트리밍으로 내려준다 (/api/statusAll 대체).
+    예) format=csv&province=서울&year_from=2020
+    """
+    stmt = stats_export_query(
+        parse_list(province), parse_list(city), parse_list(major), parse_list(minor), year_from, year_to, source
+    )
+    return export_response(request, db, stmt, fmt, STAT_MODELS[source].__tablename__, gzip)
+
+def _dimension_filters(province: str, city: str, major: str, minor: str) -> dict:
+    return {
+        "province": parse_list(province),
+        "city": parse_list(city),
+        "major": parse_list(major),
+        "minor": parse_list(minor),
+    }
+
+@router.get("/status/trend", response_model=StatTrendResponse)
+async def get_stats_trend(
+    request: Request,
+    response: Response,
+    group_by: str = "",
+    province: str = None,
+    city: str = None,
+    major: str = None,
+    minor: str = None,
+    year_from: int = None,
+    year_to: int = None,
+    source: StatSource = SOURCE_QUERY,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    group_by 묶음마다 연도별 합계 시계열 (쿼리 1번).
+    예) group_by=city&province=서울&major=폭력범죄&year_from=2019
+    """
+    not_modified = await _stats_not_modified(request, response, db, source)
+    if not_modified:
+        return not_modified
+    try:
+        return await stats_trend(
+            db, parse_list(group_by), _dimension_filters(province, city, major, minor), year_from, year_to, source
+        )
+    except AggregateError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/status/ranking", response_model=StatRankingResponse)
+async def get_stats_ranking(
+    request: Request,
+    response: Response,
+    by: str = "city",
+    metric: str = "change",
+    year: int = None,
+    compare_to: int = None,
+    top: int = Query(10, ge=1, le=500),
+    order: Literal["desc", "asc"] = "desc",
+    province: str = None,
+    city: str = None,
+    major: str = None,
+    minor: str = None,
+    source: StatSource = SOURCE_QUERY,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    상위 N 순위. metric: count(해당 연도 건수) / change(compare_to 대비 증감) / change_rate(증감률)
+    예) by=city&major=폭력범죄&year=2023&compare_to=2022&metric=change&top=5
+    year 를 비우면 최신 연도, compare_to 를 비우면 전년과 비교한다.
+    """
+    not_modified = await _stats_not_modified(request, response, db, source)
+    if not_modified:
+        return not_modified
+    try:
+        return await stats_ranking(
+            db, parse_list(by), _dimension_filters(province, city, major, minor),
+            metric=metric, year=year, compare_to=compare_to, top=top, descending=order == "desc", source=source,
+        )
+    except AggregateError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/statusAll", response_model=List[OfficialStatRead])
-def get_official_stats(
+async def get_official_stats(
+        request: Request,
+        response: Response,
         region_id: Optional[int] = None,
         crime_type_id: Optional[int] = None,
         year: Optional[int] = None,
-        db: Session = Depends(get_db)
+        source: StatSource = SOURCE_QUERY,
+        db: AsyncSession = Depends(get_async_db)
 ):
-    query = db.query(OfficialStat).options(
-        joinedload(OfficialStat.region),  # Region 테이블 Join
-        joinedload(OfficialStat.crime_type)  # CrimeType 테이블 Join
-    )
+    not_modified = await _stats_not_modified(request, response, db, source)
+    if not_modified:
+        return not_modified
 
-    if region_id:
-        query = query.filter(OfficialStat.region_id == region_id)
-    if crime_type_id:
-        query = query.filter(OfficialStat.crime_type_id == crime_type_id)
-    if year:
-        query = query.filter(OfficialStat.year == year)
-
-    return query.order_by(OfficialStat.year.asc()).all()
+    rows = await official_service.fetch_all_official_stats(db, region_id, crime_type_id, year, source)
+    return json_response(rows, official_stat_read_list, response)
 
 @router.get("/regions",response_model=list[RegionSchema])
-def get_regions(province: str = None, db: Session= Depends(get_db)):
-    return official_service.fetch_regions(db,province)
+async def get_regions(request: Request, response: Response, province: str = None, db: AsyncSession = Depends(get_async_db)):
+    dims = await get_dimensions_async(db)
+    not_modified = conditional_response(
+        request, response, make_etag("regions", dims.regions_version), max_age=settings.DIMENSION_HTTP_MAX_AGE
+    )
+    if not_modified:
+        return not_modified
+    return await official_service.fetch_regions(db,province)
 
 @router.get("/crime-types",response_model=list[CrimeListSchema])
-def get_crimes(major:str = None, db:Session = Depends(get_db)):
-    return official_service.fetch_crime_types(db,major)
\ No newline at end of file
+async def get_crimes(request: Request, response: Response, major:str = None, db: AsyncSession = Depends(get_async_db)):
+    dims = await get_dimensions_async(db)
+    not_modified = conditional_response(
+        request, response, make_etag("crime_types", dims.crime_types_version), max_age=settings.DIMENSION_HTTP_MAX_AGE
+    )
+    if not_modified:
+        return not_modified
+    return await official_service.fetch_crime_types(db,major)
\ No newline at end of file
@@ -1,187 +1,241 @@
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, status,Depends,Response,Query
-from sqlalchemy.orm import Session
-from core.database import get_db
-from schemas.report import ReportRead, ReportCreate, ReportUpdate, ReportPatch
-from models import User, Region, CrimeType, Report
+import logging
+from typing import Literal, Optional, List, Union
+from fastapi import APIRouter, HTTPException, status,Depends,Response,Query,Header
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.config import settings
+from core.database import get_async_db
+from schemas.report import (
+    ReportRead, ReportSummary, ReportCreate, ReportUpdate, ReportPatch, report_read_list, report_summary_list,
+)
+from models import User, Region, CrimeType, Report, ClassificationStatus
 from sqlalchemy.orm import joinedload
-from sqlalchemy import desc, or_
-from services.ai_crime_classifier import classify_crime_type
+from sqlalchemy import select
+from services.ai_crime_classifier import classify_locally, get_llm_backend
+from services.dimension_cache import get_dimensions_async
+from services.classification_cache import classification_cache
+from services.classification_queue import classification_queue
+from services import report_search, report_service
+from utils.fast_json import json_response
+from utils.http_cache import parse_if_match, version_etag
+from utils.pagination import NEXT_CURSOR_HEADER, InvalidCursor, apply_keyset, next_cursor
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/reports", tags=["Reports"])
 
+
+async def _load_report(db: AsyncSession, report_id: int) -> Optional[Report]:
+    # 응답(ReportRead)에 필요한 region / crime_type 을 함께 로드 (async 세션은 lazy load 불가)
+    return await db.scalar(
+        select(Report)
+        .options(joinedload(Report.region), joinedload(Report.crime_type))
+        .where(Report.id == report_id)
+        .execution_options(populate_existing=True)
+    )
+
+
+async def _write_report(write, error_detail: str):
+    """수정/삭제 서비스 호출의 예외 -> HTTP 상태 (If-Match 불일치 412, 동시 수정 409, 그 밖 500)"""
+    try:
+        return await write
+    except report_service.VersionMismatch as e:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception:
+        logger.exception("report write failed")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_detail)
+
+
+async def _written_response(db: AsyncSession, row, response: Response) -> dict:
+    # UPDATE 가 돌려준 행으로 검색 색인과 응답을 만든다 (다시 읽지 않음)
+    report_search.index_report(row)
+    response.headers["ETag"] = version_etag(row.version)
+    return await report_service.report_write_dict(db, row)
+
 # 1. 제보 목록 (필터링/페이징)
-@router.get("", response_model=List[ReportRead])
+@router.get("", response_model=Union[List[ReportRead], List[ReportSummary]])
 async def get_reports(
+        response: Response,
         region_id: Optional[int] = Query(None),
         crime_type_id: Optional[int] = Query(None),
         skip: int = 0,
         limit: int = 10,
+        cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값 (지정하면 skip 무시)"),
         keyword: Optional[str] = Query(None, description="검색 키워드(제목/내용)"),
-        sort_by: str = Query("latest", description="정렬 기준: latest(최신순), oldest(오래된순)"),
-        db: Session = Depends(get_db)
+        sort_by: str = Query("latest", description="정렬 기준: latest(최신순), oldest(오래된순), relevance(검색 관련도순, keyword 필요)"),
+        view: Literal["full", "summary"] = Query("full", description="summary: content 대신 앞부분 snippet (게시판 목록용)"),
+        db: AsyncSession = Depends(get_async_db)
 ):
-    # 1. 쿼리 시작 (joinedload를 통해 연관 테이블을 미리 로드)
-    query = db.query(Report).options(
-        joinedload(Report.region),
-        joinedload(Report.crime_type)
-    )
+    # 1. 쿼리 시작 (ORM 객체 대신 응답에 필요한 컬럼만)
+    #    full: region / crime_type 을 JOIN, summary: content 앞부분만 + 지역/유형 이름은 차원 캐시에서
+    if view == "summary":
+        query = report_service.report_summary_query(settings.REPORT_SNIPPET_LENGTH)
+    else:
+        query = report_service.report_read_query()
     # 2. 필터링
     if region_id:
-        query = query.filter(Report.region_id == region_id)
+        query = query.where(Report.region_id == region_id)
     if crime_type_id:
-        query = query.filter(Report.crime_type_id == crime_type_id)
+        query = query.where(Report.crime_type_id == crime_type_id)
 
-    # 2. 키워드 검색 (제목 또는 내용에 포함된 경우)
-    if keyword:
-            search_filter = or_(
-                Report.title.contains(keyword),
-                Report.content.contains(keyword)
-            )
-            query = query.filter(search_filter)
+    # 3. 정렬 및 페이지네이션 ((created_at, id) 순서, cursor 가 있으면 키셋, 없으면 기존 offset)
+    if sort_by == "relevance" and not keyword:
+        sort_by = "latest"
+    if sort_by == "relevance" and cursor:
+        raise HTTPException(status_code=400, detail="relevance 정렬은 cursor 대신 skip 을 사용합니다.")
+    descending = sort_by != "oldest"
 
+    def apply_order(q):
+        q = apply_keyset(q, Report.created_at, Report.id, cursor, descending)
+        return q if cursor else q.offset(skip)
 
-    # 3. 정렬 및 페이지네이션
-    if sort_by == "latest":
-        query = query.order_by(desc(Report.created_at))
-    else:
-        query = query.order_by(Report.created_at.asc())
-
-    reports = query.offset(skip).limit(limit).all()
-    return reports
+    try:
+        if keyword:
+            # 4. 키워드 검색 (MySQL FULLTEXT / 내장 역색인, 관련도순 정렬 가능)
+            rows = await report_search.search_reports(
+                db, query, keyword, region_id, crime_type_id, sort_by, skip, limit, cursor, apply_order
+            )
+        else:
+            rows = (await db.execute(apply_order(query).limit(limit))).all()
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if sort_by != "relevance":
+        cursor_value = next_cursor(rows, limit, descending)
+        if cursor_value:
+            response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    # 5. Pydantic 검증 없이 바로 JSON bytes 로 (response_model 은 문서용)
+    if view == "summary":
+        items = await report_service.report_summary_dicts(db, rows, settings.REPORT_SNIPPET_LENGTH)
+        return json_response(items, report_summary_list, response)
+    return json_response([report_service.report_read_dict(r) for r in rows], report_read_list, response)
 
 # 2. 제보 단건
 @router.get("/{report_id}", response_model=ReportRead)
 async def get_report(
     report_id: int,
-     db: Session = Depends(get_db)):
+    response: Response,
+     db: AsyncSession = Depends(get_async_db)):
     try:
-        report = db.query(Report) \
-            .options(joinedload(Report.user), joinedload(Report.region)) \
-            .filter(Report.id == report_id) \
-            .first()
+        report = await _load_report(db, report_id)
+        if not report:
+            raise HTTPException(status_code=404, detail="제보를 찾을 수 없습니다.")
+        # 수정/삭제 요청의 If-Match 에 그대로 쓰는 행 버전
+        response.headers["ETag"] = version_etag(report.version)
         return report
     except HTTPException:
         raise
-    except Exception as e:
-       print(f"Service Error: {e}")
-       raise HTTPException(status_code=500, detail="Internal Server Error")
+    except Exception:
+        logger.exception("report read failed")
+        raise HTTPException(status_code=500, detail="Internal Server Error")
 
 # 3. 제보 작성
 @router.post("", response_model=ReportRead, status_code=status.HTTP_201_CREATED)
 async def create_report(
         report_data: ReportCreate,
-        db: Session = Depends(get_db)
+        response: Response,
+        db: AsyncSession = Depends(get_async_db)
 ):
     # 1. (선택사항) foreign key 객체들이 실제로 존재하는지 체크하면 더 안전합니다.
-    # region = db.query(Region).filter(Region.id == report_data.region_id).first()
+    # region = await db.get(Region, report_data.region_id)
     # if not region: raise HTTPException(status_code=400, detail="Invalid region_id")
 
-    # AI가 content를 분석하여 crime_type_id 덮어쓰기
-    ai_crime_type_id = classify_crime_type(db, report_data.content)
-    if ai_crime_type_id is not None:
-        report_data.crime_type_id = ai_crime_type_id
-
     new_report = Report(**report_data.model_dump())
+
+    # 같은 본문을 분류한 적이 있거나 로컬 분류기가 확신하면 바로 반영하고,
+    # 아니면 사용자가 고른 crime_type_id 로 먼저 저장한 뒤 AI(LLM) 분류는 백그라운드에서 나중에 반영한다
+    dims = await get_dimensions_async(db)
+    known_crime_type_id = classification_cache.peek(report_data.content, dims.crime_types_version)
+    if known_crime_type_id is None:
+        known_crime_type_id = classify_locally(dims, report_data.content)
+    if known_crime_type_id is not None:
+        new_report.crime_type_id = known_crime_type_id
+        new_report.classification_status = ClassificationStatus.done
+    elif get_llm_backend() is not None:
+        new_report.classification_status = ClassificationStatus.queued
+    else:
+        new_report.classification_status = ClassificationStatus.skipped
     try:
         # 3. DB에 저장
         db.add(new_report)
-        db.commit()  # DB에 반영
-        db.refresh(new_report)  # 생성된 ID나 created_at 등을 다시 불러오기
-        return new_report
+        await db.commit()  # DB에 반영
+        # 생성된 ID나 created_at, 응답용 region/crime_type 을 다시 불러오기
+        new_report = await _load_report(db, new_report.id)
+        report_search.index_report(new_report)
     except Exception as e:
-        db.rollback()  # 에러 발생 시 되돌리기
+        await db.rollback()  # 에러 발생 시 되돌리기
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"제보 저장 중 오류가 발생했습니다: {str(e)}"
         )
 
+    if new_report.classification_status == ClassificationStatus.queued:
+        classification_queue.submit(new_report.id)
+    response.headers["ETag"] = version_etag(new_report.version)
+    return new_report
+
 # 4. 제보 수정 - put 전체 수정
 @router.put("/{report_id}", response_model=ReportRead)
 async def update_report(
         report_id: int,
         update_data: ReportUpdate,
-        db: Session = Depends(get_db)
+        response: Response,
+        if_match: Optional[str] = Header(None, description="단건 응답의 ETag. 주면 그 사이 바뀐 제보는 412 로 거절"),
+        db: AsyncSession = Depends(get_async_db)
 ):
-    # 1. 수정할 기존 제보가 있는지 먼저 확인
-    db_report = db.query(Report).filter(Report.id == report_id).first()
-
-    if not db_report:
+    # 먼저 읽지 않고 UPDATE ... WHERE id = ? 한 문장으로 바꾸고, 바뀐 행을 그대로 응답한다
+    # (승인된 제보의 지역/범죄유형이 바뀌면 서비스가 제보 통계도 옮긴다)
+    row = await _write_report(
+        report_service.update_report_fields(db, report_id, update_data.model_dump(), parse_if_match(if_match)),
+        "수정 중 오류가 발생했습니다.",
+    )
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID {report_id}에 해당하는 제보를 찾을 수 없습니다."
         )
-
-    # 2. 데이터 업데이트
-    # model_dump()를 사용해 딕셔너리로 변환 후 반복문으로 값을 교체합니다.
-    update_dict = update_data.model_dump()
-    for key, value in update_dict.items():
-        setattr(db_report, key, value)
-
-    try:
-        # 3. DB 반영
-        db.commit()
-        db.refresh(db_report)
-        return db_report
-
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="수정 중 오류가 발생했습니다."
-        )
+    return await _written_response(db, row, response)
 
 # 4. 제보 수정 - patch 일부 수정
 @router.patch("/{report_id}", response_model=ReportRead)
 async def patch_report(
         report_id: int,
         patch_data: ReportPatch,
-        db: Session = Depends(get_db)
+        response: Response,
+        if_match: Optional[str] = Header(None, description="단건 응답의 ETag. 주면 그 사이 바뀐 제보는 412 로 거절"),
+        db: AsyncSession = Depends(get_async_db)
 ):
-    # 1. 기존 데이터 조회
-    db_report = db.query(Report).filter(Report.id == report_id).first()
-
-    if not db_report:
-        raise HTTPException(status_code=404, detail="제보를 찾을 수 없습니다.")
-
-    # 2. 실제로 전송된 데이터만 추출 (None으로 설정된 값은 제외)
+    # 실제로 전송된 데이터만 추출 (None으로 설정된 값은 제외)
     # exclude_unset=True: 클라이언트가 명시적으로 보낸 필드만 딕셔너리에 포함됨
-    update_data = patch_data.model_dump(exclude_unset=True)
-
-    for key, value in update_data.items():
-        setattr(db_report, key, value)
-    try:
-        db.commit()
-        db.refresh(db_report)
-        return db_report
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail="부분 수정 중 오류 발생")
+    row = await _write_report(
+        report_service.update_report_fields(
+            db, report_id, patch_data.model_dump(exclude_unset=True), parse_if_match(if_match)
+        ),
+        "부분 수정 중 오류 발생",
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="제보를 찾을 수 없습니다.")
+    return await _written_response(db, row, response)
 
 # 5. 제보 삭제
 @router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_report(
         report_id: int,
-        db: Session = Depends(get_db)
+        if_match: Optional[str] = Header(None, description="단건 응답의 ETag. 주면 그 사이 바뀐 제보는 412 로 거절"),
+        db: AsyncSession = Depends(get_async_db)
 ):
-    # 1. 삭제할 데이터가 존재하는지 먼저 확인
-    db_report = db.query(Report).filter(Report.id == report_id).first()
-
-    if not db_report:
+    # DELETE ... WHERE id = ? 한 문장, 지운 행이 없으면 404 (승인된 제보였으면 서비스가 제보 통계 -1)
+    deleted = await _write_report(
+        report_service.delete_report(db, report_id, parse_if_match(if_match)),
+        "삭제 중 오류가 발생했습니다.",
+    )
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID {report_id}에 해당하는 제보를 찾을 수 없어 삭제가 불가능합니다."
         )
-    try:
-        # 2. 데이터 삭제 실행
-        db.delete(db_report)
-        db.commit()
-        # 3. 204 No Content 응답 (삭제 성공 시 보통 본문을 비워서 보냅니다)
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    report_search.unindex_report(report_id)
+    # 204 No Content 응답 (삭제 성공 시 보통 본문을 비워서 보냅니다)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"삭제 중 오류가 발생했습니다: {str(e)}"
-        )
@@ -1,15 +1,41 @@
-from fastapi import FastAPI, Depends
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
+from core.config import settings
 from core.database import get_db
-from models import Region, CrimeType
+from core.db_instrumentation import SQLTimingMiddleware
+from core import metrics
+from core.http_clients import start_http_clients, close_http_clients
+from services.dimension_cache import get_dimensions
+from services.classification_queue import classification_queue
+from services.ai_crime_classifier import reset_llm_backend
 from router import report_router, official_router, auth_router
 from router.admin_router import router as admin_router
 from schemas.schema import CrimeTypeOut
 from typing import List
+from utils.http_cache import conditional_response, make_etag
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Google OAuth / OpenAI 공유 HTTP 클라이언트 (keep-alive 커넥션 풀)
+    start_http_clients()
+    # AI 분류 워커 시작 + 재시작 전에 남아있던 queued 제보 다시 넣기
+    classification_queue.start()
+    try:
+        classification_queue.recover()
+    except Exception:
+        logger.exception("분류 큐 복구 실패")
+    yield
+    classification_queue.stop()
+    reset_llm_backend()
+    await close_http_clients()
+
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(
     SessionMiddleware,
     secret_key="your-very-secret-key-here",
@@ -24,7 +50,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # GET, POST, PUT, DELETE 등 모두 허용
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],  # 목록 API 의 다음 페이지 커서, 조건부 요청
 )
+# 요청별 쿼리 수 / DB 시간을 Server-Timing 헤더로 (세션/CORS 까지 포함한 시간을 잰다)
+app.add_middleware(SQLTimingMiddleware)
+# 경로별 지연 히스토그램 / 처리 중 요청 수 (GET /metrics)
+# 나중에 추가한 미들웨어가 바깥을 감싸므로 가장 바깥은 이 미들웨어, 그 안쪽이 SQLTimingMiddleware 다
+app.add_middleware(metrics.MetricsMiddleware)
 app.include_router(report_router.router)
 
 app.include_router(official_router.router)
@@ -37,16 +69,25 @@ app.include_router(admin_router)
 async def read_root():
     return {"root": "루트입니다"}
 
+# Prometheus 스크레이프용 (로드밸런서 밖으로는 노출하지 않는다)
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404)
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
+
 @app.get("/api/regions", tags=["Default"])
-def get_regions(db: Session = Depends(get_db)):
-    return db.query(Region).all()
+def get_regions(request: Request, response: Response, db: Session = Depends(get_db)):
+    dims = get_dimensions(db)
+    not_modified = conditional_response(
+        request, response, make_etag("regions", dims.regions_version), max_age=settings.DIMENSION_HTTP_MAX_AGE
+    )
+    return not_modified or dims.regions
 
 @app.get("/api/crime-type",response_model=List[CrimeTypeOut], tags=["Default"])
-def get_crime_types(db: Session = Depends(get_db)):
-    data = db.query(CrimeType).all()
-
-    # 디버깅: 여기서 실제 데이터가 있는지 확인 (터미널 로그 확인)
-    if data:
-        print(f"DEBUG: DB에서 가져온 첫 데이터: {data[0].id}, {data[0].major}, {data[0].minor}")
-
-    return data
+def get_crime_types(request: Request, response: Response, db: Session = Depends(get_db)):
+    dims = get_dimensions(db)
+    not_modified = conditional_response(
+        request, response, make_etag("crime_types", dims.crime_types_version), max_age=settings.DIMENSION_HTTP_MAX_AGE
+    )
+    return not_modified or dims.crime_types
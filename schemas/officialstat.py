@@ -1,7 +1,11 @@
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
-from schemas.report import RegionSimple, CrimeTypeSimple
+from typing import Literal, Optional, Union
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import TypedDict
+from schemas.report import RegionSimple, CrimeTypeSimple, RegionSimpleDict, CrimeTypeSimpleDict
+
+# 통계 API 의 source: official(경찰청 공공데이터) / reports(승인된 제보) / merged(둘의 합)
+StatSource = Literal["official", "reports", "merged"]
 
 
 class RegionSchema(BaseModel):
@@ -56,4 +60,99 @@ class OfficialStatRead(OfficialStatBase):
     crime_type: CrimeTypeSimple
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# /api/statusAll 빠른 경로(utils.fast_json)용 행 모양 (OfficialStatRead 의 JSON 출력과 같은 필드/순서)
+class OfficialStatReadDict(TypedDict):
+    region_id: int
+    crime_type_id: Optional[int]
+    count: int
+    year: int
+    id: int
+    region: RegionSimpleDict
+    crime_type: Optional[CrimeTypeSimpleDict]
+
+official_stat_read_list = TypeAdapter(list[OfficialStatReadDict])
+
+# 서버측 집계 (/api/status/aggregate)
+class StatAggregateRow(BaseModel):
+    keys: dict[str, Optional[Union[int, str]]]
+    sum: Optional[int] = None
+    avg: Optional[float] = None
+    share: Optional[float] = None
+
+class StatPivot(BaseModel):
+    metric: str
+    row_dims: list[str]
+    col_dims: list[str]
+    row_keys: list[dict[str, Optional[Union[int, str]]]]
+    col_keys: list[dict[str, Optional[Union[int, str]]]]
+    values: list[list[Optional[Union[int, float]]]]
+
+class StatAggregateResponse(BaseModel):
+    group_by: list[str]
+    metrics: list[str]
+    shape: str
+    total: int
+    groups: int
+    rows: Optional[list[StatAggregateRow]] = None
+    pivot: Optional[StatPivot] = None
+
+# 연도별 추이 / 순위 (/api/status/trend, /api/status/ranking)
+class StatTrendSeries(BaseModel):
+    keys: dict[str, Optional[Union[int, str]]]
+    values: list[Optional[int]]
+
+class StatTrendResponse(BaseModel):
+    group_by: list[str]
+    years: list[int]
+    series: list[StatTrendSeries]
+
+class StatRankingItem(BaseModel):
+    rank: int
+    keys: dict[str, Optional[Union[int, str]]]
+    count: int
+    previous: Optional[int] = None
+    change: Optional[int] = None
+    change_rate: Optional[float] = None
+
+class StatRankingResponse(BaseModel):
+    by: list[str]
+    metric: str
+    year: Optional[int] = None
+    compare_to: Optional[int] = None
+    items: list[StatRankingItem]
+
+# 여러 지역/연도/범죄유형 통계 한 번에 조회 (/api/status/batch)
+class StatSelector(BaseModel):
+    province: str
+    city: Optional[str] = None
+    major: Optional[str] = None
+    minor: Optional[str] = None
+    year: Optional[int] = None
+    # 응답에서 이 선택자를 찾을 키. 비우면 "province city|major|minor|year" (빈 값은 *)
+    key: Optional[str] = None
+
+    def result_key(self) -> str:
+        if self.key:
+            return self.key
+        region = f"{self.province} {self.city}" if self.city else self.province
+        return "|".join(str(v) if v is not None else "*" for v in (region, self.major, self.minor, self.year))
+
+class StatBatchRequest(BaseModel):
+    selectors: list[StatSelector] = Field(..., min_length=1, max_length=500)
+    source: StatSource = "official"
+
+class StatBatchItem(BaseModel):
+    found: bool
+    # region_not_found / no_data
+    reason: Optional[str] = None
+    region: Optional[str] = None
+    year: Optional[int] = None
+    last_updated: Optional[datetime] = None
+    statistics: list[CrimeStatDetail] = []
+
+class StatBatchResponse(BaseModel):
+    requested: int
+    found: int
+    results: dict[str, StatBatchItem]
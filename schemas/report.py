@@ -1,6 +1,7 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
+from typing_extensions import TypedDict
 from models.report import ReportStatus
 
 class ReportCreate(BaseModel):
@@ -34,6 +35,17 @@ class ReportRead(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+# 게시판 목록용 (GET /api/reports?view=summary): content 대신 앞부분 snippet
+class ReportSummary(BaseModel):
+    id: int
+    title: str
+    snippet: str
+    status: ReportStatus
+    region: RegionSimple
+    crime_type: CrimeTypeSimple
+    user_id: int
+    created_at: datetime
+
 class ReportUpdate(BaseModel):
     title: str
     content: str
@@ -61,3 +73,71 @@ class ReportResponse(ReportBase):
     rejected_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# 목록 API 빠른 경로(utils.fast_json)용 행 모양. 필드 이름/순서가 위 모델의 JSON 출력과 같다
+# (pydantic 은 Python 3.12 미만에서 typing_extensions.TypedDict 를 요구한다)
+class RegionSimpleDict(TypedDict):
+    id: int
+    province: str
+    city: Optional[str]
+
+class CrimeTypeSimpleDict(TypedDict):
+    id: int
+    major: str
+    minor: Optional[str]
+
+class ReportReadDict(TypedDict):
+    id: int
+    title: str
+    content: str
+    status: ReportStatus
+    region: RegionSimpleDict
+    crime_type: CrimeTypeSimpleDict
+    user_id: int
+    created_at: datetime
+
+class ReportSummaryDict(TypedDict):
+    id: int
+    title: str
+    snippet: str
+    status: ReportStatus
+    region: RegionSimpleDict
+    crime_type: CrimeTypeSimpleDict
+    user_id: int
+    created_at: datetime
+
+class ReportResponseDict(TypedDict):
+    title: str
+    content: str
+    region_id: int
+    crime_type_id: int
+    id: int
+    user_id: int
+    status: ReportStatus
+    created_at: datetime
+    approved_at: Optional[datetime]
+    rejected_at: Optional[datetime]
+
+# 스키마 생성/직렬화기 컴파일은 import 때 한 번만
+report_read_list = TypeAdapter(list[ReportReadDict])
+report_summary_list = TypeAdapter(list[ReportSummaryDict])
+report_response_list = TypeAdapter(list[ReportResponseDict])
+
+
+# 관리자 일괄 승인/반려
+class BulkReviewRequest(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=1000)
+    status: Literal[ReportStatus.approved, ReportStatus.rejected]
+
+class BulkReviewResult(BaseModel):
+    id: int
+    # approved / rejected: 이번 요청으로 변경됨, not_found: 없는 제보, already_processed: 이미 승인/반려된 제보
+    outcome: Literal["approved", "rejected", "not_found", "already_processed"]
+    status: Optional[ReportStatus] = None
+
+class BulkReviewResponse(BaseModel):
+    requested: int
+    updated: int
+    stat_groups: int
+    results: list[BulkReviewResult]
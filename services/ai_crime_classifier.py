@@ -1,33 +1,39 @@
 import json
 import logging
+import random
+import threading
+import time
+from typing import Optional, Sequence
 from openai import OpenAI
-from sqlalchemy.orm import Session
 from core.config import settings
-from models.crime_type import CrimeType
+from core.http_clients import get_openai_http_client
+from core.metrics import Histogram
+from services.dimension_cache import CrimeTypeRow, DimensionSnapshot
+from services.local_crime_classifier import get_local_classifier
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = "너는 범죄 유형 분류 전문가야. 숫자만 응답해."
 
-def classify_crime_type(db: Session, content: str) -> int | None:
-    """
-    제보 content를 AI가 분석하여 가장 적합한 crime_type_id를 반환한다.
-    실패 시 None을 반환한다.
-    """
-    if not settings.OPENAI_API_KEY:
-        logger.warning("OPENAI_API_KEY가 설정되지 않아 AI 분류를 건너뜁니다.")
-        return None
 
-    crime_types = db.query(CrimeType).all()
-    if not crime_types:
-        logger.warning("crime_types 테이블이 비어있어 AI 분류를 건너뜁니다.")
-        return None
+# backend: OpenAIBackend / FakeLLMBackend, outcome: ok / invalid(잘못된 응답) / error(네트워크, 타임아웃 등)
+llm_request_duration = Histogram(
+    "classification_llm_request_duration_seconds", "LLM 분류 요청 시간", ("backend", "outcome"),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0),
+)
+
+
+class ClassificationError(Exception):
+    """LLM 응답이 올바른 crime_type_id가 아닐 때 (재시도해도 의미 없는 실패)"""
 
+
+def build_prompt(crime_types: Sequence[CrimeTypeRow], content: str) -> str:
     crime_list = json.dumps(
         [{"id": ct.id, "major": ct.major, "minor": ct.minor} for ct in crime_types],
         ensure_ascii=False
     )
 
-    prompt = f"""아래는 범죄 제보 내용입니다. 가장 적합한 범죄 유형의 id를 골라주세요.
+    return f"""아래는 범죄 제보 내용입니다. 가장 적합한 범죄 유형의 id를 골라주세요.
 
 ## 범죄 유형 목록
 {crime_list}
@@ -41,28 +47,135 @@ def classify_crime_type(db: Session, content: str) -> int | None:
 - 판단이 어려우면 가장 가까운 유형의 id를 선택하세요.
 """
 
-    try:
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
+
+class OpenAIBackend:
+    """gpt-4o-mini 로 분류하는 실제 백엔드 (공유 httpx.Client 커넥션 풀 사용)"""
+
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini", http_client=None):
+        self.client = OpenAI(
+            api_key=api_key,
+            http_client=http_client or get_openai_http_client(),
+            max_retries=settings.OPENAI_MAX_RETRIES,
+        )
+        self.model = model
+
+    def answer(self, crime_types: Sequence[CrimeTypeRow], content: str) -> str:
+        response = self.client.chat.completions.create(
+            model=self.model,
             messages=[
-                {"role": "system", "content": "너는 범죄 유형 분류 전문가야. 숫자만 응답해."},
-                {"role": "user", "content": prompt}
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": build_prompt(crime_types, content)}
             ],
             max_tokens=10,
             temperature=0
         )
+        return response.choices[0].message.content.strip()
+
+
+class FakeLLMBackend:
+    """
+    오프라인 테스트/부하 테스트용 가짜 LLM.
+    본문에 중분류/대분류 이름이 들어 있으면 그 id를, 없으면 첫 번째 id를 답한다.
+    latency_ms 만큼 대기하고 failure_rate 확률로 예외를 던진다.
+    """
+
+    def __init__(self, latency_ms: float = 0, failure_rate: float = 0.0):
+        self.latency_ms = latency_ms
+        self.failure_rate = failure_rate
+
+    def answer(self, crime_types: Sequence[CrimeTypeRow], content: str) -> str:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise RuntimeError("fake LLM failure")
+
+        for ct in crime_types:
+            if ct.minor and ct.minor in content:
+                return str(ct.id)
+        for ct in crime_types:
+            if ct.major in content:
+                return str(ct.id)
+        return str(crime_types[0].id)
+
+
+_backend = None
+
+
+def get_llm_backend():
+    """설정에 맞는 LLM 백엔드를 돌려준다. 사용할 수 없으면 None."""
+    global _backend
+    if _backend is not None:
+        return _backend
+
+    if settings.CLASSIFIER_BACKEND == "fake":
+        _backend = FakeLLMBackend(
+            latency_ms=settings.FAKE_LLM_LATENCY_MS,
+            failure_rate=settings.FAKE_LLM_FAILURE_RATE,
+        )
+    elif settings.OPENAI_API_KEY:
+        _backend = OpenAIBackend(api_key=settings.OPENAI_API_KEY)
+    return _backend
+
 
-        ai_answer = response.choices[0].message.content.strip()
-        crime_type_id = int(ai_answer)
+def reset_llm_backend() -> None:
+    """공유 HTTP 클라이언트가 바뀌었을 때(앱 종료/테스트) 다음 호출에서 백엔드를 다시 만든다."""
+    global _backend
+    _backend = None
 
-        valid_ids = {ct.id for ct in crime_types}
-        if crime_type_id not in valid_ids:
-            logger.warning(f"AI가 반환한 ID({crime_type_id})가 유효하지 않습니다.")
-            return None
 
+def request_crime_type_id(crime_types: Sequence[CrimeTypeRow], content: str, backend) -> int:
+    """
+    백엔드에 분류를 요청한다.
+    네트워크 등 일시적 오류는 그대로 raise 하고, 잘못된 응답은 ClassificationError 로 알린다.
+    """
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        ai_answer = backend.answer(crime_types, content)
+        outcome = "invalid"
+        try:
+            crime_type_id = int(ai_answer)
+        except ValueError:
+            raise ClassificationError(f"AI 응답을 숫자로 해석할 수 없습니다: {ai_answer!r}")
+
+        if crime_type_id not in {ct.id for ct in crime_types}:
+            raise ClassificationError(f"AI가 반환한 ID({crime_type_id})가 유효하지 않습니다.")
+        outcome = "ok"
         return crime_type_id
+    finally:
+        llm_request_duration.observe(time.perf_counter() - started, type(backend).__name__, outcome)
+
+
+# 로컬 분류기 단계 집계 (answered: LLM 호출 없이 처리, fell_through: LLM 으로 넘김)
+# 요청 스레드들이 함께 올리고 /metrics 카운터로 내보내므로 += 는 락 안에서 한다
+_local_stage_stats = {"answered": 0, "fell_through": 0}
+_local_stage_lock = threading.Lock()
 
-    except Exception as e:
-        logger.error(f"AI 범죄유형 분류 중 오류 발생: {e}")
+
+def _count_local_stage(result: str) -> None:
+    with _local_stage_lock:
+        _local_stage_stats[result] += 1
+
+
+def local_stage_counts() -> dict:
+    """_local_stage_stats 의 일관된 사본"""
+    with _local_stage_lock:
+        return dict(_local_stage_stats)
+
+
+def classify_locally(dims: DimensionSnapshot, content: str) -> Optional[int]:
+    """
+    로컬 키워드 분류기로 먼저 판단한다.
+    확신도가 LOCAL_CLASSIFIER_THRESHOLD 이상일 때만 id를 돌려주고, 아니면 None (LLM 단계로).
+    """
+    if not settings.LOCAL_CLASSIFIER_ENABLED or not dims.crime_types:
         return None
+
+    classifier = get_local_classifier(dims.crime_types, dims.crime_types_version)
+    crime_type_id, confidence = classifier.predict(content)
+    if crime_type_id is not None and confidence >= settings.LOCAL_CLASSIFIER_THRESHOLD:
+        _count_local_stage("answered")
+        return crime_type_id
+
+    _count_local_stage("fell_through")
+    return None
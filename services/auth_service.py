@@ -1,18 +1,30 @@
-from typing import Optional
+import time
+from typing import Awaitable, Callable, Optional
 from urllib.parse import urlencode
 
 import httpx
 from sqlalchemy.orm import Session
 
 from core.config import settings
+from core.metrics import Histogram
 from models.user import User
-from schemas.auth import GoogleUserInfo
+from schemas.auth import GoogleUserInfo, UserResponse
+from utils.cache import LRUCache
 
 
 GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
 
+# call: token(코드 교환) / userinfo, outcome: HTTP 상태 코드 또는 error(연결 실패/타임아웃)
+oauth_upstream_duration = Histogram(
+    "oauth_upstream_duration_seconds", "Google OAuth 외부 호출 시간", ("call", "outcome"),
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+# 세션 user_id -> UserResponse. 역할/이메일은 거의 바뀌지 않으므로 짧은 TTL 로 인증 요청마다의 DB 조회를 없앤다
+user_cache = LRUCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
+
 
 def get_google_login_url() -> str:
     params = {
@@ -26,36 +38,46 @@ def get_google_login_url() -> str:
     return f"{GOOGLE_AUTH_URL}?{urlencode(params)}"
 
 
-async def exchange_code_for_token(code: str) -> dict:
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            GOOGLE_TOKEN_URL,
-            data={
-                "client_id": settings.GOOGLE_CLIENT_ID,
-                "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                "code": code,
-                "grant_type": "authorization_code",
-                "redirect_uri": settings.GOOGLE_REDIRECT_URI,
-            },
-        )
-        response.raise_for_status()
-        return response.json()
-
-
-async def get_google_user_info(access_token: str) -> GoogleUserInfo:
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            GOOGLE_USERINFO_URL,
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-        response.raise_for_status()
-        data = response.json()
-        return GoogleUserInfo(
-            id=data["id"],
-            email=data["email"],
-            name=data.get("name", data["email"].split("@")[0]),
-            picture=data.get("picture"),
-        )
+async def _timed(call: str, request: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        response = await request()
+        outcome = str(response.status_code)
+        return response
+    finally:
+        oauth_upstream_duration.observe(time.perf_counter() - started, call, outcome)
+
+
+# client 는 앱 수명 동안 공유되는 httpx.AsyncClient (core.http_clients). 여기서 닫지 않는다.
+async def exchange_code_for_token(code: str, client: httpx.AsyncClient) -> dict:
+    response = await _timed("token", lambda: client.post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "client_id": settings.GOOGLE_CLIENT_ID,
+            "client_secret": settings.GOOGLE_CLIENT_SECRET,
+            "code": code,
+            "grant_type": "authorization_code",
+            "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+        },
+    ))
+    response.raise_for_status()
+    return response.json()
+
+
+async def get_google_user_info(access_token: str, client: httpx.AsyncClient) -> GoogleUserInfo:
+    response = await _timed("userinfo", lambda: client.get(
+        GOOGLE_USERINFO_URL,
+        headers={"Authorization": f"Bearer {access_token}"},
+    ))
+    response.raise_for_status()
+    data = response.json()
+    return GoogleUserInfo(
+        id=data["id"],
+        email=data["email"],
+        name=data.get("name", data["email"].split("@")[0]),
+        picture=data.get("picture"),
+    )
 
 
 def get_user_by_google_id(db: Session, google_id: str) -> Optional[User]:
@@ -70,6 +92,23 @@ def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
 
 
+def get_cached_user(db: Session, user_id: int) -> Optional[UserResponse]:
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    db_user = get_user_by_id(db, user_id)
+    if db_user is None:
+        return None
+    user = UserResponse.model_validate(db_user)
+    user_cache.set(user_id, user)
+    return user
+
+
+def invalidate_user(user_id: int) -> None:
+    user_cache.delete(user_id)
+
+
 def create_or_update_google_user(db: Session, google_user: GoogleUserInfo) -> User:
     user = get_user_by_google_id(db, google_user.id)
 
@@ -78,6 +117,7 @@ def create_or_update_google_user(db: Session, google_user: GoogleUserInfo) -> Us
         user.nickname = google_user.name
         db.commit()
         db.refresh(user)
+        invalidate_user(user.id)
         return user
 
     existing_email_user = get_user_by_email(db, google_user.email)
@@ -87,6 +127,7 @@ def create_or_update_google_user(db: Session, google_user: GoogleUserInfo) -> Us
         existing_email_user.nickname = google_user.name
         db.commit()
         db.refresh(existing_email_user)
+        invalidate_user(existing_email_user.id)
         return existing_email_user
 
     new_user = User(
@@ -99,4 +140,5 @@ def create_or_update_google_user(db: Session, google_user: GoogleUserInfo) -> Us
     db.add(new_user)
     db.commit()
     db.refresh(new_user)
+    invalidate_user(new_user.id)
     return new_user
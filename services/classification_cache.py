@@ -0,0 +1,121 @@
+import hashlib
+import logging
+import re
+import threading
+import unicodedata
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models.classification_cache import ClassificationCacheEntry
+from utils.cache import LRUCache
+from utils.sql import upsert_statement
+
+logger = logging.getLogger(__name__)
+
+_WS = re.compile(r"\s+")
+
+
+def content_hash(content: str) -> str:
+    """NFKC 정규화 + 공백 정리 + 소문자화 후 sha256. 띄어쓰기/전각문자만 다른 본문은 같은 키가 된다."""
+    normalized = _WS.sub(" ", unicodedata.normalize("NFKC", content or "")).strip().lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class ClassificationCache:
+    """
+    분류 결과 메모이제이션.
+    1차: 프로세스 내 LRU, 2차: classification_cache 테이블 (재시작 후에도 유지, 워커 간 공유).
+    키에 crime_types 버전이 들어가므로 crime_types 가 바뀌면 예전 결과는 자동으로 무효가 된다.
+    """
+
+    def __init__(self, maxsize: int):
+        self.memory = LRUCache(maxsize=maxsize)
+        self._version: Optional[str] = None
+        self._purged_version: Optional[str] = None
+        self._lock = threading.Lock()
+        self.db_hits = 0
+        self.db_misses = 0
+        self.writes = 0
+        self.version_changes = 0
+
+    def _check_version(self, version: str) -> None:
+        if self._version == version:
+            return
+        with self._lock:
+            if self._version != version:
+                if self._version is not None:
+                    self.version_changes += 1
+                    logger.info(f"crime_types 버전 변경({self._version} -> {version}), 분류 캐시 초기화")
+                self.memory.clear()
+                self._version = version
+
+    def peek(self, content: str, version: str) -> Optional[int]:
+        """메모리 LRU 만 확인한다 (DB 왕복 없음)."""
+        self._check_version(version)
+        return self.memory.get(content_hash(content))
+
+    def get(self, db: Session, content: str, version: str) -> Optional[int]:
+        self._check_version(version)
+        key = content_hash(content)
+        crime_type_id = self.memory.get(key)
+        if crime_type_id is not None:
+            return crime_type_id
+
+        row = db.query(ClassificationCacheEntry.crime_type_id).filter(
+            ClassificationCacheEntry.content_hash == key,
+            ClassificationCacheEntry.crime_types_version == version,
+        ).first()
+        if row is None:
+            self.db_misses += 1
+            return None
+
+        self.db_hits += 1
+        self.memory.set(key, row.crime_type_id)
+        return row.crime_type_id
+
+    def put(self, db: Session, content: str, version: str, crime_type_id: int, source: str) -> None:
+        """결과를 LRU 와 DB 에 기록한다. DB 는 같은 키가 이미 있으면 그대로 둔다 (호출자가 commit)."""
+        self._check_version(version)
+        key = content_hash(content)
+        self.memory.set(key, crime_type_id)
+
+        stmt = upsert_statement(
+            db.get_bind().dialect.name,
+            ClassificationCacheEntry.__table__,
+            key_columns=["content_hash", "crime_types_version"],
+        )
+        db.execute(stmt, [{
+            "content_hash": key,
+            "crime_types_version": version,
+            "crime_type_id": crime_type_id,
+            "source": source,
+        }])
+        self.writes += 1
+
+    def purge_if_stale(self, db: Session, version: str) -> int:
+        """
+        현재 버전이 아닌 영구 캐시 행을 지운다 (호출자가 commit).
+        프로세스당 버전별로 한 번만 실행한다.
+        """
+        if self._purged_version == version:
+            return 0
+        self._purged_version = version
+        return db.query(ClassificationCacheEntry) \
+            .filter(ClassificationCacheEntry.crime_types_version != version) \
+            .delete(synchronize_session=False)
+
+    def stats(self) -> dict:
+        memory = self.memory.stats()
+        return {
+            "crime_types_version": self._version,
+            "memory": memory,
+            "db_hits": self.db_hits,
+            "db_misses": self.db_misses,
+            "writes": self.writes,
+            "version_changes": self.version_changes,
+        }
+
+
+classification_cache = ClassificationCache(maxsize=settings.CLASSIFICATION_CACHE_SIZE)
@@ -0,0 +1,302 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.database import SessionLocal
+from core.metrics import CallbackMetric
+from models.report import Report, ReportStatus, ClassificationStatus
+from services.ai_crime_classifier import (
+    ClassificationError,
+    get_llm_backend,
+    local_stage_counts,
+    request_crime_type_id,
+)
+from services.classification_cache import classification_cache
+from services.dimension_cache import get_dimensions
+from services.report_search import report_search_index
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ClassificationQueue:
+    """
+    제보 AI 분류 백그라운드 작업 큐.
+    요청 경로에서는 report id만 넣고 바로 반환하며, 워커 스레드가 LLM을 호출해
+    결과를 reports.crime_type_id 에 반영한다. 일시적 오류는 재시도하고,
+    재시도 횟수를 넘기면 classification_status='dead' 로 남긴다.
+    재시도 중에 종료되면 queued 와 시도 횟수를 그대로 남겨 재시작 후 recover() 가 이어서 처리한다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        backend_factory: Callable = get_llm_backend,
+        workers: int = settings.CLASSIFIER_WORKERS,
+        maxsize: int = settings.CLASSIFIER_QUEUE_SIZE,
+        max_attempts: int = settings.CLASSIFIER_MAX_ATTEMPTS,
+        retry_backoff: float = settings.CLASSIFIER_RETRY_BACKOFF,
+    ):
+        self.session_factory = session_factory
+        self.backend_factory = backend_factory
+        self.workers = workers
+        self.maxsize = maxsize
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._threads: list[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._counters = {
+            "submitted": 0,
+            "rejected": 0,
+            "done": 0,
+            "retried": 0,
+            "dead": 0,
+            "skipped": 0,
+            "cache_hits": 0,
+        }
+        self._in_flight = 0
+        self._busy_seconds = 0.0
+
+    # --- 생명주기 ---
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stopping.clear()
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"classifier-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        logger.info(f"분류 워커 {self.workers}개 시작 (queue size={self.maxsize})")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopping.set()
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(_STOP)
+            except queue.Full:
+                break
+        deadline = time.monotonic() + timeout
+        for t in self._threads:
+            t.join(max(0.0, deadline - time.monotonic()))
+        self._threads = []
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """큐가 빌 때까지 대기 (부하 테스트용). 시간 내에 비면 True."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    # --- 요청 경로 ---
+    def submit(self, report_id: int) -> bool:
+        """큐가 가득 차면 False. 상태는 queued 로 남으므로 recover() 가 다시 넣는다."""
+        try:
+            self._queue.put_nowait(report_id)
+        except queue.Full:
+            self._incr("rejected")
+            logger.warning(f"분류 큐가 가득 차 report {report_id} 를 나중에 처리합니다.")
+            return False
+        self._incr("submitted")
+        return True
+
+    def recover(self, limit: Optional[int] = None) -> int:
+        """재시작 등으로 처리되지 못한 queued 제보를 다시 큐에 넣는다."""
+        limit = limit or self.maxsize
+        db = self.session_factory()
+        try:
+            ids = [
+                r.id for r in db.query(Report.id)
+                .filter(Report.classification_status == ClassificationStatus.queued)
+                .order_by(Report.id)
+                .limit(limit)
+            ]
+        finally:
+            db.close()
+        return sum(1 for report_id in ids if self.submit(report_id))
+
+    def requeue_dead(self, limit: Optional[int] = None) -> int:
+        """dead-letter 상태의 제보를 queued 로 되돌리고 다시 처리한다."""
+        limit = limit or self.maxsize
+        db = self.session_factory()
+        try:
+            ids = [
+                r.id for r in db.query(Report.id)
+                .filter(Report.classification_status == ClassificationStatus.dead)
+                .order_by(Report.id)
+                .limit(limit)
+            ]
+            if ids:
+                db.query(Report).filter(Report.id.in_(ids)).update(
+                    {
+                        Report.classification_status: ClassificationStatus.queued,
+                        Report.classification_attempts: 0,
+                    },
+                    synchronize_session=False,
+                )
+                db.commit()
+        finally:
+            db.close()
+        return sum(1 for report_id in ids if self.submit(report_id))
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = dict(self._counters)
+            in_flight = self._in_flight
+            busy = self._busy_seconds
+        finished = counters["done"] + counters["dead"] + counters["skipped"]
+        return {
+            **counters,
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self.maxsize,
+            "in_flight": in_flight,
+            "workers": len(self._threads),
+            "avg_job_seconds": round(busy / finished, 4) if finished else None,
+            "local_stage": local_stage_counts(),
+        }
+
+    # --- 워커 ---
+    def _incr(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[key] += n
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                with self._lock:
+                    self._in_flight += 1
+                started = time.perf_counter()
+                try:
+                    self._process(item)
+                except Exception as e:
+                    logger.exception(f"report {item} 분류 작업 중 예기치 못한 오류: {e}")
+                finally:
+                    with self._lock:
+                        self._in_flight -= 1
+                        self._busy_seconds += time.perf_counter() - started
+            finally:
+                self._queue.task_done()
+
+    def _process(self, report_id: int) -> None:
+        # LLM 을 기다리는 동안 커넥션을 잡고 있지 않도록 조회 세션은 바로 닫는다
+        db = self.session_factory()
+        try:
+            row = db.query(Report.content, Report.status, Report.classification_status,
+                           Report.classification_attempts) \
+                .filter(Report.id == report_id).first()
+            dims = get_dimensions(db)
+            crime_types, version = dims.crime_types, dims.crime_types_version
+            cached_id = None
+            if row is not None:
+                classification_cache.purge_if_stale(db, version)
+                cached_id = classification_cache.get(db, row.content, version)
+                db.commit()
+        finally:
+            db.close()
+
+        if not row or row.status != ReportStatus.pending \
+                or row.classification_status != ClassificationStatus.queued:
+            self._incr("skipped")
+            return
+
+        # 같은 본문(재제출/복사 스팸)을 이미 분류한 적이 있으면 LLM 을 부르지 않는다
+        if cached_id is not None and cached_id in dims.crime_type_by_id:
+            self._finish(report_id, ClassificationStatus.done, attempts=0, crime_type_id=cached_id)
+            self._incr("done")
+            self._incr("cache_hits")
+            return
+
+        backend = self.backend_factory()
+        if backend is None or not crime_types:
+            self._finish(report_id, ClassificationStatus.skipped, attempts=0)
+            self._incr("skipped")
+            return
+
+        # 종료로 중단됐던 제보는 이전 시도 횟수부터 이어서 센다
+        attempt = row.classification_attempts or 0
+        while True:
+            attempt += 1
+            try:
+                crime_type_id = request_crime_type_id(crime_types, row.content, backend)
+            except ClassificationError as e:
+                logger.warning(f"report {report_id} 분류 실패: {e}")
+                self._finish(report_id, ClassificationStatus.dead, attempts=attempt)
+                self._incr("dead")
+                return
+            except Exception as e:
+                if attempt >= self.max_attempts:
+                    logger.error(f"report {report_id} 분류 재시도 초과({attempt}회): {e}")
+                    self._finish(report_id, ClassificationStatus.dead, attempts=attempt)
+                    self._incr("dead")
+                    return
+                if self._stopping.is_set() or self._stopping.wait(self.retry_backoff * (2 ** (attempt - 1))):
+                    # 배포/재시작 중의 일시적 오류로 dead 가 되지 않게 queued 로 남긴다
+                    logger.info(f"report {report_id} 분류 중 종료: queued 로 남김 ({attempt}회 시도): {e}")
+                    self._finish(report_id, ClassificationStatus.queued, attempts=attempt)
+                    return
+                self._incr("retried")
+                continue
+
+            self._finish(
+                report_id, ClassificationStatus.done, attempts=attempt, crime_type_id=crime_type_id,
+                cache_entry=(row.content, version),
+            )
+            self._incr("done")
+            return
+
+    def _finish(self, report_id: int, status: ClassificationStatus, attempts: int,
+                crime_type_id: Optional[int] = None, cache_entry: Optional[tuple[str, str]] = None) -> None:
+        values = {
+            Report.classification_status: status,
+            Report.classification_attempts: attempts,
+        }
+        if crime_type_id is not None:
+            values[Report.crime_type_id] = crime_type_id
+            values[Report.version] = Report.version + 1  # 응답(ReportRead)이 바뀌므로 ETag 도 바뀌어야 한다
+
+        db = self.session_factory()
+        try:
+            # 그 사이 관리자가 승인/반려했다면 결과를 덮어쓰지 않는다
+            updated = db.query(Report) \
+                .filter(Report.id == report_id, Report.status == ReportStatus.pending) \
+                .update(values, synchronize_session=False)
+            if cache_entry is not None:
+                content, version = cache_entry
+                classification_cache.put(db, content, version, crime_type_id, source="llm")
+            db.commit()
+            if updated and crime_type_id is not None:
+                report_search_index.set_crime_type(report_id, crime_type_id)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+classification_queue = ClassificationQueue()
+
+# /metrics: 큐 처리 결과 / 대기 / 처리 중 (stats() 값을 스크레이프 시점에 읽는다)
+_JOB_OUTCOMES = ("submitted", "rejected", "done", "retried", "dead", "skipped", "cache_hits")
+CallbackMetric(
+    "classification_jobs_total", "분류 큐 작업 결과 수", ("outcome",),
+    lambda: [((k,), v) for k, v in classification_queue.stats().items() if k in _JOB_OUTCOMES], kind="counter",
+)
+CallbackMetric("classification_queue_depth", "분류 대기 중인 작업 수", (),
+               lambda: [((), classification_queue.stats()["queue_depth"])])
+CallbackMetric("classification_in_flight", "LLM 분류 처리 중인 작업 수", (),
+               lambda: [((), classification_queue.stats()["in_flight"])])
+CallbackMetric("classification_local_stage_total", "로컬 분류기 단계 결과 (answered: LLM 생략, fell_through: LLM 으로)",
+               ("result",), lambda: [((k,), v) for k, v in local_stage_counts().items()], kind="counter")
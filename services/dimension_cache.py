@@ -0,0 +1,208 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models import Region, CrimeType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RegionRow:
+    id: int
+    province: str
+    city: Optional[str]
+    full_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class CrimeTypeRow:
+    id: int
+    major: str
+    minor: Optional[str]
+
+
+def _nulls_first(value: Optional[str]):
+    # MySQL ORDER BY 와 동일하게 NULL을 맨 앞에 정렬
+    return (value is not None, value or "")
+
+
+class DimensionSnapshot:
+    """
+    regions / crime_types 테이블을 한 번에 읽어둔 불변 스냅샷.
+    id -> row, full_name/major/minor -> id 조회 맵을 함께 가진다.
+    """
+
+    def __init__(self, regions: list[RegionRow], crime_types: list[CrimeTypeRow]):
+        self.regions = sorted(regions, key=lambda r: r.full_name)
+        self.crime_types = sorted(crime_types, key=lambda c: c.id)
+
+        self.region_by_id = {r.id: r for r in regions}
+        self.region_id_by_full_name = {r.full_name: r.id for r in regions}
+        self.crime_type_by_id = {c.id: c for c in crime_types}
+        self.crime_type_id_by_major_minor = {(c.major, c.minor): c.id for c in crime_types}
+
+        self.regions_by_province: dict[str, list[RegionRow]] = {}
+        for r in regions:
+            self.regions_by_province.setdefault(r.province, []).append(r)
+        for rows in self.regions_by_province.values():
+            rows.sort(key=lambda r: _nulls_first(r.city))
+
+        self.crime_types_by_major: dict[str, list[CrimeTypeRow]] = {}
+        for c in crime_types:
+            self.crime_types_by_major.setdefault(c.major, []).append(c)
+        for rows in self.crime_types_by_major.values():
+            rows.sort(key=lambda c: _nulls_first(c.minor))
+        self.majors = sorted(self.crime_types_by_major)
+
+        # 내용이 같으면 워커가 달라도 같은 값이 나오도록 해시로 버전을 만든다
+        self.regions_version = _digest((r.id, r.province, r.city, r.full_name) for r in self.regions)
+        self.crime_types_version = _digest((c.id, c.major, c.minor) for c in self.crime_types)
+
+    def region_id(self, province: str, city: Optional[str] = None) -> Optional[int]:
+        full_name = f"{province} {city}" if city else province
+        return self.region_id_by_full_name.get(full_name)
+
+    def crime_type_id(self, major: str, minor: Optional[str] = None) -> Optional[int]:
+        return self.crime_type_id_by_major_minor.get((major, minor))
+
+
+def _digest(rows) -> str:
+    h = hashlib.sha1()
+    for row in rows:
+        h.update(repr(row).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+REGION_COLUMNS = (Region.id, Region.province, Region.city, Region.full_name)
+CRIME_TYPE_COLUMNS = (CrimeType.id, CrimeType.major, CrimeType.minor)
+
+
+class DimensionCache:
+    """
+    regions / crime_types 프로세스 내 캐시.
+    TTL이 지나거나 invalidate()가 호출되면 다음 조회 때 DB에서 다시 읽는다.
+    동기 경로(get)는 threading.Lock, async 경로(get_async)는 asyncio.Lock 으로 적재를 한 번만 한다.
+    이벤트 루프 스레드에서 threading.Lock 을 잡은 채 await 하면 같은 락을 기다리는 다음 코루틴이 루프를 멈추므로
+    async 경로는 threading.Lock 을 DB 조회 동안 잡지 않는다.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[DimensionSnapshot] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    def get_fresh(self) -> Optional[DimensionSnapshot]:
+        """DB 없이 유효한 스냅샷만 돌려준다. 만료됐으면 None."""
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh():
+            self.hits += 1
+            return snapshot
+        return None
+
+    def get(self, db: Session) -> DimensionSnapshot:
+        if self._is_fresh():
+            self.hits += 1
+            return self._snapshot
+
+        with self._lock:
+            # 락을 기다리는 동안 다른 스레드가 이미 적재했을 수 있음
+            if self._is_fresh():
+                self.hits += 1
+                return self._snapshot
+            self.misses += 1
+            snapshot = self._load(db)
+            self._snapshot = snapshot
+            self._loaded_at = time.monotonic()
+            return snapshot
+
+    async def get_async(self, db: AsyncSession) -> DimensionSnapshot:
+        snapshot = self.get_fresh()
+        if snapshot is not None:
+            return snapshot
+
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            # 기다리는 동안 다른 코루틴이 이미 적재했을 수 있음
+            snapshot = self.get_fresh()
+            if snapshot is not None:
+                return snapshot
+            self.misses += 1
+            generation = self._generation
+            regions = (await db.execute(select(*REGION_COLUMNS))).all()
+            crime_types = (await db.execute(select(*CRIME_TYPE_COLUMNS))).all()
+            snapshot = self._build(regions, crime_types)
+            with self._lock:
+                # 적재 도중 invalidate() 됐으면 이번 결과는 이 요청에만 쓰고 캐시에는 넣지 않는다
+                if generation == self._generation:
+                    self._snapshot = snapshot
+                    self._loaded_at = time.monotonic()
+            return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._loaded_at = 0.0
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "ttl_seconds": self.ttl_seconds,
+            "loaded": snapshot is not None,
+            "age_seconds": round(time.monotonic() - self._loaded_at, 3) if snapshot else None,
+            "regions": len(snapshot.regions) if snapshot else 0,
+            "crime_types": len(snapshot.crime_types) if snapshot else 0,
+        }
+
+    @classmethod
+    def _load(cls, db: Session) -> DimensionSnapshot:
+        return cls._build(db.query(*REGION_COLUMNS).all(), db.query(*CRIME_TYPE_COLUMNS).all())
+
+    @staticmethod
+    def _build(region_rows, crime_type_rows) -> DimensionSnapshot:
+        regions = [
+            RegionRow(id=r.id, province=r.province, city=r.city, full_name=r.full_name)
+            for r in region_rows
+        ]
+        crime_types = [CrimeTypeRow(id=c.id, major=c.major, minor=c.minor) for c in crime_type_rows]
+        logger.info(f"dimension cache 적재: regions={len(regions)}, crime_types={len(crime_types)}")
+        return DimensionSnapshot(regions, crime_types)
+
+
+dimension_cache = DimensionCache(ttl_seconds=settings.DIMENSION_CACHE_TTL)
+
+
+def get_dimensions(db: Session) -> DimensionSnapshot:
+    return dimension_cache.get(db)
+
+
+async def get_dimensions_async(db: AsyncSession) -> DimensionSnapshot:
+    # 캐시가 유효하면 커넥션을 잡지 않고 바로 반환, 만료됐을 때만 async 세션으로 다시 적재
+    return await dimension_cache.get_async(db)
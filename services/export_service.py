@@ -0,0 +1,163 @@
+"""
+official_stats / reports 대량 내보내기 (NDJSON, CSV, 선택적 gzip).
+
+ORM 객체와 Pydantic 모델을 만들지 않고 평평한 컬럼만 SELECT 한 뒤 서버측 커서(stream_results)로
+EXPORT_BATCH_SIZE 행씩 받아 바로 직렬화해 흘려보낸다. 메모리는 행 수와 상관없이 배치 하나 분량이다.
+(aiomysql 은 SSCursor, aiosqlite 는 커서 fetchmany 로 동작한다)
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Optional, Sequence
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models import CrimeType, Region, Report
+from models.officialstat import STAT_MODELS
+from models.report import ReportStatus
+from services.official_aggregate import filter_conditions
+
+FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
+
+
+def stats_export_query(
+    provinces: Sequence[str] = (),
+    cities: Sequence[str] = (),
+    majors: Sequence[str] = (),
+    minors: Sequence[str] = (),
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    source: str = "official",
+) -> Select:
+    model = STAT_MODELS[source]
+    return (
+        select(
+            model.id,
+            Region.province,
+            Region.city,
+            Region.full_name.label("region"),
+            CrimeType.major,
+            CrimeType.minor,
+            model.year,
+            model.count,
+            model.last_updated,
+        )
+        .join(Region, model.region_id == Region.id)
+        .outerjoin(CrimeType, model.crime_type_id == CrimeType.id)
+        .where(*filter_conditions(provinces, cities, majors, minors, None, year_from, year_to, model))
+        .order_by(model.id)
+    )
+
+
+def reports_export_query(
+    status: Optional[ReportStatus] = None,
+    region_id: Optional[int] = None,
+    crime_type_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+) -> Select:
+    stmt = (
+        select(
+            Report.id,
+            Report.user_id,
+            Report.status,
+            Region.full_name.label("region"),
+            CrimeType.major,
+            CrimeType.minor,
+            Report.title,
+            Report.content,
+            Report.created_at,
+            Report.approved_at,
+            Report.rejected_at,
+        )
+        .join(Region, Report.region_id == Region.id)
+        .join(CrimeType, Report.crime_type_id == CrimeType.id)
+    )
+    if status:
+        stmt = stmt.where(Report.status == status)
+    if region_id:
+        stmt = stmt.where(Report.region_id == region_id)
+    if crime_type_id:
+        stmt = stmt.where(Report.crime_type_id == crime_type_id)
+    if created_from:
+        stmt = stmt.where(Report.created_at >= created_from)
+    if created_to:
+        stmt = stmt.where(Report.created_at < created_to)
+    return stmt.order_by(Report.id)
+
+
+def _plain(value):
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, ReportStatus):
+        return value.value
+    return value
+
+
+def _ndjson(keys: Sequence[str], rows: Iterable) -> str:
+    return "".join(
+        json.dumps(dict(zip(keys, map(_plain, row))), ensure_ascii=False, separators=(",", ":")) + "\n"
+        for row in rows
+    )
+
+
+def _csv(rows: Iterable) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows([_plain(v) for v in row] for row in rows)
+    return buffer.getvalue()
+
+
+async def stream_export(db: AsyncSession, stmt: Select, fmt: str, gzip: bool = False) -> AsyncIterator[bytes]:
+    """stmt 결과를 fmt(ndjson/csv) 바이트 조각으로. gzip 이면 조각마다 이어지는 하나의 gzip 스트림."""
+    compressor = zlib.compressobj(wbits=31) if gzip else None  # wbits=31: gzip 헤더/트레일러
+
+    def encode(text: str) -> bytes:
+        data = text.encode("utf-8")
+        return compressor.compress(data) if compressor else data
+
+    result = await db.stream(stmt.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+    keys = list(result.keys())
+    if fmt == "csv":
+        # 엑셀에서 한글이 깨지지 않도록 BOM + 헤더
+        yield encode("\ufeff" + _csv([keys]))
+
+    async for partition in result.partitions():
+        chunk = encode(_csv(partition) if fmt == "csv" else _ndjson(keys, partition))
+        if chunk:
+            yield chunk
+
+    if compressor:
+        yield compressor.flush()
+
+
+def wants_gzip(request: Request, gzip: Optional[bool]) -> bool:
+    if gzip is not None:
+        return gzip
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+def export_response(
+    request: Request, db: AsyncSession, stmt: Select, fmt: str, filename: str, gzip: Optional[bool] = None,
+) -> StreamingResponse:
+    """
+    내보내기 스트리밍 응답. gzip 을 비우면 Accept-Encoding 을 따른다.
+    압축은 Content-Encoding: gzip 으로 보내므로 curl --compressed / 브라우저 / requests 가 그대로 풀어서 저장한다.
+    """
+    media_type, extension = FORMATS[fmt]
+    compressed = wants_gzip(request, gzip)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{extension}"',
+        "Vary": "Accept-Encoding",
+    }
+    if compressed:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(stream_export(db, stmt, fmt, compressed), media_type=media_type, headers=headers)
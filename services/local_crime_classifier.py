@@ -0,0 +1,134 @@
+import re
+import threading
+from typing import Optional, Sequence
+
+from services.dimension_cache import CrimeTypeRow
+
+# (대분류, 중분류) -> 본문에 자주 나오는 단서 표현. 공백은 제거한 뒤 비교한다.
+KEYWORDS: dict[tuple[str, str], list[str]] = {
+    ("강력범죄", "살인기수"): ["살인", "살해", "죽였"],
+    ("강력범죄", "살인미수등"): ["살인미수", "죽이려", "살해하려"],
+    ("강력범죄", "강도"): ["강도", "빼앗", "뺏어", "뺏겼", "흉기로위협하며", "강탈"],
+    ("강력범죄", "강간"): ["강간", "성폭행"],
+    ("강력범죄", "강제추행"): ["추행", "성추행", "몸을만졌", "신체를만졌", "엉덩이를만"],
+    ("강력범죄", "방화"): ["방화", "불을질", "불을붙여", "불을냈"],
+    ("절도범죄", "절도범죄"): [
+        "소매치기", "절도", "도둑", "훔쳐", "훔친", "훔쳤", "도난", "털렸", "털어",
+        "빈집", "가져갔",
+    ],
+    ("폭력범죄", "상해"): ["상해", "다쳤", "골절", "찔렸", "전치"],
+    ("폭력범죄", "폭행"): ["폭행", "때렸", "맞았", "주먹", "구타", "발로차", "뺨을"],
+    ("폭력범죄", "체포감금"): ["감금", "가두", "가둬", "못나가게"],
+    ("폭력범죄", "협박"): ["협박", "죽이겠", "죽여버리", "위협", "가만두지않"],
+    ("폭력범죄", "약취유인"): ["유괴", "납치", "유인"],
+    ("폭력범죄", "공갈"): ["공갈", "갈취", "돈을뜯", "삥"],
+    ("폭력범죄", "손괴"): ["손괴", "파손", "부쉈", "부서", "깨뜨", "깨졌", "긁어", "긁었", "펑크"],
+    ("지능범죄", "사기"): [
+        "사기", "보이스피싱", "피싱", "스미싱", "먹튀", "입금했는데", "송금했는데",
+        "중고거래", "잠적",
+    ],
+    ("지능범죄", "횡령"): ["횡령", "착복", "공금"],
+    ("지능범죄", "배임"): ["배임"],
+    ("지능범죄", "문서/인장"): ["위조", "도장을", "서류를조작"],
+    ("지능범죄", "통화"): ["위조지폐", "위폐"],
+    ("지능범죄", "증수뢰"): ["뇌물", "금품을받"],
+    ("풍속범죄", "도박범죄"): ["도박", "토토", "불법카지노", "바카라"],
+    ("풍속범죄", "성풍속범죄"): ["성매매", "음란"],
+    ("마약범죄", "마약범죄"): ["마약", "필로폰", "대마", "케타민", "투약"],
+    ("교통범죄", "교통범죄"): ["음주운전", "뺑소니", "무면허", "신호위반", "난폭운전", "보복운전"],
+    ("환경범죄", "환경범죄"): ["폐기물", "무단투기", "오염", "불법소각"],
+    ("노동범죄", "노동범죄"): ["임금체불", "월급을안", "체불"],
+    ("선거범죄", "선거범죄"): ["선거", "매표"],
+    ("보건범죄", "보건범죄"): ["무면허의료", "불법시술", "가짜약"],
+}
+
+_WS = re.compile(r"\s+")
+_PRIOR = 1.0  # 단서가 적을 때 확신도를 낮추는 가상 점수
+
+
+def _normalize(text: str) -> str:
+    return _WS.sub("", text or "")
+
+
+def _bigrams(text: str) -> set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class LocalCrimeClassifier:
+    """
+    LLM 앞단의 가벼운 키워드/바이그램 분류기.
+    crime_types 의 대분류/중분류 이름과 KEYWORDS 단서 표현을 본문에서 찾아 점수를 매기고,
+    confidence = 1등 점수 / (전체 점수 합 + PRIOR) 로 확신도를 계산한다.
+    """
+
+    def __init__(self, crime_types: Sequence[CrimeTypeRow]):
+        by_pair = {(ct.major, ct.minor): ct.id for ct in crime_types}
+        by_major: dict[str, int] = {}
+        for ct in sorted(crime_types, key=lambda c: c.id):
+            by_major.setdefault(ct.major, ct.id)
+
+        def resolve(major: str, minor: Optional[str]) -> Optional[int]:
+            return by_pair.get((major, minor)) or by_pair.get((major, major)) or by_major.get(major)
+
+        # 단서 -> [(crime_type_id, 가중치)]
+        self._cues: dict[str, list[tuple[int, float]]] = {}
+        for (major, minor), words in KEYWORDS.items():
+            crime_type_id = resolve(major, minor)
+            if crime_type_id is None:
+                continue
+            for w in words:
+                self._add_cue(w, crime_type_id, 1.0 + 0.25 * max(0, len(w) - 2))
+
+        # 테이블에 있는 중분류 이름 자체도 단서로 쓴다 ("범죄" 접미사 제외)
+        self._name_bigrams: list[tuple[int, set[str]]] = []
+        for ct in crime_types:
+            name = _normalize(ct.minor or ct.major)
+            stem = name[:-2] if name.endswith("범죄") and len(name) > 2 else name
+            if len(stem) >= 2:
+                self._add_cue(stem, ct.id, 1.5)
+                self._name_bigrams.append((ct.id, _bigrams(stem)))
+
+    def _add_cue(self, word: str, crime_type_id: int, weight: float) -> None:
+        entries = self._cues.setdefault(_normalize(word), [])
+        if all(cid != crime_type_id for cid, _ in entries):
+            entries.append((crime_type_id, weight))
+
+    def scores(self, content: str) -> dict[int, float]:
+        text = _normalize(content)
+        scores: dict[int, float] = {}
+        for cue, entries in self._cues.items():
+            if cue in text:
+                for crime_type_id, weight in entries:
+                    scores[crime_type_id] = scores.get(crime_type_id, 0.0) + weight
+
+        # 이름 바이그램이 절반 이상 겹치면 약한 단서로 취급
+        text_bigrams = _bigrams(text)
+        for crime_type_id, grams in self._name_bigrams:
+            overlap = len(grams & text_bigrams)
+            if overlap and overlap * 2 >= len(grams) and crime_type_id not in scores:
+                scores[crime_type_id] = 0.5 * overlap / len(grams)
+        return scores
+
+    def predict(self, content: str) -> tuple[Optional[int], float]:
+        """(crime_type_id, confidence). 단서가 하나도 없으면 (None, 0.0)."""
+        scores = self.scores(content)
+        if not scores:
+            return None, 0.0
+        best_id, best = max(scores.items(), key=lambda kv: (kv[1], -kv[0]))
+        return best_id, best / (sum(scores.values()) + _PRIOR)
+
+
+_compiled: Optional[tuple[str, LocalCrimeClassifier]] = None
+_compile_lock = threading.Lock()
+
+
+def get_local_classifier(crime_types: Sequence[CrimeTypeRow], version: str) -> LocalCrimeClassifier:
+    """crime_types 버전별로 한 번만 컴파일해 재사용한다."""
+    global _compiled
+    compiled = _compiled
+    if compiled is not None and compiled[0] == version:
+        return compiled[1]
+    with _compile_lock:
+        if _compiled is None or _compiled[0] != version:
+            _compiled = (version, LocalCrimeClassifier(crime_types))
+        return _compiled[1]
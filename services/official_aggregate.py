@@ -0,0 +1,223 @@
+"""
+통계 표(official_stats / report_stats / merged_stats) 서버측 집계 (GROUP BY).
+
+/api/statusAll 처럼 전체 행을 내려보내고 클라이언트가 더하는 대신
+지역(province/city) x 범죄유형(major/minor) x 연도 중 원하는 차원으로 DB 에서 묶어
+sum / avg / share(필터 범위 전체 대비 비율) 만 돌려준다.
+STATS_BACKEND=cube 이면 같은 결과를 인메모리 큐브(services/stats_cube.py)에서 계산한다.
+"""
+from typing import Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models import CrimeType, Region
+from models.officialstat import STAT_MODELS, OfficialStat
+from services.stats_cube import stats_cubes
+
+DIMENSIONS = {
+    "province": Region.province,
+    "city": Region.city,
+    "major": CrimeType.major,
+    "minor": CrimeType.minor,
+    "year": OfficialStat.year,  # 다른 source 에서는 dimension_column 이 그 표의 year 로 바꾼다
+}
+# city 는 시/도마다 겹치고(서울 중구, 부산 중구) minor 는 대분류에 딸려 있으므로 상위 차원을 같이 묶는다
+IMPLIED = {"city": "province", "minor": "major"}
+METRICS = ("sum", "avg", "share")
+SHAPES = ("rows", "pivot")
+
+
+class AggregateError(ValueError):
+    pass
+
+
+def parse_list(value: Optional[str]) -> list[str]:
+    """'a, b,,c' -> ['a', 'b', 'c'] (쿼리스트링의 콤마 구분 목록)"""
+    if not value:
+        return []
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def expand_dimensions(group_by: Sequence[str]) -> list[str]:
+    """요청 차원에 상위 차원을 끼워 넣은 실제 GROUP BY 순서. ['city', 'year'] -> ['province', 'city', 'year']"""
+    unknown = [d for d in group_by if d not in DIMENSIONS]
+    if unknown:
+        raise AggregateError(f"지원하지 않는 group_by 입니다: {', '.join(unknown)} (가능: {', '.join(DIMENSIONS)})")
+
+    expanded = []
+    for dim in group_by:
+        parent = IMPLIED.get(dim)
+        if parent and parent not in expanded:
+            expanded.append(parent)
+        if dim not in expanded:
+            expanded.append(dim)
+    return expanded
+
+
+def dimension_column(dim: str, model=OfficialStat):
+    return model.year if dim == "year" else DIMENSIONS[dim]
+
+
+def filter_conditions(
+    provinces: Sequence[str], cities: Sequence[str], majors: Sequence[str], minors: Sequence[str],
+    year: Optional[int], year_from: Optional[int], year_to: Optional[int], model=OfficialStat,
+) -> list:
+    conditions = []
+    for column, values in (
+        (Region.province, provinces), (Region.city, cities),
+        (CrimeType.major, majors), (CrimeType.minor, minors),
+    ):
+        if values:
+            conditions.append(column.in_(values))
+    if year is not None:
+        conditions.append(model.year == year)
+    if year_from is not None:
+        conditions.append(model.year >= year_from)
+    if year_to is not None:
+        conditions.append(model.year <= year_to)
+    return conditions
+
+
+async def aggregate_stats(
+    db: AsyncSession,
+    group_by: Sequence[str] = (),
+    metrics: Sequence[str] = ("sum",),
+    shape: str = "rows",
+    provinces: Sequence[str] = (),
+    cities: Sequence[str] = (),
+    majors: Sequence[str] = (),
+    minors: Sequence[str] = (),
+    year: Optional[int] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    max_cells: Optional[int] = None,
+    source: str = "official",
+) -> dict:
+    """
+    필터 범위의 source 통계 표를 group_by 차원으로 집계한다.
+    결과 셀 수(rows: 그룹 수, pivot: 행 x 열)가 max_cells(상한 STATS_AGGREGATE_MAX_CELLS)를 넘으면
+    잘라서 보내지 않고 AggregateError 로 거절한다 (필터/차원을 줄이라는 뜻).
+    """
+    metrics = list(dict.fromkeys(metrics)) or ["sum"]
+    bad = [m for m in metrics if m not in METRICS]
+    if bad:
+        raise AggregateError(f"지원하지 않는 metric 입니다: {', '.join(bad)} (가능: {', '.join(METRICS)})")
+    if shape not in SHAPES:
+        raise AggregateError(f"shape 는 {' / '.join(SHAPES)} 중 하나여야 합니다.")
+    if shape == "pivot" and len(group_by) != 2:
+        raise AggregateError("pivot 은 group_by 에 차원 2개(행, 열)가 필요합니다. 예: group_by=city,year")
+
+    cap = min(max_cells or settings.STATS_AGGREGATE_MAX_CELLS, settings.STATS_AGGREGATE_MAX_CELLS)
+    dims = expand_dimensions(group_by)
+    filters = {"province": provinces, "city": cities, "major": majors, "minor": minors}
+
+    # 상한 + 1 건만 읽어 초과 여부를 판단한다
+    groups, total = await fetch_groups(db, dims, filters, year, year_from, year_to, cap + 1, source)
+    if len(groups) > cap:
+        raise AggregateError(f"집계 결과가 {cap}개를 넘습니다. 필터를 추가하거나 group_by 차원을 줄여주세요.")
+    return _shape(dims, group_by, metrics, shape, groups, total, cap)
+
+
+async def fetch_groups(
+    db: AsyncSession,
+    dims: Sequence[str],
+    filters: dict,
+    year: Optional[int] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    limit: Optional[int] = None,
+    source: str = "official",
+) -> tuple[list[tuple], int]:
+    """
+    dims(expand_dimensions 결과)로 묶은 (키 튜플, sum, 행 수) 목록과 필터 범위 전체 합계.
+    filters 는 {"province": [...], "city": [...], "major": [...], "minor": [...]}.
+    큐브가 켜져 있으면 source 큐브에서, 아니면 source 표에 GROUP BY 쿼리 한 번으로 계산한다.
+    """
+    cube = stats_cubes[source]
+    if cube.enabled():
+        return await _cube_groups(db, cube, dims, filters, year, year_from, year_to)
+    return await _sql_groups(db, STAT_MODELS[source], dims, filters, year, year_from, year_to, limit)
+
+
+async def _sql_groups(db: AsyncSession, model, dims, filters, year, year_from, year_to, limit: Optional[int]):
+    columns = [dimension_column(d, model) for d in dims]
+    keys = [column.label(d) for column, d in zip(columns, dims)]
+    group_sum = func.sum(model.count)
+
+    stmt = (
+        select(
+            *keys,
+            group_sum.label("sum"),
+            func.count().label("rows"),
+            # LIMIT 전에 계산되므로 필터 범위 전체 합계 (share 분모)
+            func.sum(group_sum).over().label("total"),
+        )
+        .select_from(model)
+        .join(Region, model.region_id == Region.id)
+        .outerjoin(CrimeType, model.crime_type_id == CrimeType.id)
+        .where(*filter_conditions(filters.get("province"), filters.get("city"), filters.get("major"), filters.get("minor"),
+                         year, year_from, year_to, model))
+    )
+    if keys:
+        stmt = stmt.group_by(*columns).order_by(*columns)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    rows = (await db.execute(stmt)).all()
+
+    total = int(rows[0].total or 0) if rows else 0
+    # 필터에 맞는 행이 없으면 전체 합계 1행(count=0) 대신 빈 결과
+    groups = [(tuple(row._mapping[d] for d in dims), int(row.sum or 0), int(row.rows)) for row in rows if row.rows]
+    return groups, total
+
+
+async def _cube_groups(db: AsyncSession, cube, dims, filters, year, year_from, year_to):
+    data = await cube.get(db)
+    groups = data.group(dims, filters, year, year_from, year_to)
+    return groups, sum(g[1] for g in groups)
+
+
+def _shape(dims, group_by, metrics, shape, groups, total, cap) -> dict:
+    def values(group_sum: int, group_rows: int) -> dict:
+        out = {}
+        if "sum" in metrics:
+            out["sum"] = group_sum
+        if "avg" in metrics:
+            out["avg"] = round(group_sum / group_rows, 4)
+        if "share" in metrics:
+            out["share"] = round(group_sum / total, 6) if total else None
+        return out
+
+    result = {"group_by": dims, "metrics": metrics, "shape": shape, "total": total, "groups": len(groups)}
+    if shape == "rows":
+        result["rows"] = [{"keys": dict(zip(dims, key)), **values(s, n)} for key, s, n in groups]
+        return result
+
+    # pivot: 첫 번째 요청 차원(+상위 차원)이 행, 두 번째가 열. 값은 첫 번째 metric
+    row_dims = expand_dimensions(group_by[:1])
+    col_dims = [d for d in dims if d not in row_dims]
+    if not col_dims:
+        raise AggregateError("pivot 의 열 차원이 행 차원에 포함됩니다. 서로 다른 차원 2개를 지정해주세요.")
+    row_index, col_index, cells = {}, {}, {}
+    for key, group_sum, group_rows in groups:
+        labels = dict(zip(dims, key))
+        r = row_index.setdefault(tuple(labels[d] for d in row_dims), len(row_index))
+        c = col_index.setdefault(tuple(labels[d] for d in col_dims), len(col_index))
+        cells[r, c] = values(group_sum, group_rows)[metrics[0]]
+    if len(row_index) * len(col_index) > cap:
+        raise AggregateError(
+            f"pivot 결과가 {len(row_index)}x{len(col_index)} 로 {cap}칸을 넘습니다. 필터를 추가해주세요."
+        )
+
+    col_keys = sorted(col_index, key=lambda k: tuple((v is None, v) for v in k))
+    col_order = [col_index[k] for k in col_keys]
+    result["pivot"] = {
+        "metric": metrics[0],
+        "row_dims": row_dims,
+        "col_dims": col_dims,
+        "row_keys": [dict(zip(row_dims, k)) for k in row_index],
+        "col_keys": [dict(zip(col_dims, k)) for k in col_keys],
+        "values": [[cells.get((r, c)) for c in col_order] for r in range(len(row_index))],
+    }
+    return result
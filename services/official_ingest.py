@@ -0,0 +1,260 @@
+"""
+경찰청 "범죄 발생 지역별 통계" CSV -> official_stats 적재.
+
+CSV 는 (범죄대분류, 범죄중분류) 한 행에 지역별 건수가 열로 붙은 wide 형식이다.
+행 단위로 읽으면서 지역 열을 (region_id, crime_type_id, year, count) 로 풀어
+배치 upsert 한다. 같은 파일을 다시 넣어도 건수를 덮어쓰므로 결과가 같다 (멱등).
+승인된 제보 건수는 report_stats 에 따로 있으므로 적재가 지우거나 두 번 더하지 않는다.
+적재가 끝나면 적재한 연도의 merged_stats(공식 + 제보)를 다시 만든다.
+
+    python -m services.official_ingest 범죄발생지역별통계_2023.csv --year 2023 --encoding cp949
+    python -m services.official_ingest 범죄통계_2019_2023.csv        # '연도' 열이 있는 다년도 파일
+"""
+import argparse
+import csv
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal
+from models import Region, CrimeType
+from models.officialstat import OfficialStat
+from services.dimension_cache import dimension_cache, get_dimensions
+from services.official_service import notify_stats_changed
+from services.report_stats import rebuild_merged
+from utils.sql import upsert_statement
+
+logger = logging.getLogger(__name__)
+
+MAJOR_COLUMN = "범죄대분류"
+MINOR_COLUMN = "범죄중분류"
+YEAR_COLUMNS = ("연도", "년도", "year")
+
+_WS = re.compile(r"\s+")
+
+
+class IngestError(Exception):
+    pass
+
+
+@dataclass
+class IngestResult:
+    rows: int = 0
+    cells: int = 0
+    upserted: int = 0
+    unknown_regions: set = field(default_factory=set)
+    unknown_crime_types: set = field(default_factory=set)
+    skipped_cells: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> dict:
+        return {
+            "rows": self.rows,
+            "cells": self.cells,
+            "upserted": self.upserted,
+            "skipped_cells": self.skipped_cells,
+            "unknown_regions": sorted(self.unknown_regions),
+            "unknown_crime_types": sorted(f"{ma}/{mi}" for ma, mi in self.unknown_crime_types),
+            "seconds": round(self.seconds, 3),
+            "rows_per_sec": round(self.rows / self.seconds, 1) if self.seconds else None,
+            "cells_per_sec": round(self.cells / self.seconds, 1) if self.seconds else None,
+        }
+
+
+def _parse_count(value: str) -> int:
+    # "1,234", "-", "" 등 공공데이터 표기 정리
+    value = (value or "").strip().replace(",", "")
+    if value in ("", "-"):
+        return 0
+    return int(float(value))
+
+
+def iter_stat_rows(rows: Iterator[list[str]], year: Optional[int] = None) -> Iterator[tuple]:
+    """
+    wide CSV 행을 (year, major, minor, [(region_name, count), ...]) 로 푼다.
+    첫 행은 헤더. '연도' 열이 있으면 행마다 연도를 읽고, 없으면 year 인자를 쓴다.
+    """
+    header = [h.strip() for h in next(rows)]
+    try:
+        major_idx = header.index(MAJOR_COLUMN)
+        minor_idx = header.index(MINOR_COLUMN)
+    except ValueError:
+        raise IngestError(f"헤더에 {MAJOR_COLUMN}/{MINOR_COLUMN} 열이 없습니다: {header[:5]}")
+
+    year_idx = next((header.index(c) for c in YEAR_COLUMNS if c in header), None)
+    if year_idx is None and year is None:
+        raise IngestError("연도 열이 없는 파일은 --year 를 지정해야 합니다.")
+
+    fixed = {major_idx, minor_idx, year_idx}
+    region_columns = [(i, name) for i, name in enumerate(header) if i not in fixed and name]
+
+    for line_no, row in enumerate(rows, start=2):
+        if not row or not any(cell.strip() for cell in row):
+            continue
+        try:
+            row_year = int(row[year_idx].strip()) if year_idx is not None else year
+            cells = [(name, _parse_count(row[i] if i < len(row) else "")) for i, name in region_columns]
+        except ValueError as e:
+            raise IngestError(f"{line_no}행에 숫자가 아닌 값이 있습니다: {e}")
+        yield row_year, row[major_idx].strip(), row[minor_idx].strip() or None, cells
+
+
+class _IdResolver:
+    """지역명/범죄유형 -> id. dimension 스냅샷 위에 이번 적재에서 새로 만든 행을 더한다."""
+
+    def __init__(self, db: Session, create_missing: bool, result: IngestResult):
+        dims = get_dimensions(db)
+        self.db = db
+        self.create_missing = create_missing
+        self.result = result
+        self.regions = dict(dims.region_id_by_full_name)
+        # "서울종로구" 처럼 띄어쓰기가 다른 헤더도 찾을 수 있게 공백 제거 키를 함께 둔다
+        self.regions_compact = {_WS.sub("", name): rid for name, rid in self.regions.items()}
+        self.crime_types = dict(dims.crime_type_id_by_major_minor)
+        self.created = 0
+
+    def region_id(self, name: str) -> Optional[int]:
+        region_id = self.regions.get(name) or self.regions_compact.get(_WS.sub("", name))
+        if region_id is not None or name in self.result.unknown_regions:
+            return region_id
+        if not self.create_missing:
+            self.result.unknown_regions.add(name)
+            return None
+
+        province, _, city = _WS.sub(" ", name).strip().partition(" ")
+        region = Region(province=province, city=city or None, full_name=name)
+        self.db.add(region)
+        self.db.flush()
+        self.regions[name] = region.id
+        self.created += 1
+        return region.id
+
+    def crime_type_id(self, major: str, minor: Optional[str]) -> Optional[int]:
+        key = (major, minor)
+        crime_type_id = self.crime_types.get(key)
+        if crime_type_id is not None or key in self.result.unknown_crime_types:
+            return crime_type_id
+        if not self.create_missing:
+            self.result.unknown_crime_types.add(key)
+            return None
+
+        crime_type = CrimeType(major=major, minor=minor)
+        self.db.add(crime_type)
+        self.db.flush()
+        self.crime_types[key] = crime_type.id
+        self.created += 1
+        return crime_type.id
+
+
+def ingest_rows(
+        db: Session,
+        rows: Iterator[list[str]],
+        year: Optional[int] = None,
+        batch_size: int = 5000,
+        create_missing: bool = False,
+) -> IngestResult:
+    """csv.reader 같은 행 이터레이터를 받아 official_stats 에 upsert 한다. 배치마다 commit."""
+    result = IngestResult()
+    started = time.perf_counter()
+    resolver = _IdResolver(db, create_missing, result)
+    stmt = upsert_statement(
+        db.get_bind().dialect.name,
+        OfficialStat.__table__,
+        key_columns=["region_id", "crime_type_id", "year"],
+        update=lambda inserted, table: {"count": inserted.count, "last_updated": func.now()},
+    )
+
+    batch: list[dict] = []
+    years: set[int] = set()
+
+    def flush():
+        if batch:
+            db.execute(stmt, batch)
+            db.commit()
+            result.upserted += len(batch)
+            batch.clear()
+
+    for row_year, major, minor, cells in iter_stat_rows(rows, year):
+        result.rows += 1
+        result.cells += len(cells)
+
+        crime_type_id = resolver.crime_type_id(major, minor)
+        if crime_type_id is None:
+            result.skipped_cells += len(cells)
+            continue
+
+        for region_name, count in cells:
+            region_id = resolver.region_id(region_name)
+            if region_id is None:
+                result.skipped_cells += 1
+                continue
+            batch.append({"region_id": region_id, "crime_type_id": crime_type_id, "year": row_year, "count": count})
+            years.add(row_year)
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+
+    if resolver.created:
+        dimension_cache.invalidate()
+    if result.upserted:
+        rebuild_merged(db, years)
+        db.commit()
+        # 건수를 덮어썼으므로 증분이 아니라 "알 수 없는 변경" 으로 알린다 (통계 큐브 재적재)
+        notify_stats_changed(("official", "merged"))
+
+    result.seconds = time.perf_counter() - started
+    if result.unknown_regions or result.unknown_crime_types:
+        logger.warning(
+            f"매칭되지 않아 건너뛴 셀 {result.skipped_cells}개 "
+            f"(지역 {len(result.unknown_regions)}개, 범죄유형 {len(result.unknown_crime_types)}개)"
+        )
+    return result
+
+
+def ingest_csv(
+        db: Session,
+        path: str,
+        year: Optional[int] = None,
+        encoding: str = "utf-8-sig",
+        batch_size: int = 5000,
+        create_missing: bool = False,
+) -> IngestResult:
+    with open(path, newline="", encoding=encoding) as f:
+        return ingest_rows(db, csv.reader(f), year=year, batch_size=batch_size, create_missing=create_missing)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    parser.add_argument("--year", type=int, help="연도 열이 없는 파일의 통계 연도")
+    parser.add_argument("--encoding", default="utf-8-sig", help="공공데이터포털 원본은 보통 cp949")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--create-missing", action="store_true", help="없는 지역/범죄유형은 새로 만든다")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        result = ingest_csv(
+            db, args.path, year=args.year, encoding=args.encoding,
+            batch_size=args.batch_size, create_missing=args.create_missing,
+        )
+    finally:
+        db.close()
+
+    s = result.summary()
+    print(f"rows={s['rows']} cells={s['cells']} upserted={s['upserted']} skipped={s['skipped_cells']} "
+          f"{s['seconds']}s ({s['rows_per_sec']} rows/s, {s['cells_per_sec']} cells/s)")
+    if s["unknown_regions"]:
+        print(f"알 수 없는 지역: {', '.join(s['unknown_regions'])}")
+    if s["unknown_crime_types"]:
+        print(f"알 수 없는 범죄유형: {', '.join(s['unknown_crime_types'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,96 +1,225 @@
 import logging
+from typing import Callable, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from models import Region, CrimeType, Report
-from models.officialstat import OfficialStat
-from datetime import datetime
-
-def fetch_official_stats(db: Session, province: str, city: str, major: str = None, minor: str = None, year: int = None):
+from sqlalchemy import event, func, select, tuple_
+from models import Region, CrimeType
+from models.officialstat import STAT_MODELS
+from schemas.officialstat import OfficialStatReadDict
+from services.dimension_cache import get_dimensions_async
+from services.stats_cube import stats_cubes
+
+async def fetch_official_stats(db: AsyncSession, province: str, city: str, major: str = None, minor: str = None, year: int = None,
+                               source: str = "official"):
     search_full_name = f"{province} {city}" if city else province
 
-    query = (
-        db.query(OfficialStat)
-        .join(Region, OfficialStat.region_id == Region.id)
-        .outerjoin(CrimeType, OfficialStat.crime_type_id == CrimeType.id)
-        .filter(Region.full_name == search_full_name)
+    cube = stats_cubes[source]
+    if cube.enabled():
+        data = await cube.get(db)
+        return data.region_stats(search_full_name, major, minor, year)
+
+    model = STAT_MODELS[source]
+    stmt = (
+        select(CrimeType.major, CrimeType.minor, model.count, model.last_updated)
+        .select_from(model)
+        .join(Region, model.region_id == Region.id)
+        .outerjoin(CrimeType, model.crime_type_id == CrimeType.id)
+        .where(Region.full_name == search_full_name)
     )
 
     if year is None:
-        year = db.query(func.max(OfficialStat.year)) \
-            .join(Region) \
-            .filter(Region.full_name == search_full_name).scalar()
+        year = await db.scalar(
+            select(func.max(model.year))
+            .join(Region, model.region_id == Region.id)
+            .where(Region.full_name == search_full_name)
+        )
 
-    query = query.filter(OfficialStat.year == year)
+    stmt = stmt.where(model.year == year).order_by(model.id)
 
     if major:
-        query = query.filter(CrimeType.major == major)
+        stmt = stmt.where(CrimeType.major == major)
     if minor:
-        query = query.filter(CrimeType.minor == minor)
+        stmt = stmt.where(CrimeType.minor == minor)
 
-    results = query.all()
+    results = (await db.execute(stmt)).all()
 
     if not results:
         return None
 
+    return _stats_payload(search_full_name, year, results)
+
+def _stats_payload(full_name: str, year: int, rows) -> dict:
+    # rows: (major, minor, count, last_updated) 컬럼 Row
     return {
-        "region": search_full_name,
+        "region": full_name,
         "year": year,
-        "last_updated": results[0].last_updated,
+        "last_updated": max((s.last_updated for s in rows if s.last_updated), default=None),
         "statistics": [
             {
-                "crime_major": s.crime_type.major if s.crime_type else None,
-                "crime_minor": s.crime_type.minor if s.crime_type else None,
+                "crime_major": s.major,
+                "crime_minor": s.minor,
                 "count": s.count
             }
-            for s in results
+            for s in rows
         ]
     }
 
-def fetch_regions(db: Session,province: str=None):
-    query = db.query(Region)
-
-    #province(시/도)가 필터가 있으면 적용한다. (Where province = "")
+async def fetch_official_stats_batch(db: AsyncSession, selectors, source: str = "official") -> list[dict]:
+    """
+    /api/status 조회 여러 건(province, city, major, minor, year)을 SQL 두 번으로 처리한다.
+    1) 연도를 안 준 선택자의 지역별 최신 연도 (GROUP BY region_id)
+    2) 필요한 (region_id, year) 쌍의 통계 전체 (튜플 IN) -> 선택자별로 major/minor 를 메모리에서 거른다
+    선택자 순서대로 {"found", "reason", 그리고 찾았으면 fetch_official_stats 와 같은 필드} 를 돌려준다.
+    reason: region_not_found (지역 이름 불일치) / no_data (해당 연도/범죄유형 통계 없음)
+    """
+    dims = await get_dimensions_async(db)
+    region_ids = [dims.region_id(sel.province, sel.city) for sel in selectors]
+
+    cube = stats_cubes[source]
+    if cube.enabled():
+        data = await cube.get(db)
+        items = []
+        for sel, region_id in zip(selectors, region_ids):
+            if region_id is None:
+                items.append({"found": False, "reason": "region_not_found"})
+                continue
+            stats = data.region_stats(dims.region_by_id[region_id].full_name, sel.major, sel.minor, sel.year)
+            items.append({"found": True, "reason": None, **stats} if stats else {"found": False, "reason": "no_data"})
+        return items
+
+    model = STAT_MODELS[source]
+    latest: dict[int, int] = {}
+    need_latest = {rid for sel, rid in zip(selectors, region_ids) if rid is not None and sel.year is None}
+    if need_latest:
+        latest = dict((await db.execute(
+            select(model.region_id, func.max(model.year))
+            .where(model.region_id.in_(need_latest))
+            .group_by(model.region_id)
+        )).all())
+
+    targets = [
+        (rid, sel.year if sel.year is not None else latest.get(rid)) if rid is not None else None
+        for sel, rid in zip(selectors, region_ids)
+    ]
+    pairs = {t for t in targets if t is not None and t[1] is not None}
+    by_pair: dict[tuple[int, int], list] = {}
+    if pairs:
+        stmt = (
+            select(model.region_id, model.year, CrimeType.major, CrimeType.minor, model.count, model.last_updated)
+            .outerjoin(CrimeType, model.crime_type_id == CrimeType.id)
+            .where(tuple_(model.region_id, model.year).in_(pairs))
+            .order_by(model.id)
+        )
+        for stat in (await db.execute(stmt)).all():
+            by_pair.setdefault((stat.region_id, stat.year), []).append(stat)
+
+    items = []
+    for sel, target in zip(selectors, targets):
+        if target is None:
+            items.append({"found": False, "reason": "region_not_found"})
+            continue
+        rows = [
+            s for s in by_pair.get(target, [])
+            if (not sel.major or s.major == sel.major)
+            and (not sel.minor or s.minor == sel.minor)
+        ]
+        if not rows:
+            items.append({"found": False, "reason": "no_data"})
+            continue
+        full_name = dims.region_by_id[target[0]].full_name
+        items.append({"found": True, "reason": None, **_stats_payload(full_name, target[1], rows)})
+    return items
+
+async def fetch_all_official_stats(db: AsyncSession, region_id: Optional[int] = None,
+                                  crime_type_id: Optional[int] = None, year: Optional[int] = None,
+                                  source: str = "official") -> list[OfficialStatReadDict]:
+    """/api/statusAll: OfficialStatRead 모양 dict 목록 (ORM 객체 없이 JOIN 한 컬럼만 읽는다)"""
+    model = STAT_MODELS[source]
+    stmt = (
+        select(
+            model.id, model.region_id, model.crime_type_id, model.count, model.year,
+            Region.province, Region.city, CrimeType.major, CrimeType.minor,
+        )
+        .join(Region, model.region_id == Region.id)
+        .outerjoin(CrimeType, model.crime_type_id == CrimeType.id)
+    )
+    if region_id:
+        stmt = stmt.where(model.region_id == region_id)
+    if crime_type_id:
+        stmt = stmt.where(model.crime_type_id == crime_type_id)
+    if year:
+        stmt = stmt.where(model.year == year)
+
+    rows = (await db.execute(stmt.order_by(model.year.asc()))).all()
+    # Row 속성 접근은 이름 조회라 느리므로 SELECT 순서대로 위치로 푼다
+    return [
+        {
+            "region_id": stat_region_id,
+            "crime_type_id": stat_crime_type_id,
+            "count": count,
+            "year": stat_year,
+            "id": stat_id,
+            "region": {"id": stat_region_id, "province": province, "city": city},
+            "crime_type": (
+                {"id": stat_crime_type_id, "major": major, "minor": minor} if stat_crime_type_id is not None else None
+            ),
+        }
+        for stat_id, stat_region_id, stat_crime_type_id, count, stat_year, province, city, major, minor in rows
+    ]
+
+async def fetch_regions(db: AsyncSession, province: str=None):
+    dims = await get_dimensions_async(db)
+
+    #province(시/도)가 필터가 있으면 적용한다. 해당 시/도 내에서는 구/군 순으로 정렬
     if province:
-        query = query.filter(Region.province == province)
-        #해당 시/도 내에서는 구/군 순으로 정렬
-        query = query.order_by(Region.city)
-    else:
-        query = query.order_by(Region.full_name)
+        return dims.regions_by_province.get(province, [])
 
-    return query.all()
+    return dims.regions
 
-def fetch_crime_types(db:Session, major:str = None):
+async def fetch_crime_types(db: AsyncSession, major:str = None):
+    dims = await get_dimensions_async(db)
     if major is None:
         #대분류 목록만 중복 없이 가져오기
-        results = db.query(CrimeType.major).distinct().order_by(CrimeType.major).all()
-        return [{"major":r.major} for r in results]
+        return [{"major": m} for m in dims.majors]
     else:
-        return db.query(CrimeType)\
-                .filter(CrimeType.major == major)\
-                .filter(CrimeType.major.isnot(None))\
-                .order_by(CrimeType.minor).all()
+        return dims.crime_types_by_major.get(major, [])
 
 logger = logging.getLogger(__name__)
 
-def update_or_create_stat(db: Session, report: Report) -> int:
-    report_year = report.created_at.year if report.created_at else datetime.now().year
+# 통계 표 변경 구독자. listener(source, deltas) 의 source 는 바뀐 표(STAT_MODELS 키: official / reports / merged),
+# deltas 는 {(region_id, crime_type_id, year): 증감}, None 이면 어떤 셀이 바뀌었는지 모르는 변경(CSV 적재 등)이다.
+_stats_listeners: list[Callable[[str, Optional[dict]], None]] = []
+# 제보 승인/취소로 report_stats 와 merged_stats 에 같은 증감이 쌓인다 (services.report_stats.apply_report_deltas)
+PENDING_DELTAS_KEY = "report_stat_deltas"
+REPORT_DELTA_SOURCES = ("reports", "merged")
 
-    stat = db.query(OfficialStat).filter(
-        OfficialStat.region_id == report.region_id,
-        OfficialStat.crime_type_id == report.crime_type_id,
-        OfficialStat.year == report_year
-    ).first()
 
-    if stat:
-        stat.count += 1
-    else:
-        stat = OfficialStat(
-            region_id=report.region_id,
-            crime_type_id=report.crime_type_id,
-            year=report_year,
-            count=1
-        )
-        db.add(stat)
-        db.flush()
+def on_stats_changed(listener: Callable[[str, Optional[dict]], None]):
+    _stats_listeners.append(listener)
+    return listener
+
+
+def notify_stats_changed(sources: Sequence[str], deltas: Optional[dict] = None) -> None:
+    for source in sources:
+        for listener in list(_stats_listeners):
+            try:
+                listener(source, deltas)
+            except Exception as e:
+                logger.error(f"통계 변경 알림 처리 중 오류: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_after_commit(session: Session) -> None:
+    deltas = session.info.pop(PENDING_DELTAS_KEY, None)
+    if deltas:
+        notify_stats_changed(REPORT_DELTA_SOURCES, dict(deltas))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(PENDING_DELTAS_KEY, None)
+
 
-    return stat.id
\ No newline at end of file
+@on_stats_changed
+def _update_stats_cube(source: str, deltas: Optional[dict]) -> None:
+    stats_cubes[source].on_stats_changed(deltas)
@@ -0,0 +1,149 @@
+"""
+공식 통계 연도별 추이(trend) / 상위 N 순위(ranking).
+
+"2022 -> 2023 폭력범죄 증가폭이 가장 큰 구" 같은 질문을 지역 x 연도마다 /api/status 를 부르는 대신
+official_aggregate.fetch_groups 한 번(GROUP BY 쿼리 1개 또는 큐브 벡터 연산)으로 계산한다.
+결과는 (source, 요청 파라미터, 통계 버전)별로 캐시하고 통계 표가 바뀌면(on_stats_changed) 비운다.
+다른 프로세스의 변경은 통계 버전(STATS_VERSION_TTL 마다 재확인)이 바뀌면서 반영된다.
+"""
+from typing import Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models.officialstat import STAT_MODELS
+from services.official_aggregate import AggregateError, expand_dimensions, fetch_groups
+from services.official_service import on_stats_changed
+from services.stats_version import stats_version
+from utils.cache import LRUCache
+
+RANK_METRICS = ("count", "change", "change_rate")
+
+trend_cache = LRUCache(maxsize=settings.STATS_TREND_CACHE_SIZE, ttl=settings.STATS_TREND_CACHE_TTL)
+
+
+@on_stats_changed
+def _clear_trend_cache(source: str, deltas: Optional[dict]) -> None:
+    trend_cache.clear()
+
+
+async def _cache_key(db: AsyncSession, kind: str, source: str, filters: dict, *params) -> tuple:
+    version = await stats_version.get(db, source)
+    return (kind, source, version.etag, tuple((k, tuple(v or ())) for k, v in sorted(filters.items())), *params)
+
+
+async def latest_year(db: AsyncSession, source: str = "official") -> Optional[int]:
+    return await db.scalar(select(func.max(STAT_MODELS[source].year)))
+
+
+async def stats_trend(
+    db: AsyncSession,
+    group_by: Sequence[str],
+    filters: dict,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    source: str = "official",
+) -> dict:
+    """group_by 묶음마다 연도별 합계 시계열. 값이 없는 연도는 None."""
+    dims = expand_dimensions([d for d in group_by if d != "year"])
+    key = await _cache_key(db, "trend", source, filters, tuple(dims), year_from, year_to)
+    cached = trend_cache.get(key)
+    if cached is not None:
+        return cached
+
+    cap = settings.STATS_AGGREGATE_MAX_CELLS
+    groups, _ = await fetch_groups(db, dims + ["year"], filters, None, year_from, year_to, cap + 1, source)
+    if len(groups) > cap:
+        raise AggregateError(f"추이 결과가 {cap}칸을 넘습니다. 필터를 추가하거나 group_by 차원을 줄여주세요.")
+
+    years = sorted({k[-1] for k, _, _ in groups})
+    year_slot = {y: i for i, y in enumerate(years)}
+    series: dict[tuple, list] = {}
+    for k, group_sum, _ in groups:
+        series.setdefault(k[:-1], [None] * len(years))[year_slot[k[-1]]] = group_sum
+    if len(series) * len(years) > cap:
+        raise AggregateError(f"추이 결과가 {len(series)}x{len(years)} 로 {cap}칸을 넘습니다. 필터를 추가해주세요.")
+
+    result = {
+        "group_by": dims,
+        "years": years,
+        "series": [{"keys": dict(zip(dims, k)), "values": values} for k, values in series.items()],
+    }
+    trend_cache.set(key, result)
+    return result
+
+
+async def stats_ranking(
+    db: AsyncSession,
+    by: Sequence[str],
+    filters: dict,
+    metric: str = "change",
+    year: Optional[int] = None,
+    compare_to: Optional[int] = None,
+    top: int = 10,
+    descending: bool = True,
+    source: str = "official",
+) -> dict:
+    """
+    by 묶음의 상위 N 순위.
+    count: year 합계, change: year - compare_to 증감, change_rate: 증감률 (compare_to 가 0 이면 순위에서 제외)
+    """
+    if metric not in RANK_METRICS:
+        raise AggregateError(f"지원하지 않는 metric 입니다: {metric} (가능: {', '.join(RANK_METRICS)})")
+    if not by or "year" in by:
+        raise AggregateError("by 에는 연도를 제외한 차원(province/city/major/minor)이 1개 이상 필요합니다.")
+
+    dims = expand_dimensions(by)
+    if year is None:
+        year = await latest_year(db, source)
+        if year is None:
+            return {"by": dims, "metric": metric, "year": None, "compare_to": None, "items": []}
+    if compare_to is None:
+        compare_to = year - 1
+    if metric != "count" and compare_to >= year:
+        raise AggregateError(f"compare_to({compare_to})는 year({year})보다 이전 연도여야 합니다.")
+
+    key = await _cache_key(db, "ranking", source, filters, tuple(dims), metric, year, compare_to, top, descending)
+    cached = trend_cache.get(key)
+    if cached is not None:
+        return cached
+
+    years = {year} if metric == "count" else {year, compare_to}
+    groups, _ = await fetch_groups(db, dims + ["year"], filters, None, min(years), max(years), source=source)
+
+    current: dict[tuple, int] = {}
+    previous: dict[tuple, int] = {}
+    for k, group_sum, _ in groups:
+        if k[-1] == year:
+            current[k[:-1]] = group_sum
+        elif k[-1] == compare_to:
+            previous[k[:-1]] = group_sum
+
+    items = []
+    # 동률일 때도 워커마다 같은 순서가 나오도록 키 순으로 먼저 정렬한다 (sort 는 안정 정렬)
+    keys = current.keys() | (previous.keys() if metric != "count" else set())
+    for k in sorted(keys, key=lambda k: tuple((v is not None, v if v is not None else "") for v in k)):
+        count, before = current.get(k, 0), previous.get(k, 0)
+        item = {"keys": dict(zip(dims, k)), "count": count}
+        if metric != "count":
+            item["previous"] = before
+            item["change"] = count - before
+            item["change_rate"] = round((count - before) / before, 6) if before else None
+        if item.get(metric) is not None:
+            items.append(item)
+
+    items.sort(key=lambda item: item[metric], reverse=descending)
+    items = items[:top]
+    for rank, item in enumerate(items, start=1):
+        item["rank"] = rank
+
+    result = {
+        "by": dims,
+        "metric": metric,
+        "year": year,
+        "compare_to": compare_to if metric != "count" else None,
+        "items": items,
+    }
+    trend_cache.set(key, result)
+    return result
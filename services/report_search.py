@@ -0,0 +1,393 @@
+"""
+제보 게시판 키워드 검색.
+
+- fulltext: MySQL FULLTEXT(title, content) WITH PARSER ngram + MATCH ... AGAINST (BOOLEAN MODE)
+- index   : 프로세스 내 bigram 역색인 (SQLite/테스트 배포용). 후보를 색인에서 고르고,
+            skip 으로 건너뛸 몫과 페이지에 들어갈 행만 DB 에서 LIKE 로 다시 확인한다.
+- like    : 기존 LIKE '%kw%' (색인으로 찾을 수 없는 1글자 검색어 등)
+
+SEARCH_BACKEND=auto 면 MySQL 은 fulltext, 그 외 DB 는 like 를 쓴다.
+index 는 워커 프로세스마다 따로 만들어지고 같은 프로세스의 add/remove 만 반영하므로,
+워커가 여럿이면 다른 워커에서 생긴 제보가 검색되지 않는다. 단일 프로세스 배포에서만 SEARCH_BACKEND=index 로 켠다.
+"""
+import asyncio
+import heapq
+import logging
+import math
+import re
+import threading
+import time
+import unicodedata
+from array import array
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Row, and_, or_, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models.report import Report
+from utils.pagination import decode_cursor
+
+logger = logging.getLogger(__name__)
+
+NGRAM = 2           # MySQL ngram_token_size 기본값과 동일
+TITLE_WEIGHT = 1.0  # 제목에 있는 검색어는 점수를 두 배로
+# 최신순 정렬에서 후보가 전체의 이 비율보다 많으면 (created_at, id) 인덱스를 따라가는 LIKE 가
+# 금방 한 페이지를 채우므로 DB 경로를 쓴다
+COMMON_TERM_RATIO = 0.02
+
+_WS = re.compile(r"\s+")
+# BOOLEAN MODE 연산자로 해석되는 문자는 검색어에서 뺀다
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+_EPOCH = datetime(1970, 1, 1)
+
+
+def normalize(text: str) -> str:
+    return _WS.sub(" ", unicodedata.normalize("NFKC", text or "")).strip().lower()
+
+
+def keyword_terms(keyword: str) -> list[str]:
+    """검색어를 공백 단위로 나눈다. 모든 단어가 들어간 제보만 찾는다 (AND)."""
+    cleaned = _BOOLEAN_OPERATORS.sub(" ", normalize(keyword))
+    return list(dict.fromkeys(t for t in cleaned.split(" ") if t))
+
+
+def ngrams(text: str) -> set[str]:
+    grams = set()
+    for word in text.split(" "):
+        if len(word) < NGRAM:
+            continue
+        grams.update(word[i:i + NGRAM] for i in range(len(word) - NGRAM + 1))
+    return grams
+
+
+def backend_for(dialect_name: str) -> str:
+    backend = settings.SEARCH_BACKEND
+    if backend == "auto":
+        return "fulltext" if dialect_name == "mysql" else "like"
+    return backend
+
+
+def like_condition(terms: list[str]):
+    return and_(*(or_(Report.title.contains(t), Report.content.contains(t)) for t in terms))
+
+
+def fulltext_match(terms: list[str]):
+    # +"단어" : 단어의 ngram 이 연속으로 모두 있어야 함 (ngram parser 의 구문 검색)
+    against = " ".join(f'+"{t}"' for t in terms)
+    return match(Report.title, Report.content, against=against).in_boolean_mode()
+
+
+def _timestamp(value: Optional[datetime]) -> float:
+    if value is None:
+        return 0.0
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return (value - _EPOCH).total_seconds()
+
+
+class ReportSearchIndex:
+    """
+    title/content 의 글자 bigram -> report id 역색인.
+    posting 과 필터/정렬용 값(region_id, crime_type_id, created_at)은 모두 id 로 인덱싱한 배열이라
+    100만 건에서도 파이썬 객체를 문서 수만큼 만들지 않는다.
+    삭제/수정된 문서의 예전 posting 은 바로 지우지 않으므로 오탐이 생길 수 있는데,
+    검색 결과는 페이지 단위로 DB 에서 다시 확인하므로 응답에는 섞이지 않는다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._content: dict[str, array] = {}
+        self._title: dict[str, array] = {}
+        self._grams = array("I")        # id -> 색인된 bigram 수 (0 이면 없는 문서)
+        self._region = array("i")
+        self._crime_type = array("i")
+        self._created = array("d")
+        self._documents = 0
+        self._postings = 0
+        self._dead_postings = 0
+        self.ready = False
+        self.build_seconds: Optional[float] = None
+        self.searches = 0
+
+    def __len__(self) -> int:
+        return self._documents
+
+    def _ensure_capacity(self, report_id: int) -> None:
+        missing = report_id + 1 - len(self._grams)
+        if missing > 0:
+            grow = max(missing, len(self._grams) // 2, 1024)
+            self._grams.extend([0] * grow)
+            self._region.extend([0] * grow)
+            self._crime_type.extend([0] * grow)
+            self._created.extend([0.0] * grow)
+
+    def _alive(self, report_id: int) -> bool:
+        return report_id < len(self._grams) and self._grams[report_id] > 0
+
+    @staticmethod
+    def _append(postings: dict[str, array], grams: set[str], report_id: int) -> None:
+        for g in grams:
+            posting = postings.get(g)
+            if posting is None:
+                posting = postings[g] = array("I")
+            posting.append(report_id)
+
+    def add(self, report_id: int, title: str, content: str, region_id: int, crime_type_id: int,
+            created_at: Optional[datetime]) -> None:
+        title_grams = ngrams(normalize(title))
+        grams = title_grams | ngrams(normalize(content))
+        with self._lock:
+            if self._alive(report_id):
+                self._remove_locked(report_id)
+            self._ensure_capacity(report_id)
+            self._append(self._content, grams, report_id)
+            self._append(self._title, title_grams, report_id)
+            self._postings += len(grams)
+            self._documents += 1
+            # 본문이 비어도 살아 있는 문서로 표시되도록 최소 1
+            self._grams[report_id] = max(len(grams), 1)
+            self._region[report_id] = region_id
+            self._crime_type[report_id] = crime_type_id
+            self._created[report_id] = _timestamp(created_at)
+
+    def remove(self, report_id: int) -> None:
+        with self._lock:
+            if self._alive(report_id):
+                self._remove_locked(report_id)
+            self._maybe_compact()
+
+    def _remove_locked(self, report_id: int) -> None:
+        self._dead_postings += self._grams[report_id]
+        self._grams[report_id] = 0
+        self._documents -= 1
+
+    def set_crime_type(self, report_id: int, crime_type_id: int) -> None:
+        with self._lock:
+            if self._alive(report_id):
+                self._crime_type[report_id] = crime_type_id
+
+    def _maybe_compact(self) -> None:
+        # 지워진 문서의 posting 이 전체의 1/4 을 넘으면 배열을 다시 만든다
+        if not self._dead_postings or self._dead_postings * 4 < self._postings:
+            return
+        alive = self._grams
+        for postings in (self._content, self._title):
+            for g, posting in list(postings.items()):
+                kept = array("I", (i for i in posting if alive[i]))
+                if kept:
+                    postings[g] = kept
+                else:
+                    del postings[g]
+        self._postings = sum(len(p) for p in self._content.values())
+        self._dead_postings = 0
+
+    def estimate(self, terms: list[str]) -> int:
+        """후보 수 상한 (가장 드문 bigram 의 posting 길이)."""
+        grams = set()
+        for t in terms:
+            grams |= ngrams(t)
+        with self._lock:
+            return min((len(self._content.get(g, ())) for g in grams), default=0)
+
+    def candidates(self, terms: list[str], region_id: Optional[int] = None,
+                   crime_type_id: Optional[int] = None) -> set[int]:
+        """모든 검색어의 bigram 을 가진 제보 id 집합 (가장 드문 bigram 부터 교집합)."""
+        grams = set()
+        for t in terms:
+            grams |= ngrams(t)
+        with self._lock:
+            self.searches += 1
+            postings = [self._content.get(g) for g in grams]
+            if not postings or any(p is None for p in postings):
+                return set()
+            postings.sort(key=len)
+
+            alive, regions, crime_types = self._grams, self._region, self._crime_type
+            ids = {
+                i for i in postings[0]
+                if alive[i]
+                and (region_id is None or regions[i] == region_id)
+                and (crime_type_id is None or crime_types[i] == crime_type_id)
+            }
+            for posting in postings[1:]:
+                if not ids:
+                    break
+                ids.intersection_update(posting)
+            return ids
+
+    def scores(self, terms: list[str], ids: set[int]) -> dict[int, float]:
+        """관련도 점수: 검색어 bigram 의 idf 합, 제목에 있으면 TITLE_WEIGHT 만큼 가산."""
+        grams = set()
+        for t in terms:
+            grams |= ngrams(t)
+        with self._lock:
+            n = max(self._documents, 1)
+            scores = dict.fromkeys(ids, 0.0)
+            for g in grams:
+                idf = math.log(1 + n / len(self._content[g]))
+                for i in ids:
+                    scores[i] += idf
+                for i in ids.intersection(self._title.get(g, ())):
+                    scores[i] += idf * TITLE_WEIGHT
+            return scores
+
+    def order(self, terms: list[str], ids: set[int], sort_by: str, cursor: Optional[str], count: int) -> list[int]:
+        """
+        후보를 정렬해 앞에서부터 count 개 id 를 돌려준다. 아직 DB 로 확인하지 않은 후보라
+        skip 은 여기서 적용하지 않는다 (오탐이 offset 에 섞이지 않도록 search_reports 가 확인한 뒤 센다).
+        """
+        if sort_by == "relevance":
+            scores = self.scores(terms, ids)
+            top = heapq.nlargest(count, scores.items(), key=lambda kv: (kv[1], kv[0]))
+            return [i for i, _ in top]
+
+        created = self._created
+        descending = sort_by == "latest"
+        keys = [(created[i], i) for i in ids]
+        if cursor:
+            c_at, c_id = decode_cursor(cursor, descending)
+            bound = (_timestamp(c_at), c_id)
+            keys = [k for k in keys if (k < bound if descending else k > bound)]
+        pick = heapq.nlargest if descending else heapq.nsmallest
+        return [i for _, i in pick(count, keys)]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "documents": self._documents,
+                "grams": len(self._content),
+                "searches": self.searches,
+                "build_seconds": round(self.build_seconds, 3) if self.build_seconds is not None else None,
+            }
+
+
+report_search_index = ReportSearchIndex()
+_build_lock = asyncio.Lock()
+
+
+def _add_rows(rows) -> None:
+    for r in rows:
+        report_search_index.add(r.id, r.title, r.content, r.region_id, r.crime_type_id, r.created_at)
+
+
+async def ensure_index(db: AsyncSession) -> ReportSearchIndex:
+    """
+    첫 검색 때 reports 전체를 스트리밍으로 읽어 색인을 만든다.
+    bigram 분해는 CPU 작업이라 파티션마다 스레드에서 돌려 그동안 다른 요청이 이벤트 루프를 쓸 수 있게 한다.
+    """
+    if report_search_index.ready:
+        return report_search_index
+    async with _build_lock:
+        if not report_search_index.ready:
+            started = time.perf_counter()
+            result = await db.stream(
+                select(Report.id, Report.title, Report.content, Report.region_id,
+                       Report.crime_type_id, Report.created_at)
+                .execution_options(yield_per=5000)
+            )
+            async for partition in result.partitions():
+                await asyncio.to_thread(_add_rows, partition)
+            report_search_index.build_seconds = time.perf_counter() - started
+            report_search_index.ready = True
+            logger.info(f"검색 색인 생성: {len(report_search_index)}건, {report_search_index.build_seconds:.2f}s")
+    return report_search_index
+
+
+# --- 제보 변경 시 색인 반영 (색인을 아직 만들지 않았으면 건너뛴다) ---
+def index_report(report: Report) -> None:
+    if report_search_index.ready:
+        report_search_index.add(report.id, report.title, report.content, report.region_id,
+                                report.crime_type_id, report.created_at)
+
+
+def unindex_report(report_id: int) -> None:
+    if report_search_index.ready:
+        report_search_index.remove(report_id)
+
+
+async def search_reports(
+        db: AsyncSession,
+        query,
+        keyword: str,
+        region_id: Optional[int],
+        crime_type_id: Optional[int],
+        sort_by: str,
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+        apply_order,
+) -> list[Row]:
+    """
+    query: 필터가 적용된 컬럼 select (Report 와 id / created_at 컬럼 포함, 예: report_service.report_read_query() / report_summary_query()).
+    apply_order(query) : relevance 가 아닐 때 (created_at, id) 정렬 + cursor/offset 적용 (DB 경로용).
+    """
+    async def db_page(q):
+        return (await db.execute(apply_order(q).limit(limit))).all()
+
+    terms = keyword_terms(keyword)
+    if not terms:
+        return await db_page(query)
+
+    backend = backend_for(db.get_bind().dialect.name)
+    short = any(len(t) < NGRAM for t in terms)
+
+    if backend == "fulltext" and not short:
+        score = fulltext_match(terms)
+        query = query.where(score)
+        if sort_by != "relevance":
+            return await db_page(query)
+        query = query.order_by(score.desc(), Report.id.desc()).offset(skip)
+        return (await db.execute(query.limit(limit))).all()
+
+    if backend != "index" or short:
+        return await db_page(query.where(like_condition(terms)))
+
+    index = await ensure_index(db)
+    if sort_by != "relevance" and index.estimate(terms) > len(index) * COMMON_TERM_RATIO:
+        return await db_page(query.where(like_condition(terms)))
+
+    if cursor:
+        skip = 0
+    ids = index.candidates(terms, region_id, crime_type_id)
+    count = (skip + limit) * 4
+    ordered = index.order(terms, ids, sort_by, cursor, count)
+
+    def next_chunk(pos: int, size: int) -> list[int]:
+        # 오탐이 많아 정렬해 둔 후보가 모자라면 더 길게 다시 정렬한다
+        nonlocal ordered, count
+        while pos + size > len(ordered) and len(ordered) == count:
+            count *= 4
+            ordered = index.order(terms, ids, sort_by, cursor, count)
+        return ordered[pos:pos + size]
+
+    # bigram 이 모두 있어도 붙어 있지 않으면 오탐이고, 수정/삭제된 제보의 예전 posting 도 남아 있다.
+    # 그래서 skip 은 DB 에서 LIKE 로 확인된 후보만 센다. 건너뛸 몫은 id 만 확인하고,
+    # 남은 몫보다 크게 묶지 않아 확인된 행이 페이지 안으로 넘치지 않게 한다
+    verify_ids = select(Report.id).where(like_condition(terms))
+    if region_id:
+        verify_ids = verify_ids.where(Report.region_id == region_id)
+    if crime_type_id:
+        verify_ids = verify_ids.where(Report.crime_type_id == crime_type_id)
+    skipped = pos = 0
+    while skipped < skip:
+        chunk = next_chunk(pos, skip - skipped)
+        if not chunk:
+            return []
+        pos += len(chunk)
+        skipped += len((await db.execute(verify_ids.where(Report.id.in_(chunk)))).all())
+
+    # 페이지 몫은 응답 컬럼까지 함께 확인한다
+    results: list[Row] = []
+    verify = query.where(like_condition(terms))
+    while len(results) < limit:
+        chunk = next_chunk(pos, (limit - len(results)) * 2)
+        if not chunk:
+            break
+        pos += len(chunk)
+        found = {r.id: r for r in (await db.execute(verify.where(Report.id.in_(chunk)))).all()}
+        results.extend(found[i] for i in chunk if i in found)
+    return results[:limit]
@@ -1,11 +1,17 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, and_, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import CrimeType, Region
 from models.report import Report, ReportStatus
 from datetime import datetime, timezone
-from typing import Optional
-from services import official_service
+from collections import Counter
+from typing import Optional, Sequence
+from schemas.report import ReportReadDict, ReportResponseDict, ReportSummaryDict
+from services import report_stats
+from services.dimension_cache import dimension_cache, get_dimensions_async
+from utils.pagination import apply_keyset
 
-def update_report_status(db: Session, report_id: int, new_status: ReportStatus) -> Optional[Report]:
-    db_report = db.query(Report).filter(Report.id == report_id).first()
+async def update_report_status(db: AsyncSession, report_id: int, new_status: ReportStatus) -> Optional[Report]:
+    db_report = await db.get(Report, report_id)
     if not db_report:
         return None
 
@@ -13,24 +19,373 @@ def update_report_status(db: Session, report_id: int, new_status: ReportStatus)
     if db_report.status != ReportStatus.pending:
         raise ValueError(f"이미 '{db_report.status.value}' 상태인 제보는 변경할 수 없습니다.")
 
-    db_report.status = new_status
+    values = {Report.status: new_status, Report.version: Report.version + 1}
     if new_status == ReportStatus.approved:
-        db_report.approved_at = datetime.now(timezone.utc)
-        # 승인 시 범죄 통계 +1
-        official_service.update_or_create_stat(db, db_report)
+        values[Report.approved_at] = datetime.now(timezone.utc)
     elif new_status == ReportStatus.rejected:
-        db_report.rejected_at = datetime.now(timezone.utc)
+        values[Report.rejected_at] = datetime.now(timezone.utc)
+
     try:
-        db.commit()
-        db.refresh(db_report)
+        # 다른 관리자가 먼저 처리했다면 0행이 바뀐다 (같은 제보를 두 번 집계하지 않도록 조건부 UPDATE)
+        result = await db.execute(
+            update(Report)
+            .where(Report.id == report_id, Report.status == ReportStatus.pending)
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            raise ValueError("이미 다른 관리자가 처리한 제보입니다.")
+
+        if new_status == ReportStatus.approved:
+            # 승인 시 제보 통계(report_stats / merged_stats) +1
+            await report_stats.apply_report_deltas(db, {report_stats.stat_key(db_report): 1})
+        await db.commit()
+        await db.refresh(db_report)
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise
     return db_report
 
 
-def get_all_reports(db: Session, skip: int = 0, limit: int = 100, status: Optional[ReportStatus] = None) -> list[Report]:
-    query = db.query(Report)
+async def revert_report_status(db: AsyncSession, report_id: int) -> Optional[Report]:
+    """승인/반려를 취소하고 pending 으로 되돌린다. 승인이었으면 제보 통계 -1."""
+    db_report = await db.get(Report, report_id)
+    if not db_report:
+        return None
+
+    old_status = db_report.status
+    if old_status == ReportStatus.pending:
+        raise ValueError("검수 대기 중인 제보는 되돌릴 수 없습니다.")
+
+    try:
+        # 읽은 상태 그대로일 때만 바꾼다 (동시에 되돌리거나 다시 처리하면 0행 -> 통계를 두 번 빼지 않는다)
+        result = await db.execute(
+            update(Report)
+            .where(Report.id == report_id, Report.status == old_status)
+            .values({
+                Report.status: ReportStatus.pending, Report.approved_at: None, Report.rejected_at: None,
+                Report.version: Report.version + 1,
+            })
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            raise ValueError("이미 다른 관리자가 처리한 제보입니다.")
+
+        if old_status == ReportStatus.approved:
+            await report_stats.apply_report_deltas(db, {report_stats.stat_key(db_report): -1})
+        await db.commit()
+        await db.refresh(db_report)
+    except Exception:
+        await db.rollback()
+        raise
+    return db_report
+
+
+async def bulk_update_report_status(db: AsyncSession, ids: list[int], new_status: ReportStatus) -> dict:
+    """
+    여러 제보를 한 트랜잭션에서 승인/반려한다.
+    대상 행을 FOR UPDATE 로 잠근 뒤 한 번에 UPDATE 하고, 승인분은 (지역, 범죄유형, 연도) 별로 묶어
+    report_stats / merged_stats 를 그룹당 한 번씩 upsert 한다.
+    """
+    ids = list(dict.fromkeys(ids))  # 중복 제거 (순서 유지)
+    now = datetime.now(timezone.utc)
+
+    try:
+        rows = (await db.execute(
+            select(Report.id, Report.status, Report.region_id, Report.crime_type_id, Report.created_at)
+            .where(Report.id.in_(ids))
+            .with_for_update()
+        )).all()
+        by_id = {row.id: row for row in rows}
+        pending = [row for row in rows if row.status == ReportStatus.pending]
+
+        deltas = Counter()
+        if pending:
+            values = {Report.status: new_status, Report.version: Report.version + 1}
+            if new_status == ReportStatus.approved:
+                values[Report.approved_at] = now
+                deltas.update(report_stats.stat_key(row) for row in pending)
+            else:
+                values[Report.rejected_at] = now
+
+            result = await db.execute(
+                update(Report)
+                .where(Report.id.in_([row.id for row in pending]), Report.status == ReportStatus.pending)
+                .values(values)
+                .execution_options(synchronize_session=False)
+            )
+            # 잠금을 잡은 상태라 어긋날 일은 없지만, 잠금을 지원하지 않는 DB 에서는 전체를 되돌린다
+            if result.rowcount != len(pending):
+                raise ValueError("처리 중 다른 관리자가 일부 제보를 변경했습니다. 다시 시도해 주세요.")
+
+            await report_stats.apply_report_deltas(db, deltas)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    pending_ids = {row.id for row in pending}
+    results = []
+    for report_id in ids:
+        row = by_id.get(report_id)
+        if row is None:
+            results.append({"id": report_id, "outcome": "not_found"})
+        elif report_id in pending_ids:
+            results.append({"id": report_id, "outcome": new_status.value, "status": new_status})
+        else:
+            results.append({"id": report_id, "outcome": "already_processed", "status": row.status})
+
+    return {
+        "requested": len(ids),
+        "updated": len(pending),
+        "stat_groups": len(deltas),
+        "results": results,
+    }
+
+
+# --- 제보 수정/삭제: 조건부 UPDATE / DELETE 한 문장 ---
+class VersionMismatch(Exception):
+    """If-Match 로 받은 버전이 현재 행 버전과 다르다 (412)"""
+
+
+# PUT/PATCH 응답(ReportRead)과 통계 키에 필요한 컬럼. RETURNING 과 재조회 SELECT 가 같은 순서로 쓴다
+_REPORT_WRITE_COLUMNS = (
+    Report.id, Report.title, Report.content, Report.status, Report.user_id, Report.created_at,
+    Report.region_id, Report.crime_type_id, Report.version,
+)
+_STAT_KEY_FIELDS = ("region_id", "crime_type_id")
+
+
+async def _update_returning(db: AsyncSession, report_id: int, conditions: list, values: dict) -> Optional[Row]:
+    """조건에 맞으면 values 로 바꾸고 version + 1. 바뀐 행의 _REPORT_WRITE_COLUMNS 를, 맞는 행이 없으면 None."""
+    stmt = (
+        update(Report)
+        .where(*conditions)
+        .values(**values, version=Report.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if db.get_bind().dialect.update_returning:
+        return (await db.execute(stmt.returning(*_REPORT_WRITE_COLUMNS))).first()
+    # MySQL 은 UPDATE ... RETURNING 이 없으므로 같은 트랜잭션에서 컬럼만 한 번 더 읽는다 (ORM 객체는 만들지 않음)
+    if (await db.execute(stmt)).rowcount == 0:
+        return None
+    return (await db.execute(select(*_REPORT_WRITE_COLUMNS).where(Report.id == report_id))).first()
+
+
+async def _locked_state(db: AsyncSession, report_id: int, versions: Optional[Sequence[int]]) -> Optional[Row]:
+    """느린 경로: 행을 잠그고 (status, 통계 키, version) 을 읽는다. 없으면 None, If-Match 가 어긋나면 VersionMismatch."""
+    current = (await db.execute(
+        select(Report.status, Report.region_id, Report.crime_type_id, Report.created_at, Report.version)
+        .where(Report.id == report_id)
+        .with_for_update()
+    )).first()
+    if current is not None and versions is not None and current.version not in versions:
+        raise VersionMismatch(f"제보가 그 사이 수정되었습니다 (현재 버전 {current.version}). 다시 조회한 뒤 수정해 주세요.")
+    return current
+
+
+async def update_report_fields(
+        db: AsyncSession, report_id: int, values: dict, versions: Optional[Sequence[int]] = None,
+) -> Optional[Row]:
+    """
+    PUT/PATCH. 먼저 읽지 않고 조건부 UPDATE 한 문장으로 바꾼 뒤 바뀐 행(_REPORT_WRITE_COLUMNS)을 돌려준다. 없으면 None.
+    - versions(If-Match) 를 주면 version 이 그중 하나일 때만 바꾼다. 어긋나면 VersionMismatch
+    - 승인된 제보의 지역/범죄유형이 바뀌면 제보 통계를 이전 키에서 새 키로 옮겨야 한다.
+      이 경우만 첫 UPDATE 조건에서 빠지고, 행을 잠가 이전 키를 읽은 뒤 처리한다
+    0행이면 (없음 / 버전 불일치 / 승인된 제보의 키 변경) 중 무엇인지 느린 경로에서 가린다.
+    """
+    if not values:
+        # 바꿀 것이 없으면 버전을 올리지 않고 현재 행만 돌려준다
+        current = (await db.execute(select(*_REPORT_WRITE_COLUMNS).where(Report.id == report_id))).first()
+        if current is not None and versions is not None and current.version not in versions:
+            raise VersionMismatch(f"제보가 그 사이 수정되었습니다 (현재 버전 {current.version}). 다시 조회한 뒤 수정해 주세요.")
+        return current
+
+    conditions = [Report.id == report_id]
+    if versions is not None:
+        conditions.append(Report.version.in_(versions))
+    key_unchanged = [getattr(Report, field) == values[field] for field in _STAT_KEY_FIELDS if field in values]
+    if key_unchanged:
+        conditions.append(or_(Report.status != ReportStatus.approved, and_(*key_unchanged)))
+
+    try:
+        row = await _update_returning(db, report_id, conditions, values)
+        if row is None:
+            current = await _locked_state(db, report_id, versions)
+            if current is None:
+                await db.rollback()
+                return None
+            row = await _update_returning(
+                db, report_id, [Report.id == report_id, Report.version == current.version], values
+            )
+            if row is None:
+                # 잠금을 지원하지 않는 DB 에서 그 사이 다른 요청이 바꾼 경우
+                raise ValueError("다른 요청이 먼저 제보를 수정했습니다. 다시 시도해 주세요.")
+            if current.status == ReportStatus.approved:
+                await report_stats.apply_report_deltas(
+                    db, report_stats.move_deltas(report_stats.stat_key(current), report_stats.stat_key(row))
+                )
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return row
+
+
+async def delete_report(db: AsyncSession, report_id: int, versions: Optional[Sequence[int]] = None) -> bool:
+    """
+    DELETE 한 문장으로 지운다. 지웠으면 True, 없으면 False. versions 는 update_report_fields 와 같다.
+    승인된 제보는 제보 통계 -1 에 키가 필요하므로 첫 DELETE 조건에서 빠지고, 행을 잠가 읽은 뒤 지운다.
+    """
+    conditions = [Report.id == report_id, Report.status != ReportStatus.approved]
+    if versions is not None:
+        conditions.append(Report.version.in_(versions))
+
+    try:
+        result = await db.execute(delete(Report).where(*conditions).execution_options(synchronize_session=False))
+        if result.rowcount == 0:
+            current = await _locked_state(db, report_id, versions)
+            if current is None:
+                await db.rollback()
+                return False
+            result = await db.execute(
+                delete(Report)
+                .where(Report.id == report_id, Report.version == current.version)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
+                raise ValueError("다른 요청이 먼저 제보를 수정했습니다. 다시 시도해 주세요.")
+            if current.status == ReportStatus.approved:
+                await report_stats.apply_report_deltas(db, {report_stats.stat_key(current): -1})
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return True
+
+
+async def report_write_dict(db: AsyncSession, row: Row) -> ReportReadDict:
+    """update_report_fields 가 돌려준 행 -> ReportRead 모양 (지역/범죄유형 이름은 차원 캐시에서)"""
+    report_id, title, content, status, user_id, created_at, region_id, crime_type_id, _ = row
+    regions, crime_types = await _dimension_dicts(db, {region_id}, {crime_type_id})
+    return {
+        "id": report_id,
+        "title": title,
+        "content": content,
+        "status": status,
+        "region": regions[region_id],
+        "crime_type": crime_types[crime_type_id],
+        "user_id": user_id,
+        "created_at": created_at,
+    }
+
+
+# --- 목록 API 빠른 경로 (utils.fast_json): ORM 객체 대신 평평한 컬럼 Row -> 응답 dict ---
+# Row 속성 접근(row.title)은 행마다 이름을 찾아 느리므로, 아래 변환 함수는 SELECT 컬럼 순서대로 위치로 푼다
+def report_read_query() -> Select:
+    """ReportRead 모양에 필요한 컬럼만 (region / crime_type 은 JOIN 한 컬럼으로). 순서는 report_read_dict 와 맞춘다"""
+    return (
+        select(
+            Report.id, Report.title, Report.content, Report.status, Report.user_id, Report.created_at,
+            Report.region_id, Region.province, Region.city,
+            Report.crime_type_id, CrimeType.major, CrimeType.minor,
+        )
+        .join(Region, Report.region_id == Region.id)
+        .join(CrimeType, Report.crime_type_id == CrimeType.id)
+    )
+
+
+def report_read_dict(row: Row) -> ReportReadDict:
+    (report_id, title, content, status, user_id, created_at,
+     region_id, province, city, crime_type_id, major, minor) = row
+    return {
+        "id": report_id,
+        "title": title,
+        "content": content,
+        "status": status,
+        "region": {"id": region_id, "province": province, "city": city},
+        "crime_type": {"id": crime_type_id, "major": major, "minor": minor},
+        "user_id": user_id,
+        "created_at": created_at,
+    }
+
+
+def report_summary_query(snippet_length: int) -> Select:
+    """
+    게시판 목록(view=summary)용. content 는 DB 에서 앞 snippet_length + 1 글자만 잘라 온다 (한 글자 더: 잘렸는지 판단).
+    regions / crime_types 는 JOIN 하지 않고 id 만 읽어 차원 캐시에서 이름을 채운다 (report_summary_dicts).
+    """
+    return select(
+        Report.id, Report.title, func.substr(Report.content, 1, snippet_length + 1).label("snippet"),
+        Report.status, Report.user_id, Report.created_at, Report.region_id, Report.crime_type_id,
+    )
+
+
+def make_snippet(prefix: Optional[str], length: int) -> str:
+    """줄바꿈/연속 공백을 한 칸으로 접고, length 글자를 넘으면 잘라서 … 을 붙인다"""
+    text = " ".join((prefix or "").split())
+    if len(prefix or "") > length:
+        return text[:length].rstrip() + "…"
+    return text
+
+
+async def _dimension_dicts(db: AsyncSession, region_ids: set, crime_type_ids: set) -> tuple[dict, dict]:
+    """id -> 응답용 region / crime_type dict. JOIN 대신 차원 캐시에서 채운다."""
+    dims = await get_dimensions_async(db)
+    if not region_ids <= dims.region_by_id.keys() or not crime_type_ids <= dims.crime_type_by_id.keys():
+        # 적재 CLI 가 새 지역/유형을 만든 직후면 캐시가 아직 모른다
+        dimension_cache.invalidate()
+        dims = await get_dimensions_async(db)
+
+    regions, crime_types = {}, {}
+    for region_id in region_ids:
+        region = dims.region_by_id[region_id]
+        regions[region_id] = {"id": region.id, "province": region.province, "city": region.city}
+    for crime_type_id in crime_type_ids:
+        crime_type = dims.crime_type_by_id[crime_type_id]
+        crime_types[crime_type_id] = {"id": crime_type.id, "major": crime_type.major, "minor": crime_type.minor}
+    return regions, crime_types
+
+
+async def report_summary_dicts(db: AsyncSession, rows: list[Row], snippet_length: int) -> list[ReportSummaryDict]:
+    # 같은 지역/유형은 같은 dict 를 재사용한다 (직렬화 결과는 같다)
+    regions, crime_types = await _dimension_dicts(db, {r[6] for r in rows}, {r[7] for r in rows})
+
+    return [
+        {
+            "id": report_id,
+            "title": title,
+            "snippet": make_snippet(prefix, snippet_length),
+            "status": status,
+            "region": regions[region_id],
+            "crime_type": crime_types[crime_type_id],
+            "user_id": user_id,
+            "created_at": created_at,
+        }
+        for report_id, title, prefix, status, user_id, created_at, region_id, crime_type_id in rows
+    ]
+
+
+# ReportResponse 필드 순서 그대로
+_REPORT_RESPONSE_COLUMNS = (
+    Report.title, Report.content, Report.region_id, Report.crime_type_id, Report.id, Report.user_id,
+    Report.status, Report.created_at, Report.approved_at, Report.rejected_at,
+)
+_REPORT_RESPONSE_KEYS = tuple(c.key for c in _REPORT_RESPONSE_COLUMNS)
+
+
+def report_response_dict(row: Row) -> ReportResponseDict:
+    return dict(zip(_REPORT_RESPONSE_KEYS, row))
+
+
+async def get_all_reports(db: AsyncSession, skip: int = 0, limit: int = 100, status: Optional[ReportStatus] = None,
+                          cursor: Optional[str] = None) -> list[Row]:
+    """ReportResponse 컬럼만 담은 Row 목록 (report_response_dict 로 응답 dict 변환)"""
+    stmt = select(*_REPORT_RESPONSE_COLUMNS)
     if status:
-        query = query.filter(Report.status == status)
-    return query.order_by(Report.created_at.desc()).offset(skip).limit(limit).all()
\ No newline at end of file
+        stmt = stmt.where(Report.status == status)
+    # cursor 가 있으면 (created_at, id) 키셋, 없으면 기존 offset 방식
+    stmt = apply_keyset(stmt, Report.created_at, Report.id, cursor)
+    if not cursor:
+        stmt = stmt.offset(skip)
+    return (await db.execute(stmt.limit(limit))).all()
@@ -0,0 +1,145 @@
+"""
+제보 기반 건수(report_stats)와 공식 + 제보 합계(merged_stats) 유지.
+
+official_stats 는 경찰청 CSV 적재로만 바뀐다(덮어쓰기). 승인된 제보는 report_stats 에 따로 세고,
+merged_stats 에는 두 표의 합을 미리 더해 둬서 source=merged 조회가 요청마다 더하지 않고 한 표만 읽게 한다.
+- 승인 +1, 승인 취소(revert)/삭제 -1, 승인된 제보의 지역/범죄유형 수정은 이전 키 -1 과 새 키 +1
+  : apply_report_deltas 가 report_stats 와 merged_stats 를 같은 트랜잭션에서 count = count + delta 로 upsert 한다
+- CSV 적재: 적재한 연도의 merged_stats 를 rebuild_merged 로 다시 만든다 (official 값이 덮어써졌으므로)
+
+승인분을 official_stats 에 직접 더하던 기존 DB 는 이렇게 옮긴다.
+    python -m services.official_ingest <CSV> ...   # official_stats 를 원본 값으로 다시 덮어쓴다
+    python -m services.report_stats --rebuild      # 승인 제보로 report_stats 를 다시 세고 merged_stats 재구성
+"""
+import argparse
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, extract, func, insert, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal
+from models.officialstat import MergedStat, OfficialStat, ReportStat
+from models.report import Report, ReportStatus
+from services.official_service import PENDING_DELTAS_KEY, notify_stats_changed
+from utils.sql import upsert_statement
+
+
+KEY_COLUMNS = ["region_id", "crime_type_id", "year"]
+
+
+def stat_key(report) -> tuple[int, int, int]:
+    """제보(ORM 객체 또는 같은 컬럼을 가진 Row)의 통계 키. 연도는 제보 작성 연도다."""
+    report_year = report.created_at.year if report.created_at else datetime.now().year
+    return report.region_id, report.crime_type_id, report_year
+
+
+async def apply_report_deltas(db: AsyncSession, deltas: dict[tuple[int, int, int], int]) -> None:
+    """
+    (region_id, crime_type_id, year) -> 증감을 report_stats 와 merged_stats 에 upsert 한다 (호출자가 commit).
+    count = count + delta 를 DB 가 원자적으로 계산하므로 동시에 승인/취소해도 증감이 사라지지 않는다.
+    """
+    params = [
+        {"region_id": region_id, "crime_type_id": crime_type_id, "year": year, "count": delta}
+        for (region_id, crime_type_id, year), delta in deltas.items()
+        if delta
+    ]
+    if not params:
+        return
+
+    dialect = db.get_bind().dialect.name
+    for model in (ReportStat, MergedStat):
+        stmt = upsert_statement(
+            dialect,
+            model.__table__,
+            key_columns=KEY_COLUMNS,
+            update=lambda inserted, table: {
+                "count": table.c.count + inserted.count,
+                "last_updated": func.now(),
+            },
+        )
+        await db.execute(stmt, params)
+    # commit 된 뒤에만 구독자(통계 큐브, ETag 등)에 알린다 (official_service._notify_after_commit)
+    db.info.setdefault(PENDING_DELTAS_KEY, Counter()).update(
+        {(p["region_id"], p["crime_type_id"], p["year"]): p["count"] for p in params}
+    )
+
+
+def move_deltas(old_key: tuple, new_key: tuple) -> dict:
+    """승인된 제보의 키가 바뀔 때: 이전 키 -1, 새 키 +1 (같으면 빈 dict)"""
+    if old_key == new_key:
+        return {}
+    return {old_key: -1, new_key: 1}
+
+
+def _year_filter(model, years: Optional[Iterable[int]]) -> list:
+    return [model.year.in_(sorted(set(years)))] if years is not None else []
+
+
+def rebuild_merged(db: Session, years: Optional[Iterable[int]] = None) -> None:
+    """
+    merged_stats 를 official_stats UNION ALL report_stats 를 키별로 더한 값으로 다시 만든다 (호출자가 commit).
+    years 를 주면 그 연도만 지우고 다시 넣는다 (CSV 적재 후).
+    """
+    def columns(model):
+        return select(
+            model.region_id, model.crime_type_id, model.year, model.count, model.last_updated,
+        ).where(*_year_filter(model, years))
+
+    both = union_all(columns(OfficialStat), columns(ReportStat)).subquery()
+    merged = (
+        select(both.c.region_id, both.c.crime_type_id, both.c.year, func.sum(both.c.count), func.max(both.c.last_updated))
+        .group_by(both.c.region_id, both.c.crime_type_id, both.c.year)
+    )
+    db.execute(delete(MergedStat).where(*_year_filter(MergedStat, years)))
+    db.execute(insert(MergedStat).from_select(KEY_COLUMNS + ["count", "last_updated"], merged))
+
+
+def recount_report_stats(db: Session) -> None:
+    """report_stats 를 승인된 제보에서 다시 센다 (호출자가 commit). 증분이 어긋났다고 의심될 때나 이전할 때 쓴다."""
+    report_year = extract("year", Report.created_at)
+    counts = (
+        select(Report.region_id, Report.crime_type_id, report_year, func.count(), func.max(Report.approved_at))
+        .where(Report.status == ReportStatus.approved)
+        .group_by(Report.region_id, Report.crime_type_id, report_year)
+    )
+    db.execute(delete(ReportStat))
+    db.execute(insert(ReportStat).from_select(KEY_COLUMNS + ["count", "last_updated"], counts))
+
+
+def rebuild_all(db: Session) -> None:
+    """report_stats 재집계 + merged_stats 전체 재구성을 한 트랜잭션으로."""
+    recount_report_stats(db)
+    rebuild_merged(db)
+    db.commit()
+    # 무엇이 바뀌었는지 모르므로 두 표 모두 "알 수 없는 변경" 으로 알린다
+    notify_stats_changed(("reports", "merged"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rebuild", action="store_true", help="report_stats 재집계 + merged_stats 재구성")
+    args = parser.parse_args()
+    if not args.rebuild:
+        parser.print_help()
+        return
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        rebuild_all(db)
+        rows = {
+            model.__tablename__: db.execute(select(func.count(), func.coalesce(func.sum(model.count), 0))).one()
+            for model in (OfficialStat, ReportStat, MergedStat)
+        }
+    finally:
+        db.close()
+    for table, (count, total) in rows.items():
+        print(f"{table}: {count}행, 합계 {total}")
+
+
+if __name__ == "__main__":
+    main()
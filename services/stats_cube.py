@@ -0,0 +1,329 @@
+"""
+통계 표 인메모리 큐브 (STATS_BACKEND=cube 일 때만 사용, numpy 필요).
+
+official_stats / report_stats / merged_stats 를 표마다(source) [region, crime_type, year] 밀집 numpy 배열로 읽어두고
+/api/status, /api/status/aggregate 의 합계/롤업/전년 대비 조회를 DB 없이 벡터 연산으로 답한다.
+큐브는 그 source 를 처음 조회할 때 적재한다.
+승인/취소로 바뀐 건수는 official_service.on_stats_changed 알림으로 배열에 바로 더하고(증분),
+다른 프로세스(CSV 적재 CLI 등)에서 바뀐 것은 STATS_CUBE_CHECK_INTERVAL 마다
+(행 수, 합계) 지문을 DB 와 비교해 다르면 다시 적재한다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models.officialstat import STAT_MODELS
+from services.dimension_cache import DimensionSnapshot, dimension_cache, get_dimensions_async
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성: 없으면 SQL 경로만 쓴다
+    np = None
+
+logger = logging.getLogger(__name__)
+
+REGION_DIMS = ("province", "city")
+CRIME_DIMS = ("major", "minor")
+
+
+def _sort_key(key: tuple):
+    # MySQL ORDER BY 와 같이 NULL 을 앞에
+    return tuple((v is not None, v if v is not None else 0) for v in key)
+
+
+class CubeData:
+    """한 번 적재한 큐브. counts/present/updated 는 [region, crime_type, year] 배열."""
+
+    def __init__(self, dims: DimensionSnapshot, rows: Sequence):
+        self.regions = dims.regions
+        self.region_index = {r.id: i for i, r in enumerate(self.regions)}
+        self.region_index_by_full_name = {r.full_name: i for i, r in enumerate(self.regions)}
+        # crime_type_id 가 NULL 인 통계용 칸을 마지막에 하나 둔다
+        self.crime_types = list(dims.crime_types) + [None]
+        self.crime_index = {c.id if c else None: i for i, c in enumerate(self.crime_types)}
+
+        # 올해까지 칸을 잡아둬야 올해 제보 승인이 재적재 없이 증분으로 반영된다
+        years = [row.year for row in rows] + [datetime.now().year]
+        self.year0 = min(years)
+        n_years = max(years) - self.year0 + 1
+        shape = (len(self.regions), len(self.crime_types), n_years)
+
+        # [..., 0] = count, [..., 1] = 행 존재(0/1). 한 배열로 두어 집계를 한 번의 축소로 끝낸다.
+        # float64 는 2^53 까지 정수를 정확히 담고, 행렬곱이 BLAS 를 탄다
+        self.cells = np.zeros(shape + (2,), dtype=np.float64)
+        self.counts = self.cells[..., 0]
+        self.present = self.cells[..., 1]
+        self.updated = np.full(shape, np.datetime64("NaT"), dtype="datetime64[us]")
+        if rows:
+            r = np.fromiter((self.region_index[row.region_id] for row in rows), dtype=np.intp, count=len(rows))
+            c = np.fromiter((self.crime_index[row.crime_type_id] for row in rows), dtype=np.intp, count=len(rows))
+            y = np.fromiter((row.year - self.year0 for row in rows), dtype=np.intp, count=len(rows))
+            self.counts[r, c, y] = [row.count for row in rows]
+            self.present[r, c, y] = 1
+            self.updated[r, c, y] = [row.last_updated or np.datetime64("NaT") for row in rows]
+        self.rows = len(rows)
+        self.total = int(self.counts.sum())
+
+        # 차원 값 -> 축별 라벨 (GROUP BY / 필터용)
+        self.axis_labels = {
+            "province": [r.province for r in self.regions],
+            "city": [r.city for r in self.regions],
+            "major": [c.major if c else None for c in self.crime_types],
+            "minor": [c.minor if c else None for c in self.crime_types],
+        }
+        self._label_cache: dict[tuple, list[tuple]] = {}
+
+    @property
+    def years(self) -> range:
+        return range(self.year0, self.year0 + self.counts.shape[2])
+
+    def year_slot(self, year: int) -> Optional[int]:
+        slot = year - self.year0
+        return slot if 0 <= slot < self.counts.shape[2] else None
+
+    def apply(self, deltas: dict) -> bool:
+        """(region_id, crime_type_id, year) -> 증감을 배열에 더한다. 큐브 범위 밖이면 False (재적재 필요)."""
+        try:
+            idx = [
+                (self.region_index[rid], self.crime_index[cid], self.year_slot(year))
+                for rid, cid, year in deltas
+            ]
+        except KeyError:
+            return False
+        if any(y is None for _, _, y in idx):
+            return False
+
+        r, c, y = (np.array(axis, dtype=np.intp) for axis in zip(*idx))
+        self.rows += int((self.present[r, c, y] == 0).sum())
+        np.add.at(self.counts, (r, c, y), list(deltas.values()))
+        self.present[r, c, y] = 1
+        self.updated[r, c, y] = np.datetime64(datetime.now(), "us")
+        self.total += sum(deltas.values())
+        return True
+
+    # ---- 조회 ----
+
+    def _axis_mask(self, dims: Sequence[str], filters: dict) -> "np.ndarray":
+        size = len(self.axis_labels[dims[0]])
+        mask = np.ones(size, dtype=bool)
+        for dim in dims:
+            values = filters.get(dim)
+            if values:
+                allowed = set(values)
+                mask &= np.fromiter((v in allowed for v in self.axis_labels[dim]), dtype=bool, count=size)
+        return mask
+
+    def year_mask(self, year=None, year_from=None, year_to=None) -> "np.ndarray":
+        years = np.arange(self.year0, self.year0 + self.counts.shape[2])
+        mask = np.ones(len(years), dtype=bool)
+        if year is not None:
+            mask &= years == year
+        if year_from is not None:
+            mask &= years >= year_from
+        if year_to is not None:
+            mask &= years <= year_to
+        return mask
+
+    def _labels(self, axis: str, dims: Sequence[str]) -> list[tuple]:
+        """축(region / crime) 칸마다 dims 값 튜플. 차원 조합별로 한 번만 만든다."""
+        key = (axis, tuple(dims))
+        labels = self._label_cache.get(key)
+        if labels is None:
+            size = len(self.regions) if axis == "region" else len(self.crime_types)
+            labels = [tuple(self.axis_labels[d][i] for d in dims) for i in range(size)]
+            self._label_cache[key] = labels
+        return labels
+
+    def _grouping(self, labels: list[tuple], mask: "np.ndarray"):
+        """선택된 칸 위치, 그 칸들을 라벨별로 묶는 one-hot 행렬 [그룹, 칸], 그룹 라벨 목록."""
+        selected = np.flatnonzero(mask)
+        keys: dict[tuple, int] = {}
+        codes = [keys.setdefault(labels[i], len(keys)) for i in selected]
+        onehot = np.zeros((max(len(keys), 1), len(selected)))
+        onehot[codes, np.arange(len(selected))] = 1.0
+        return selected, onehot, list(keys)
+
+    def group(self, dims: Sequence[str], filters: dict, year=None, year_from=None, year_to=None) -> list[tuple]:
+        """
+        dims 로 묶은 (키 튜플, sum, 행 수) 목록. SQL 의 GROUP BY ... ORDER BY dims 와 같은 결과.
+        필터로 칸을 먼저 잘라낸 뒤 축마다 one-hot 행렬을 곱해(BLAS 행렬곱) 줄인다.
+        """
+        r_dims = [d for d in dims if d in REGION_DIMS]
+        c_dims = [d for d in dims if d in CRIME_DIMS]
+
+        r_sel, r_onehot, r_keys = self._grouping(self._labels("region", r_dims), self._axis_mask(REGION_DIMS, filters))
+        c_sel, c_onehot, c_keys = self._grouping(self._labels("crime", c_dims), self._axis_mask(CRIME_DIMS, filters))
+        y_sel, y_onehot, y_keys = self._grouping(
+            [(y,) if "year" in dims else () for y in self.years],
+            self.year_mask(year, year_from, year_to),
+        )
+        cells = self.cells[np.ix_(r_sel, c_sel, y_sel)]
+
+        # [R,C,Y,2] -> [A,C,Y,2] -> [A,B,Y,2] -> [A,B,D,2]
+        reduced = np.tensordot(r_onehot, cells, axes=(1, 0))
+        reduced = np.moveaxis(np.tensordot(c_onehot, reduced, axes=(1, 1)), 0, 1)
+        reduced = np.moveaxis(np.tensordot(y_onehot, reduced, axes=(1, 2)), 0, 2)
+        sums, rows = reduced[..., 0], reduced[..., 1]
+
+        out = []
+        for a, b, d in zip(*np.nonzero(rows)):
+            labels = dict(zip(r_dims, r_keys[a]))
+            labels.update(zip(c_dims, c_keys[b]))
+            if "year" in dims:
+                labels["year"] = int(y_keys[d][0])
+            out.append((tuple(labels[dim] for dim in dims), int(sums[a, b, d]), int(rows[a, b, d])))
+        out.sort(key=lambda g: _sort_key(g[0]))
+        return out
+
+    def region_stats(self, full_name: str, major: str = None, minor: str = None, year: int = None) -> Optional[dict]:
+        """official_service.fetch_official_stats 와 같은 모양의 응답."""
+        r = self.region_index_by_full_name.get(full_name)
+        if r is None:
+            return None
+
+        present = self.present[r].astype(bool)
+        if year is None:
+            years_with_data = np.flatnonzero(present.any(axis=0))
+            if not len(years_with_data):
+                return None
+            y = int(years_with_data[-1])
+            year = self.year0 + y
+        else:
+            y = self.year_slot(year)
+            if y is None:
+                return None
+
+        mask = present[:, y] & self._axis_mask(CRIME_DIMS, {"major": [major] if major else None,
+                                                             "minor": [minor] if minor else None})
+        cells = np.flatnonzero(mask)
+        if not len(cells):
+            return None
+
+        updated = self.updated[r, cells, y]
+        last_updated = updated[~np.isnat(updated)]
+        return {
+            "region": full_name,
+            "year": year,
+            "last_updated": last_updated.max().astype(datetime) if len(last_updated) else None,
+            "statistics": [
+                {
+                    "crime_major": self.crime_types[c].major if self.crime_types[c] else None,
+                    "crime_minor": self.crime_types[c].minor if self.crime_types[c] else None,
+                    "count": int(self.counts[r, c, y]),
+                }
+                for c in cells
+            ],
+        }
+
+
+class StatsCube:
+    """model 표의 CubeData 를 들고 있다가 변경 알림/지문 검사로 증분 갱신하거나 다시 적재한다."""
+
+    def __init__(self, model):
+        self.model = model
+        self._data: Optional[CubeData] = None
+        self._stale = True
+        # 변경 알림/무효화 횟수. 적재 도중 바뀌었는지 가리는 세대 번호로 쓴다
+        self._generation = 0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._load_lock: Optional[asyncio.Lock] = None
+        self.loads = 0
+        self.incremental_updates = 0
+        self.load_seconds = 0.0
+
+    @staticmethod
+    def enabled() -> bool:
+        return settings.STATS_BACKEND == "cube" and np is not None
+
+    def on_stats_changed(self, deltas: Optional[dict]) -> None:
+        """official_service 변경 알림. deltas 가 None 이면 무엇이 바뀌었는지 모르므로 다음 조회 때 재적재."""
+        with self._lock:
+            self._generation += 1
+            data = self._data
+            if data is None or self._stale:
+                return
+            if deltas is None or not data.apply(deltas):
+                self._stale = True
+            else:
+                self.incremental_updates += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._stale = True
+
+    async def get(self, db: AsyncSession) -> CubeData:
+        data = self._data
+        if data is not None and not self._stale:
+            if time.monotonic() - self._checked_at < settings.STATS_CUBE_CHECK_INTERVAL:
+                return data
+            if await self._matches_db(db, data):
+                return data
+
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            # 기다리는 동안 다른 요청이 이미 적재했을 수 있음
+            if self._data is not None and not self._stale and self._data is not data:
+                return self._data
+            return await self._load(db)
+
+    async def _matches_db(self, db: AsyncSession, data: CubeData) -> bool:
+        rows, total = (await db.execute(
+            select(func.count(), func.coalesce(func.sum(self.model.count), 0))
+        )).one()
+        self._checked_at = time.monotonic()
+        return (int(rows), int(total)) == (data.rows, data.total)
+
+    async def _load(self, db: AsyncSession) -> CubeData:
+        started = time.perf_counter()
+        # SELECT 전에 세대를 기록한다. 적재 도중 들어온 증분은 SELECT 에 들어갔는지 알 수 없고
+        # 예전 _data 에만 반영되므로, 그런 증분이 있었으면 교체 후에도 stale 로 두어 다음 조회가 다시 적재한다
+        generation = self._generation
+        model = self.model
+        rows = (await db.execute(select(
+            model.region_id, model.crime_type_id, model.year, model.count, model.last_updated,
+        ))).all()
+
+        dims = await get_dimensions_async(db)
+        if any(r.region_id not in dims.region_by_id
+               or (r.crime_type_id is not None and r.crime_type_id not in dims.crime_type_by_id) for r in rows):
+            # 적재 CLI 가 새 지역/유형을 만든 직후면 캐시가 아직 모른다
+            dimension_cache.invalidate()
+            dims = await get_dimensions_async(db)
+
+        data = CubeData(dims, rows)
+        with self._lock:
+            self._data = data
+            self._stale = generation != self._generation
+            self._checked_at = time.monotonic()
+        self.loads += 1
+        self.load_seconds = round(time.perf_counter() - started, 4)
+        logger.info(f"stats cube 적재({self.model.__tablename__}): {data.rows}행, shape={data.counts.shape}, {self.load_seconds}s")
+        return data
+
+    def stats(self) -> dict:
+        data = self._data
+        return {
+            "enabled": self.enabled(),
+            "loaded": data is not None,
+            "stale": self._stale,
+            "loads": self.loads,
+            "incremental_updates": self.incremental_updates,
+            "load_seconds": self.load_seconds,
+            "rows": data.rows if data else 0,
+            "shape": list(data.counts.shape) if data else None,
+            "bytes": int(data.cells.nbytes + data.updated.nbytes) if data else 0,
+        }
+
+
+stats_cubes = {source: StatsCube(model) for source, model in STAT_MODELS.items()}
+stats_cube = stats_cubes["official"]
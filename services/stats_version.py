@@ -0,0 +1,54 @@
+"""
+통계 표 데이터 버전 (HTTP ETag / Last-Modified 용).
+
+source(official / reports / merged) 표마다 (행 수, 합계, max(last_updated)) 지문을 STATS_VERSION_TTL 초 동안 메모리에 두고,
+이 프로세스에서 통계가 바뀌면(on_stats_changed) 바로 버린다.
+버전이 캐시돼 있는 동안 조건부 요청은 DB 를 건드리지 않고 304 로 끝난다.
+304 판단은 ETag 로만 한다. max(last_updated) 는 삭제 등에 움직이지 않아 Last-Modified 는 참고용으로만 보낸다.
+"""
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from models.officialstat import STAT_MODELS
+from services.official_service import on_stats_changed
+from utils.http_cache import make_etag
+
+
+@dataclass(frozen=True)
+class DataVersion:
+    etag: str
+    last_modified: Optional[datetime]
+
+
+class StatsVersion:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        # source -> (버전, 읽은 시각)
+        self._values: dict[str, tuple[DataVersion, float]] = {}
+
+    def invalidate(self, source: str, deltas: Optional[dict] = None) -> None:
+        self._values.pop(source, None)
+
+    async def get(self, db: AsyncSession, source: str = "official") -> DataVersion:
+        cached = self._values.get(source)
+        if cached is not None and time.monotonic() - cached[1] < self.ttl_seconds:
+            return cached[0]
+
+        model = STAT_MODELS[source]
+        rows, total, last_updated = (await db.execute(
+            select(func.count(), func.coalesce(func.sum(model.count), 0), func.max(model.last_updated))
+        )).one()
+        # 같은 초에 두 번 승인돼도 합계가 달라지므로 ETag 가 바뀐다
+        value = DataVersion(make_etag("stats", source, rows, total, last_updated), last_updated)
+        self._values[source] = (value, time.monotonic())
+        return value
+
+
+stats_version = StatsVersion(ttl_seconds=settings.STATS_VERSION_TTL)
+on_stats_changed(stats_version.invalidate)
@@ -0,0 +1,36 @@
+"""
+목록 API 빠른 응답 경로.
+
+response_model + from_attributes 경로는 행마다 ORM 객체와 관계 객체를 만들고, Pydantic 모델로 검증한 뒤
+dict 로 다시 풀어 표준 json 모듈로 인코딩한다. 무거운 목록 API 는 대신
+- 필요한 컬럼만 평평하게 SELECT 한 Row 를 응답 모양 dict(TypedDict) 로 바로 옮기고
+- orjson 으로 한 번에 bytes 로 만든다 (없으면 import 시점에 만들어 둔 TypeAdapter.dump_json)
+엔드포인트의 response_model 은 OpenAPI 문서용으로 그대로 두고, Response 를 직접 돌려줘 검증/직렬화를 건너뛴다.
+"""
+from typing import Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 pydantic-core 직렬화기를 쓴다
+    orjson = None
+
+
+def dumps(rows: list, adapter: TypeAdapter) -> bytes:
+    """rows 는 adapter 타입(list[TypedDict]) 모양이어야 한다. 출력 바이트는 두 경로가 같다."""
+    if orjson is not None:
+        return orjson.dumps(rows)
+    return adapter.dump_json(rows)
+
+
+def json_response(rows: list, adapter: TypeAdapter, response: Optional[Response] = None) -> Response:
+    """
+    JSON 응답을 만든다. response 는 엔드포인트가 주입받은 Response 로, 거기 단 헤더(ETag, X-Next-Cursor 등)를
+    옮겨 단다 (Response 를 직접 돌려주면 FastAPI 가 주입 Response 의 헤더를 합치지 않는다).
+    """
+    out = Response(dumps(rows, adapter), media_type="application/json")
+    if response is not None:
+        out.raw_headers.extend(h for h in response.raw_headers if h[0] != b"content-length")
+    return out
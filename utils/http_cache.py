@@ -0,0 +1,80 @@
+"""
+HTTP 조건부 요청(ETag / Last-Modified / 304, If-Match) 도우미.
+
+ETag 는 응답 본문이 아니라 데이터 버전(차원 캐시 해시, 통계 지문, 제보 행 버전)으로 만든다.
+ETag 는 URL 마다 따로 저장되므로 쿼리 파라미터가 달라도 같은 버전 값을 써도 된다.
+버전이 같으면 쿼리/직렬화 없이 304 를 돌려줄 수 있다.
+Last-Modified 는 참고용으로만 보낸다. 통계의 max(last_updated) 는 행 삭제나 최댓값을 바꾸지 않는 갱신에 움직이지 않으므로
+If-Modified-Since 만으로 304 를 주면 ETag 가 바뀐 뒤에도 예전 본문이 남는다.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Optional, Sequence
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def version_etag(version: int) -> str:
+    """행 버전 -> 강한 ETag. 클라이언트가 If-Match 로 돌려보내면 조건부 UPDATE 의 version 조건이 된다."""
+    return f'"{version}"'
+
+
+def parse_if_match(header: Optional[str]) -> Optional[Sequence[int]]:
+    """
+    If-Match 헤더 -> 허용할 행 버전 목록 (version_etag 모양만 알아본다).
+    헤더가 없거나 '*' 이면 None (버전 조건 없음). 알아볼 수 있는 태그가 없으면 빈 목록이라 어떤 버전과도 맞지 않는다.
+    If-Match 는 강한 비교이므로 W/ 태그는 맞지 않는 것으로 본다 (RFC 9110 13.1.1).
+    """
+    if header is None or header.strip() == "*":
+        return None
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.append(int(tag[1:-1]))
+    return versions
+
+
+def _as_utc(value: datetime) -> datetime:
+    # DB TIMESTAMP 는 tz 없는 값으로 온다. UTC 로 간주하고 초 단위로 자른다 (HTTP 날짜 정밀도)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match 는 약한 비교: W/ 접두사를 무시한다
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    max_age: int = 0,
+) -> Optional[Response]:
+    """
+    캐시 헤더를 response 에 달고, 요청의 If-None-Match 가 현재 ETag 와 맞으면
+    바로 돌려줄 304 응답을, 아니면 None 을 돌려준다 (None 이면 평소대로 본문을 만든다).
+    검증은 ETag 로만 한다. If-Modified-Since 만 보낸 요청은 항상 본문을 받는다 (모듈 설명 참고).
+    """
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}" if max_age else "no-cache"}
+    if last_modified is not None:
+        last_modified = _as_utc(last_modified)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return None
@@ -0,0 +1,60 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Sequence
+
+from sqlalchemy import tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at: datetime, row_id: int, descending: bool) -> str:
+    payload = {"c": created_at.isoformat(), "i": row_id, "d": descending}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, descending: bool) -> tuple[datetime, int]:
+    """불투명 커서 -> (created_at, id). 형식이 틀리거나 정렬 방향이 다르면 InvalidCursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        created_at, row_id = datetime.fromisoformat(payload["c"]), int(payload["i"])
+        cursor_descending = bool(payload["d"])
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursor("잘못된 cursor 입니다.")
+    if cursor_descending != descending:
+        raise InvalidCursor("cursor 의 정렬 방향이 요청(sort_by)과 다릅니다.")
+    return created_at, row_id
+
+
+def apply_keyset(stmt, created_col, id_col, cursor: Optional[str], descending: bool = True):
+    """
+    (created_at, id) 키셋 페이지네이션.
+    created_at 이 같은 행도 id 로 순서가 고정되므로 페이지 사이에 누락/중복이 없고,
+    OFFSET 처럼 앞 페이지 행을 읽고 버리지 않아 (created_at, id) 인덱스 범위 스캔으로 끝난다.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor, descending)
+        key = tuple_(created_col, id_col)
+        stmt = stmt.where(key < (created_at, row_id) if descending else key > (created_at, row_id))
+    if descending:
+        return stmt.order_by(created_col.desc(), id_col.desc())
+    return stmt.order_by(created_col.asc(), id_col.asc())
+
+
+def next_cursor(rows: Sequence, limit: int, descending: bool = True) -> Optional[str]:
+    """
+    페이지가 가득 찼으면 마지막 행 기준 다음 커서, 아니면 None (마지막 페이지).
+    reports.created_at 은 NULL 이 될 수 있는데 NULL 은 (created_at, id) 비교로 이어갈 수 없으므로,
+    마지막 행이 NULL 이면 커서를 내지 않는다 (클라이언트는 skip 으로 이어서 읽는다).
+    """
+    if len(rows) < limit or not rows:
+        return None
+    last = rows[-1]
+    if last.created_at is None:
+        return None
+    return encode_cursor(last.created_at, last.id, descending)
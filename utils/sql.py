@@ -0,0 +1,34 @@
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+
+def upsert_statement(
+    dialect_name: str,
+    table: Table,
+    key_columns: Sequence[str],
+    update: Optional[Callable] = None,
+):
+    """
+    키 충돌 시 갱신(또는 무시)하는 INSERT 문을 DB 종류에 맞게 만든다.
+
+    update(inserted, table) -> {컬럼명: 값 표현식} 을 주면 충돌 시 해당 컬럼을 갱신하고,
+    None 이면 이미 있는 행은 그대로 둔다.
+    - MySQL : INSERT ... ON DUPLICATE KEY UPDATE / INSERT IGNORE
+    - SQLite: INSERT ... ON CONFLICT (key) DO UPDATE / DO NOTHING
+    """
+    if dialect_name == "mysql":
+        stmt = mysql_insert(table)
+        if update is None:
+            return stmt.prefix_with("IGNORE")
+        return stmt.on_duplicate_key_update(update(stmt.inserted, table))
+
+    if dialect_name == "sqlite":
+        stmt = sqlite_insert(table)
+        if update is None:
+            return stmt.on_conflict_do_nothing(index_elements=list(key_columns))
+        return stmt.on_conflict_do_update(index_elements=list(key_columns), set_=update(stmt.excluded, table))
+
+    raise NotImplementedError(f"upsert 를 지원하지 않는 DB 입니다: {dialect_name}")